@@ -40,11 +40,15 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third-party
     "parler",
     "import_export",
     "ckeditor",
     "ckeditor_uploader",
+    "rest_framework",
+    "django_filters",
+    "django_countries",
     # custom Local apps
     "landing",
 ]
@@ -52,6 +56,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "landing.middleware.PrerenderedPageMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -146,6 +151,9 @@ PARLER_LANGUAGES = {
     },
 }
 
+# Adresse publique du site, pour les liens absolus (canonical, hreflang)
+SITE_URL = config("SITE_URL", default="https://customspact.org")
+
 # Chemin pour les fichiers de traduction
 LOCALE_PATHS = [
     BASE_DIR / "locale",
@@ -180,6 +188,8 @@ UNFOLD = {
     "SITE_SYMBOL": "event",
     "SHOW_HISTORY": True,
     "SHOW_VIEW_ON_SITE": True,
+    # Registration statistics on the admin index, read from the rollup table
+    "DASHBOARD_CALLBACK": "landing.stats.dashboard_callback",
     "COLORS": {
         "primary": {
             "50": "239 246 255",
@@ -266,17 +276,13 @@ UNFOLD = {
                         "title": "All Registrations",
                         "icon": "how_to_reg",
                         "link": "/admin/event/registration/",
-                        "badge": lambda request: Registration.objects.filter(
-                            status="pending"
-                        ).count(),
+                        "badge": "landing.counters.pending_registrations_badge",
                     },
                     {
                         "title": "Contact Messages",
                         "icon": "mail",
                         "link": "/admin/event/contactmessage/",
-                        "badge": lambda request: ContactMessage.objects.filter(
-                            is_read=False
-                        ).count(),
+                        "badge": "landing.counters.unread_messages_badge",
                     },
                 ],
             },
@@ -374,6 +380,8 @@ else:
 
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", default="noreply@customspact.org")
 ADMIN_EMAIL = config("ADMIN_EMAIL", default="admin@customspact.org")
+# Newsletter campaigns: messages per second allowed by the provider plan
+NEWSLETTER_SEND_RATE = config("NEWSLETTER_SEND_RATE", default=10, cast=float)
 
 # ========== IMPORT/EXPORT CONFIGURATION ==========
 IMPORT_EXPORT_USE_TRANSACTIONS = True
@@ -438,8 +446,21 @@ if not LOGS_DIR.exists():
 # ========== CACHE CONFIGURATION (Optional) ==========
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        # Falls back to process memory while Redis is down (landing/cache_backend.py)
+        "BACKEND": "landing.cache_backend.ResilientRedisCache",
         "LOCATION": config("REDIS_URL", default="redis://127.0.0.1:6379/1"),
+        # Namespace of our keys, the only ones dropped after a long outage
+        "KEY_PREFIX": config("CACHE_KEY_PREFIX", default="custompact"),
+        "OPTIONS": {
+            # Seconds: a dead Redis must not hold requests up
+            "socket_connect_timeout": config(
+                "REDIS_CONNECT_TIMEOUT", default=0.25, cast=float
+            ),
+            "socket_timeout": config("REDIS_TIMEOUT", default=0.25, cast=float),
+        },
+        "FAILURE_THRESHOLD": 3,
+        "RETRY_AFTER": 5,
+        "FALLBACK_MAX_ENTRIES": 1000,
     }
 }
 
@@ -470,6 +491,21 @@ MESSAGE_TAGS = {
 # ========== PAGINATION ==========
 PAGINATION_PER_PAGE = 20
 
+# ========== API (read-only content, /api/v1/) ==========
+# Public JSON only: no session or CSRF, the responses are cached per language
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
+    "DEFAULT_PARSER_CLASSES": [],
+    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
+    "UNAUTHENTICATED_USER": None,
+    "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
+    "ALLOWED_VERSIONS": ["v1"],
+    "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
+    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.CursorPagination",
+    "PAGE_SIZE": 50,
+}
+
 # ========== FILE UPLOAD SETTINGS ==========
 FILE_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
@@ -483,36 +519,34 @@ ALLOWED_DOCUMENT_EXTENSIONS = ["pdf", "doc", "docx", "xls", "xlsx"]
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
 STATIC_URL = "/static/"
-STATICFILES_DIRS = [
-    BASE_DIR / "assets",
-    BASE_DIR / "css",
-    BASE_DIR / "js",
-]
-STATICFILES_DIRS = [os.path.join(BASE_DIR, "static")]
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+# Sources du site; "python manage.py build_static" en extrait dans STATIC_BUILD_DIR
+# les seuls fichiers utilisés, les bundles minifiés et les bibliothèques tierces
+STATIC_SOURCE_DIR = BASE_DIR / "static"
+STATIC_BUILD_DIR = BASE_DIR / "build" / "static"
+STATIC_VENDOR_DIR = BASE_DIR / "build" / "downloads"
+STATIC_BUNDLES_ENABLED = env.bool("STATIC_BUNDLES_ENABLED", default=not DEBUG)
+STATICFILES_DIRS = [STATIC_BUILD_DIR if STATIC_BUNDLES_ENABLED else STATIC_SOURCE_DIR]
 MEDIA_URL = "media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
-# Whitenoise configuration for production
+# Fichiers non publics (exports d'inscriptions...), servis uniquement via l'admin
+PRIVATE_MEDIA_ROOT = os.path.join(BASE_DIR, "private")
+
+# Whitenoise configuration for production: hashed names served with immutable
+# cache headers, gzip and brotli copies written by collectstatic
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
+# Pages pré-rendues (python manage.py prerender_landing)
+PRERENDER_ROOT = BASE_DIR / "prerendered"
+PRERENDER_MAX_AGE = 60  # seconds
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
-if os.environ.get("ENV") == "PRODUCTION":
-
-    # Static files settings
-    PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-
-    STATIC_ROOT = os.path.join(PROJECT_ROOT, "staticfiles")
-
-    # Extra places for collectstatic to find static files.
-    STATICFILES_DIRS = (os.path.join(PROJECT_ROOT, "static"),)
-
-    # Simplified static file serving.
-    # https://warehouse.python.org/project/whitenoise/
-    STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
-
-    # DATABASES = { 'default': dj_database_url.config(conn_max_age=500) }
+# Production (ENV=PRODUCTION):
+# DATABASES = { 'default': dj_database_url.config(conn_max_age=500) }
@@ -14,9 +14,22 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf.urls.i18n import i18n_patterns
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path, re_path
+
+from landing import views as landing_views
+from landing.api import router
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    # Language-neutral: the root redirect, the CSRF token and the JSON API
+    # (?lang=), everything else lives under /fr/ and /en/
+    path('', landing_views.language_redirect, name='language_redirect'),
+    path('csrf/', landing_views.csrf, name='csrf'),
+    re_path(r'^api/(?P<version>v\d+)/', include(router.urls)),
 ]
+
+# The language comes from the path alone, so caches need no Vary on
+# Accept-Language or Cookie for the public pages
+urlpatterns += i18n_patterns(path('', include('landing.urls')))
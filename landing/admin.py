@@ -1,10 +1,18 @@
-from django.contrib import admin
+from django.apps import apps
+from django.contrib import admin, messages
+from django.contrib.auth import get_permission_codename
+from django.core.exceptions import PermissionDenied
+from django.db.models import Count
+from django.http import FileResponse, Http404
+from django.shortcuts import get_object_or_404, redirect
+from django.template.response import TemplateResponse
+from django.utils import timezone
 from django.utils.html import format_html
-from django.urls import reverse
+from django.urls import path, reverse
 from django.utils.translation import gettext_lazy as _
 from parler.admin import TranslatableAdmin, TranslatableTabularInline
 from import_export.admin import ImportExportModelAdmin
-from import_export import resources
+from import_export import fields, resources, widgets
 
 from .models import (
     EventConfiguration,
@@ -22,13 +30,38 @@ from .models import (
     ContactMessage,
     FAQ,
     Newsletter,
+    NewsletterCampaign,
+    ExportJob,
+    OutboxEmail,
 )
-
+from .counters import update_with_counters
+from .countries import country_facets, normalize_country
+from .exports import STREAMING_FORMATS, streaming_export_response
+from .forms import RegistrationBulkImportForm
+from .images import variant_url
+from .imports import import_registrations
+from .mail import contact_reply, queue_email
+from .singletons import singleton_exists
 
 # ========== RESOURCES FOR IMPORT/EXPORT ==========
 
 
+class CountryWidget(widgets.CharWidget):
+    """Pays saisi librement dans le fichier importé, enregistré en code ISO"""
+
+    def clean(self, value, row=None, **kwargs):
+        code = normalize_country(value)
+        if code is None:
+            # Reported on the row instead of failing the whole import
+            raise ValueError(f"Unknown country: {value!r}")
+        return code
+
+
 class RegistrationResource(resources.ModelResource):
+    country = fields.Field(
+        attribute="country", column_name="country", widget=CountryWidget()
+    )
+
     class Meta:
         model = Registration
         fields = (
@@ -61,16 +94,114 @@ class ContactMessageResource(resources.ModelResource):
         )
 
 
+# ========== MIXINS ==========
+
+
+class TranslatedListMixin:
+    """Précharge traductions et compteurs pour un nombre de requêtes constant par page"""
+
+    # All translations are prefetched: parler treats a language missing from the
+    # prefetched set as untranslated, so filtering them would break fallbacks
+    list_prefetch_related = ("translations",)
+    list_annotations = {}
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if self.list_annotations:
+            qs = qs.annotate(**self.list_annotations)
+        return qs.prefetch_related(*self.list_prefetch_related)
+
+
+class TranslatedRelatedFieldListFilter(admin.RelatedFieldListFilter):
+    """Filtre sur une clé étrangère traduite, libellés chargés en deux requêtes"""
+
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        queryset = field.related_model._default_manager.prefetch_related("translations")
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return [(obj.pk, str(obj)) for obj in queryset]
+
+
+class CountryFacetListFilter(admin.SimpleListFilter):
+    """Filtre par pays lu depuis les compteurs par pays, sans DISTINCT sur la table"""
+
+    title = _("Country")
+    parameter_name = "country"
+
+    def lookups(self, request, model_admin):
+        return [(code, f"{name} ({count})") for code, name, count in country_facets()]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(country=self.value())
+        return queryset
+
+
+class StreamingExportMixin:
+    """Exports CSV/JSONL streamés et exports XLSX en arrière-plan"""
+
+    import_export_change_list_template = "admin/landing/export_change_list.html"
+
+    def get_streaming_export_fields(self):
+        return list(self.resource_class._meta.fields)
+
+    def get_urls(self):
+        info = self.model._meta.app_label, self.model._meta.model_name
+        urls = [
+            path(
+                "export/xlsx/",
+                self.admin_site.admin_view(self.background_export_view),
+                name="%s_%s_background_export" % info,
+            ),
+            path(
+                "export/<str:file_format>/",
+                self.admin_site.admin_view(self.streaming_export_view),
+                name="%s_%s_streaming_export" % info,
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def streaming_export_view(self, request, file_format):
+        if not self.has_export_permission(request):
+            raise PermissionDenied
+        if file_format not in STREAMING_FORMATS:
+            raise Http404
+        return streaming_export_response(
+            self.get_export_queryset(request),
+            self.get_streaming_export_fields(),
+            file_format,
+            f"{self.model._meta.model_name}-{timezone.now():%Y%m%d-%H%M%S}",
+        )
+
+    def background_export_view(self, request):
+        if not self.has_export_permission(request):
+            raise PermissionDenied
+        ExportJob.objects.create(
+            model_label=self.model._meta.label_lower,
+            query_string=request.GET.urlencode(),
+            requested_by=request.user,
+        )
+        self.message_user(
+            request,
+            _(
+                "The XLSX export has been queued. "
+                "The download link appears here when it is ready."
+            ),
+        )
+        return redirect("admin:landing_exportjob_changelist")
+
+
 # ========== INLINE ADMINS ==========
 
 
-class RoomTypeInline(TranslatableTabularInline):
+class RoomTypeInline(TranslatedListMixin, TranslatableTabularInline):
     model = RoomType
     extra = 1
     fields = ("name", "icon_class", "price_ngn", "order", "is_active")
 
 
-class ProgramSessionInline(TranslatableTabularInline):
+class ProgramSessionInline(TranslatedListMixin, TranslatableTabularInline):
     model = ProgramSession
     extra = 0
     fields = ("title", "session_type", "start_time", "end_time", "order")
@@ -81,7 +212,7 @@ class ProgramSessionInline(TranslatableTabularInline):
 
 
 @admin.register(EventConfiguration)
-class EventConfigurationAdmin(TranslatableAdmin):
+class EventConfigurationAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = (
         "get_event_name",
         "start_date",
@@ -105,6 +236,7 @@ class EventConfigurationAdmin(TranslatableAdmin):
                     "end_date",
                     "location",
                     "registration_deadline",
+                    "registration_prefix",
                 )
             },
         ),
@@ -122,13 +254,13 @@ class EventConfigurationAdmin(TranslatableAdmin):
     get_event_name.short_description = _("Event Name")
 
     def has_add_permission(self, request):
-        if EventConfiguration.objects.exists():
+        if singleton_exists(EventConfiguration):
             return False
         return super().has_add_permission(request)
 
 
 @admin.register(AboutSection)
-class AboutSectionAdmin(TranslatableAdmin):
+class AboutSectionAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = ("get_title", "comptroller_name", "is_active")
     search_fields = ("translations__title", "comptroller_name")
 
@@ -166,13 +298,13 @@ class AboutSectionAdmin(TranslatableAdmin):
     get_title.short_description = _("Title")
 
     def has_add_permission(self, request):
-        if AboutSection.objects.exists():
+        if singleton_exists(AboutSection):
             return False
         return super().has_add_permission(request)
 
 
 @admin.register(Speaker)
-class SpeakerAdmin(TranslatableAdmin):
+class SpeakerAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = (
         "photo_thumbnail",
         "full_name",
@@ -203,8 +335,8 @@ class SpeakerAdmin(TranslatableAdmin):
     def photo_thumbnail(self, obj):
         if obj.photo:
             return format_html(
-                '<img src="{}" style="width: 50px; height: 50px; border-radius: 50%; object-fit: cover;" />',
-                obj.photo.url,
+                '<img src="{}" loading="lazy" style="width: 50px; height: 50px; border-radius: 50%; object-fit: cover;" />',
+                variant_url(obj.photo, "thumb"),
             )
         return format_html(
             '<div style="width: 50px; height: 50px; background: #ddd; border-radius: 50%; '
@@ -242,11 +374,12 @@ class SpeakerAdmin(TranslatableAdmin):
 
 
 @admin.register(ProgramDay)
-class ProgramDayAdmin(TranslatableAdmin):
+class ProgramDayAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = ("day_number", "get_title", "date", "sessions_count", "is_active")
     list_filter = ("is_active", "date")
     ordering = ("day_number",)
     inlines = [ProgramSessionInline]
+    list_annotations = {"sessions_total": Count("sessions")}
 
     def get_title(self, obj):
         return obj.safe_translation_getter("title", any_language=True)
@@ -254,7 +387,7 @@ class ProgramDayAdmin(TranslatableAdmin):
     get_title.short_description = _("Title")
 
     def sessions_count(self, obj):
-        count = obj.sessions.count()
+        count = obj.sessions_total
         url = (
             reverse("admin:landing_programsession_changelist")
             + f"?program_day__id={obj.id}"
@@ -262,10 +395,11 @@ class ProgramDayAdmin(TranslatableAdmin):
         return format_html('<a href="{}">{} sessions</a>', url, count)
 
     sessions_count.short_description = _("Sessions")
+    sessions_count.admin_order_field = "sessions_total"
 
 
 @admin.register(ProgramSession)
-class ProgramSessionAdmin(TranslatableAdmin):
+class ProgramSessionAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = (
         "get_title",
         "program_day",
@@ -276,7 +410,14 @@ class ProgramSessionAdmin(TranslatableAdmin):
         "speakers_count",
         "is_active",
     )
-    list_filter = ("program_day", "session_type", "is_active")
+    list_filter = (
+        ("program_day", TranslatedRelatedFieldListFilter),
+        "session_type",
+        "is_active",
+    )
+    list_select_related = ("program_day", "moderator")
+    list_prefetch_related = ("translations", "program_day__translations")
+    list_annotations = {"speakers_total": Count("speakers")}
     search_fields = (
         "translations__title",
         "translations__description",
@@ -337,13 +478,14 @@ class ProgramSessionAdmin(TranslatableAdmin):
     session_type_badge.short_description = _("Type")
 
     def speakers_count(self, obj):
-        return obj.speakers.count()
+        return obj.speakers_total
 
     speakers_count.short_description = _("Speakers")
+    speakers_count.admin_order_field = "speakers_total"
 
 
 @admin.register(Venue)
-class VenueAdmin(TranslatableAdmin):
+class VenueAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = (
         "get_name",
         "get_day_badge",
@@ -398,7 +540,7 @@ class VenueAdmin(TranslatableAdmin):
 
 
 @admin.register(Partner)
-class PartnerAdmin(TranslatableAdmin):
+class PartnerAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = (
         "logo_thumbnail",
         "name",
@@ -413,8 +555,8 @@ class PartnerAdmin(TranslatableAdmin):
     def logo_thumbnail(self, obj):
         if obj.logo:
             return format_html(
-                '<img src="{}" style="max-width: 100px; max-height: 50px; object-fit: contain;" />',
-                obj.logo.url,
+                '<img src="{}" loading="lazy" style="max-width: 100px; max-height: 50px; object-fit: contain;" />',
+                variant_url(obj.logo, "thumb"),
             )
         return "-"
 
@@ -439,7 +581,7 @@ class PartnerAdmin(TranslatableAdmin):
 
 
 @admin.register(Hotel)
-class HotelAdmin(TranslatableAdmin):
+class HotelAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = ("name", "stars_display", "features_summary", "order", "is_active")
     list_filter = ("stars", "is_active")
     search_fields = ("name", "translations__address")
@@ -471,7 +613,7 @@ class HotelAdmin(TranslatableAdmin):
 
 
 @admin.register(LogisticInfo)
-class LogisticInfoAdmin(TranslatableAdmin):
+class LogisticInfoAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = ("logistic_type_badge", "get_title", "is_active")
     list_filter = ("logistic_type", "is_active")
     search_fields = ("translations__title", "translations__description")
@@ -501,7 +643,7 @@ class LogisticInfoAdmin(TranslatableAdmin):
 
 
 @admin.register(Contact)
-class ContactAdmin(TranslatableAdmin):
+class ContactAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = (
         "full_name",
         "get_title",
@@ -540,8 +682,10 @@ class ContactAdmin(TranslatableAdmin):
 
 
 @admin.register(Registration)
-class RegistrationAdmin(ImportExportModelAdmin):
+class RegistrationAdmin(StreamingExportMixin, ImportExportModelAdmin):
     resource_class = RegistrationResource
+    import_export_change_list_template = "admin/landing/registration/change_list.html"
+    bulk_import_template = "admin/landing/registration/bulk_import.html"
     list_display = (
         "registration_number",
         "fullname",
@@ -551,7 +695,12 @@ class RegistrationAdmin(ImportExportModelAdmin):
         "visa_badge",
         "created_at",
     )
-    list_filter = ("status", "needs_visa_assistance", "country", "created_at")
+    list_filter = (
+        "status",
+        "needs_visa_assistance",
+        CountryFacetListFilter,
+        "created_at",
+    )
     search_fields = (
         "registration_number",
         "fullname",
@@ -607,6 +756,53 @@ class RegistrationAdmin(ImportExportModelAdmin):
 
     actions = ["approve_registrations", "reject_registrations", "move_to_waitlist"]
 
+    def get_urls(self):
+        urls = [
+            path(
+                "bulk-import/",
+                self.admin_site.admin_view(self.bulk_import_view),
+                name="landing_registration_bulk_import",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def bulk_import_view(self, request):
+        if not self.has_import_permission(request):
+            raise PermissionDenied
+
+        result = None
+        form = RegistrationBulkImportForm(request.POST or None, request.FILES or None)
+        if request.method == "POST" and form.is_valid():
+            dry_run = form.cleaned_data["dry_run"]
+            result = import_registrations(
+                form.cleaned_data["import_file"], dry_run=dry_run
+            )
+            if dry_run:
+                self.message_user(
+                    request,
+                    _(f"{result.total} row(s) checked, {result.skipped} with errors."),
+                )
+            else:
+                self.message_user(
+                    request,
+                    _(
+                        f"{result.created} registration(s) imported, "
+                        f"{result.skipped} row(s) skipped."
+                    ),
+                    messages.SUCCESS if not result.errors else messages.WARNING,
+                )
+                if not result.errors:
+                    return redirect("admin:landing_registration_changelist")
+
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": _("Bulk import registrations"),
+            "form": form,
+            "result": result,
+        }
+        return TemplateResponse(request, self.bulk_import_template, context)
+
     def status_badge(self, obj):
         colors = {
             "pending": "#f39c12",
@@ -637,7 +833,7 @@ class RegistrationAdmin(ImportExportModelAdmin):
     visa_badge.short_description = _("Visa")
 
     def approve_registrations(self, request, queryset):
-        updated = queryset.update(status="approved")
+        updated = update_with_counters(queryset, status="approved")
         self.message_user(
             request, _(f"{updated} registration(s) approved successfully.")
         )
@@ -645,20 +841,20 @@ class RegistrationAdmin(ImportExportModelAdmin):
     approve_registrations.short_description = _("Approve selected registrations")
 
     def reject_registrations(self, request, queryset):
-        updated = queryset.update(status="rejected")
+        updated = update_with_counters(queryset, status="rejected")
         self.message_user(request, _(f"{updated} registration(s) rejected."))
 
     reject_registrations.short_description = _("Reject selected registrations")
 
     def move_to_waitlist(self, request, queryset):
-        updated = queryset.update(status="waitlist")
+        updated = update_with_counters(queryset, status="waitlist")
         self.message_user(request, _(f"{updated} registration(s) moved to waitlist."))
 
     move_to_waitlist.short_description = _("Move to waitlist")
 
 
 @admin.register(ContactMessage)
-class ContactMessageAdmin(ImportExportModelAdmin):
+class ContactMessageAdmin(StreamingExportMixin, ImportExportModelAdmin):
     resource_class = ContactMessageResource
     list_display = (
         "full_name",
@@ -716,17 +912,27 @@ class ContactMessageAdmin(ImportExportModelAdmin):
     reply_status.short_description = _("Reply")
 
     def mark_as_read(self, request, queryset):
-        updated = queryset.update(is_read=True)
+        updated = update_with_counters(queryset, is_read=True)
         self.message_user(request, _(f"{updated} message(s) marked as read."))
 
     mark_as_read.short_description = _("Mark as read")
 
     def mark_as_unread(self, request, queryset):
-        updated = queryset.update(is_read=False)
+        updated = update_with_counters(queryset, is_read=False)
         self.message_user(request, _(f"{updated} message(s) marked as unread."))
 
     mark_as_unread.short_description = _("Mark as unread")
 
+    def save_model(self, request, obj, form, change):
+        reply_changed = change and "admin_reply" in form.changed_data
+        if reply_changed and obj.admin_reply.strip():
+            obj.is_replied = True
+        super().save_model(request, obj, form, change)
+        if reply_changed and obj.admin_reply.strip():
+            # Sent by send_outbox, the admin does not wait on the SMTP server
+            queue_email(contact_reply(obj))
+            self.message_user(request, _("The reply has been queued for sending."))
+
     def mark_as_replied(self, request, queryset):
         updated = queryset.update(is_replied=True)
         self.message_user(request, _(f"{updated} message(s) marked as replied."))
@@ -735,7 +941,7 @@ class ContactMessageAdmin(ImportExportModelAdmin):
 
 
 @admin.register(FAQ)
-class FAQAdmin(TranslatableAdmin):
+class FAQAdmin(TranslatedListMixin, TranslatableAdmin):
     list_display = ("question_preview", "order", "is_active")
     list_filter = ("is_active",)
     search_fields = ("translations__question", "translations__answer")
@@ -752,8 +958,8 @@ class FAQAdmin(TranslatableAdmin):
 
 @admin.register(Newsletter)
 class NewsletterAdmin(admin.ModelAdmin):
-    list_display = ("email", "is_active", "created_at")
-    list_filter = ("is_active", "created_at")
+    list_display = ("email", "language", "is_active", "created_at")
+    list_filter = ("is_active", "language", "created_at")
     search_fields = ("email",)
     readonly_fields = ("id", "created_at", "updated_at")
     actions = ["activate_subscriptions", "deactivate_subscriptions"]
@@ -771,7 +977,234 @@ class NewsletterAdmin(admin.ModelAdmin):
     deactivate_subscriptions.short_description = _("Deactivate subscriptions")
 
 
+@admin.register(NewsletterCampaign)
+class NewsletterCampaignAdmin(TranslatedListMixin, TranslatableAdmin):
+    list_display = (
+        "__str__",
+        "status_badge",
+        "progress_display",
+        "sent_count",
+        "failed_count",
+        "started_at",
+        "finished_at",
+    )
+    list_filter = ("status",)
+    search_fields = ("translations__subject",)
+    readonly_fields = (
+        "status",
+        "total_recipients",
+        "sent_count",
+        "failed_count",
+        "started_at",
+        "finished_at",
+    )
+    actions = ["schedule_campaigns", "cancel_campaigns"]
+
+    def has_change_permission(self, request, obj=None):
+        # Content is frozen once the campaign has left the draft state
+        if obj is not None and obj.status != "draft":
+            return False
+        return super().has_change_permission(request, obj)
+
+    def status_badge(self, obj):
+        colors = {
+            "draft": "#95a5a6",
+            "scheduled": "#f39c12",
+            "sending": "#3498db",
+            "sent": "#2ecc71",
+            "cancelled": "#e74c3c",
+        }
+        color = colors.get(obj.status, "#95a5a6")
+        return format_html(
+            '<span style="background: {}; color: white; padding: 3px 10px; '
+            'border-radius: 3px; font-size: 11px;">{}</span>',
+            color,
+            obj.get_status_display(),
+        )
+
+    status_badge.short_description = _("Status")
+
+    def progress_display(self, obj):
+        return format_html(
+            '<div style="width: 120px; background: #ddd; border-radius: 3px;">'
+            '<div style="width: {}%; background: #3498db; color: white; '
+            'font-size: 10px; text-align: center; border-radius: 3px;">{}%</div></div>'
+            '<span style="font-size: 10px;">{} / {}</span>',
+            obj.progress,
+            obj.progress,
+            obj.sent_count + obj.failed_count,
+            obj.total_recipients,
+        )
+
+    progress_display.short_description = _("Progress")
+
+    def schedule_campaigns(self, request, queryset):
+        updated = queryset.filter(status="draft").update(status="scheduled")
+        self.message_user(
+            request,
+            _(
+                f"{updated} campaign(s) scheduled, they are sent by the campaign worker."
+            ),
+        )
+
+    schedule_campaigns.short_description = _("Schedule sending")
+
+    def cancel_campaigns(self, request, queryset):
+        updated = queryset.filter(status__in=["scheduled", "sending"]).update(
+            status="cancelled"
+        )
+        self.message_user(request, _(f"{updated} campaign(s) cancelled."))
+
+    cancel_campaigns.short_description = _("Cancel sending")
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "model_label",
+        "status_badge",
+        "progress_display",
+        "download_link",
+        "requested_by",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("status", "model_label")
+    readonly_fields = [field.name for field in ExportJob._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        urls = [
+            path(
+                "<uuid:pk>/download/",
+                self.admin_site.admin_view(self.download_view),
+                name="landing_exportjob_download",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def has_download_permission(self, request, job):
+        """Le fichier reste réservé à qui l'a demandé et peut voir ses données"""
+
+        if request.user.is_superuser:
+            return True
+        if job.requested_by_id != request.user.pk:
+            return False
+        try:
+            opts = apps.get_model(job.model_label)._meta
+        except (LookupError, ValueError):
+            return False
+        codename = get_permission_codename("view", opts)
+        return request.user.has_perm(f"{opts.app_label}.{codename}")
+
+    def download_view(self, request, pk):
+        job = get_object_or_404(ExportJob, pk=pk, status="done")
+        if not job.file or not (
+            self.has_view_permission(request, job)
+            and self.has_download_permission(request, job)
+        ):
+            raise PermissionDenied
+        return FileResponse(
+            job.file.open("rb"),
+            as_attachment=True,
+            filename=job.file.name.rsplit("/", 1)[-1],
+        )
+
+    def status_badge(self, obj):
+        colors = {
+            "pending": "#f39c12",
+            "running": "#3498db",
+            "done": "#2ecc71",
+            "failed": "#e74c3c",
+        }
+        color = colors.get(obj.status, "#95a5a6")
+        return format_html(
+            '<span style="background: {}; color: white; padding: 3px 10px; '
+            'border-radius: 3px; font-size: 11px;">{}</span>',
+            color,
+            obj.get_status_display(),
+        )
+
+    status_badge.short_description = _("Status")
+
+    def progress_display(self, obj):
+        return format_html(
+            '<div style="width: 120px; background: #ddd; border-radius: 3px;">'
+            '<div style="width: {}%; background: #3498db; color: white; '
+            'font-size: 10px; text-align: center; border-radius: 3px;">{}%</div></div>'
+            '<span style="font-size: 10px;">{} / {}</span>',
+            obj.progress,
+            obj.progress,
+            obj.processed_rows,
+            obj.total_rows,
+        )
+
+    progress_display.short_description = _("Progress")
+
+    def download_link(self, obj):
+        if obj.status == "done" and obj.file:
+            url = reverse("admin:landing_exportjob_download", args=[obj.pk])
+            return format_html('<a href="{}">{}</a>', url, _("Download"))
+        return "-"
+
+    download_link.short_description = _("File")
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        "subject",
+        "to",
+        "reference",
+        "status_badge",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+    )
+    list_filter = ("status", "created_at")
+    search_fields = ("to", "subject", "reference")
+    readonly_fields = [field.name for field in OutboxEmail._meta.fields]
+    actions = ["retry_now"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def status_badge(self, obj):
+        colors = {
+            "pending": "#f39c12",
+            "sending": "#3498db",
+            "sent": "#2ecc71",
+            "failed": "#e74c3c",
+        }
+        color = colors.get(obj.status, "#95a5a6")
+        return format_html(
+            '<span style="background: {}; color: white; padding: 3px 10px; '
+            'border-radius: 3px; font-size: 11px;">{}</span>',
+            color,
+            obj.get_status_display(),
+        )
+
+    status_badge.short_description = _("Status")
+
+    def retry_now(self, request, queryset):
+        updated = queryset.filter(status__in=["pending", "failed"]).update(
+            status="pending", next_attempt_at=timezone.now(), attempts=0
+        )
+        self.message_user(request, _(f"{updated} email(s) queued for sending."))
+
+    retry_now.short_description = _("Retry now")
+
+
 # ========== CUSTOMIZE ADMIN SITE ==========
 admin.site.site_header = _("Customs PACT 2025 Administration")
 admin.site.site_title = _("Customs PACT Admin")
 admin.site.index_title = _("Welcome to Customs PACT Administration Portal")
+admin.site.index_template = "admin/landing/dashboard.html"
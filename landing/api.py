@@ -0,0 +1,402 @@
+import hashlib
+import json
+from operator import attrgetter
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Prefetch, Q
+from django.utils import translation
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+    quote_etag,
+)
+from rest_framework import viewsets
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from rest_framework.routers import SimpleRouter
+
+from .caching import get_or_compute
+from .content import LANDING_CACHE_TIMEOUT, get_landing_last_modified
+from .i18n import accepted_language
+from .models import (
+    FAQ,
+    Hotel,
+    LogisticInfo,
+    ProgramDay,
+    ProgramSession,
+    RoomType,
+    Speaker,
+    Venue,
+)
+
+API_CACHE_PREFIX = "api:response"
+API_MAX_AGE = 60  # seconds
+
+
+# ========== FIELD GETTERS ==========
+# Objects are turned into plain dicts by a table of getters per resource, which
+# is much cheaper than a serializer instance per object and per nested object
+
+
+def _translated(name):
+    return lambda obj: obj.safe_translation_getter(name, any_language=True)
+
+
+def _file_url(name):
+    def getter(obj):
+        fieldfile = getattr(obj, name)
+        return fieldfile.url if fieldfile else None
+
+    return getter
+
+
+def _nested(name, fields):
+    return lambda obj: [serialize(item, fields) for item in getattr(obj, name).all()]
+
+
+def serialize(obj, fields, names=None):
+    """Dictionnaire des champs demandés d'un objet"""
+    return {name: fields[name](obj) for name in names or fields}
+
+
+SPEAKER_SUMMARY_FIELDS = {
+    "id": attrgetter("id"),
+    "full_name": attrgetter("full_name"),
+    "title": _translated("title"),
+    "organization": _translated("organization"),
+    "photo": _file_url("photo"),
+}
+
+SPEAKER_FIELDS = {
+    **SPEAKER_SUMMARY_FIELDS,
+    "category": attrgetter("category"),
+    "bio": _translated("bio"),
+    "linkedin_url": attrgetter("linkedin_url"),
+    "twitter_url": attrgetter("twitter_url"),
+}
+
+SESSION_FIELDS = {
+    "id": attrgetter("id"),
+    "title": _translated("title"),
+    "description": _translated("description"),
+    "venue": _translated("venue"),
+    "session_type": attrgetter("session_type"),
+    "start_time": attrgetter("start_time"),
+    "end_time": attrgetter("end_time"),
+    "interpretation_languages": attrgetter("interpretation_languages"),
+    "capacity": attrgetter("capacity"),
+    "moderator": lambda obj: (
+        serialize(obj.moderator, SPEAKER_SUMMARY_FIELDS) if obj.moderator else None
+    ),
+    "speakers": _nested("speakers", SPEAKER_SUMMARY_FIELDS),
+}
+
+PROGRAM_DAY_FIELDS = {
+    "id": attrgetter("id"),
+    "day_number": attrgetter("day_number"),
+    "date": attrgetter("date"),
+    "title": _translated("title"),
+    "description": _translated("description"),
+    "sessions": _nested("sessions", SESSION_FIELDS),
+}
+
+VENUE_FIELDS = {
+    "id": attrgetter("id"),
+    "name": _translated("name"),
+    "address": _translated("address"),
+    "day_badge": _translated("day_badge"),
+    "sessions_info": _translated("sessions_info"),
+    "capacity": _translated("capacity"),
+    "distance_from_airport": _translated("distance_from_airport"),
+    "rating": _translated("rating"),
+    "google_maps_url": attrgetter("google_maps_url"),
+    "website_url": attrgetter("website_url"),
+    "image": _file_url("image"),
+}
+
+ROOM_TYPE_FIELDS = {
+    "id": attrgetter("id"),
+    "name": _translated("name"),
+    "icon_class": attrgetter("icon_class"),
+    "price_ngn": attrgetter("price_ngn"),
+}
+
+HOTEL_FIELDS = {
+    "id": attrgetter("id"),
+    "name": attrgetter("name"),
+    "description": _translated("description"),
+    "address": _translated("address"),
+    "website_url": attrgetter("website_url"),
+    "stars": attrgetter("stars"),
+    "image": _file_url("image"),
+    "has_breakfast": attrgetter("has_breakfast"),
+    "has_wifi": attrgetter("has_wifi"),
+    "has_pool": attrgetter("has_pool"),
+    "has_gym": attrgetter("has_gym"),
+    "has_spa": attrgetter("has_spa"),
+    "has_restaurant": attrgetter("has_restaurant"),
+    "room_types": _nested("room_types", ROOM_TYPE_FIELDS),
+}
+
+LOGISTIC_FIELDS = {
+    "id": attrgetter("id"),
+    "logistic_type": attrgetter("logistic_type"),
+    "icon_class": attrgetter("icon_class"),
+    "title": _translated("title"),
+    "description": _translated("description"),
+    "content": _translated("content"),
+}
+
+FAQ_FIELDS = {
+    "id": attrgetter("id"),
+    "question": _translated("question"),
+    "answer": _translated("answer"),
+}
+
+
+def _active_speakers():
+    return Speaker.objects.filter(is_active=True)
+
+
+# ========== VIEWS ==========
+
+
+class ContentCursorPagination(CursorPagination):
+    """Pagination par curseur, sur l'ordre d'affichage de chaque ressource
+
+    DRF positions the cursor on the first ordering field only and counts an
+    offset past the rows sharing its value, which skips or repeats rows when
+    several have the same display order. Here the position holds every field
+    of the ordering, which ends on the primary key: it is unique, so the next
+    page starts right after the last row, without offset.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+    def get_ordering(self, request, queryset, view):
+        return view.ordering
+
+    def _get_position_from_instance(self, instance, ordering):
+        return json.dumps(
+            [str(getattr(instance, name.lstrip("-"))) for name in ordering]
+        )
+
+    def _after_position(self, position, reverse):
+        """Lignes situées après la position (avant si reverse), champ par champ"""
+
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        # (a, pk) after (1, x): a > 1 OR (a = 1 AND pk > x), nested per extra field
+        condition = None
+        for name, value in reversed(list(zip(self.ordering, values))):
+            attr = name.lstrip("-")
+            lookup = "lt" if reverse != name.startswith("-") else "gt"
+            beyond = Q(**{f"{attr}__{lookup}": value})
+            if condition is not None:
+                beyond |= Q(**{attr: value}) & condition
+            condition = beyond
+        return condition
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        offset, reverse, position = self.cursor or (0, False, None)
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [n[1:] if n.startswith("-") else f"-{n}" for n in ordering]
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self._after_position(position, reverse))
+            except (DjangoValidationError, ValueError):
+                # A position value that does not fit the field
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = results[: self.page_size]
+        following = None
+        if len(results) > len(self.page):
+            following = self._get_position_from_instance(results[-1], self.ordering)
+
+        started = position is not None or offset > 0
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = started, following is not None
+            self.next_position, self.previous_position = position, following
+        else:
+            self.has_next, self.has_previous = following is not None, started
+            self.next_position, self.previous_position = following, position
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+
+class ContentViewSet(viewsets.ReadOnlyModelViewSet):
+    """Ressource publique en lecture seule, mise en cache par langue et requête
+
+    ?lang=fr|en picks the language (Accept-Language otherwise) and
+    ?fields=id,title limits the returned fields. Whole responses are cached
+    under the landing last-modified stamp, so any content change makes the
+    previous entries unreachable.
+    """
+
+    pagination_class = ContentCursorPagination
+    fields = {}
+    ordering = ("order", "id")
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.language = self._requested_language(request)
+        self.field_names = self._requested_fields(request)
+
+    def _requested_language(self, request):
+        language_code = request.query_params.get("lang")
+        if language_code is None:
+            return accepted_language(request)
+        if language_code not in dict(settings.LANGUAGES):
+            raise ValidationError({"lang": f"Unsupported language: {language_code}"})
+        return language_code
+
+    def _requested_fields(self, request):
+        names = [n for n in request.query_params.get("fields", "").split(",") if n]
+        unknown = [n for n in names if n not in self.fields]
+        if unknown:
+            raise ValidationError({"fields": f"Unknown fields: {', '.join(unknown)}"})
+        return names
+
+    def list(self, request, *args, **kwargs):
+        def build():
+            page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+            data = [serialize(obj, self.fields, self.field_names) for obj in page]
+            return self.get_paginated_response(data).data
+
+        return self.cached_response(request, build)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(
+            request,
+            lambda: serialize(self.get_object(), self.fields, self.field_names),
+        )
+
+    def cached_response(self, request, build):
+        stamp = get_landing_last_modified()
+        # Cursor links are absolute, the host is part of the key
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        digest = hashlib.md5(
+            f"{request.get_host()}{request.path}?{query}".encode()
+        ).hexdigest()
+        etag = quote_etag(f"{self.language}-{stamp.timestamp():.6f}-{digest[:16]}")
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=int(stamp.timestamp())
+        )
+        if not_modified is not None:
+            return not_modified
+
+        key = (
+            f"{API_CACHE_PREFIX}:{request.version}:{self.language}:"
+            f"{stamp.timestamp():.6f}:{digest}"
+        )
+
+        def build_in_language():
+            with translation.override(self.language):
+                return build()
+
+        # Every key changes with the stamp: one request per key builds it
+        data = get_or_compute(key, build_in_language, LANDING_CACHE_TIMEOUT)
+
+        response = Response(data)
+        response["ETag"] = etag
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code in (200, 304):
+            patch_cache_control(response, public=True, max_age=API_MAX_AGE)
+            response["Content-Language"] = getattr(self, "language", "")
+        patch_vary_headers(response, ("Accept-Language",))
+        return response
+
+
+class ProgramViewSet(ContentViewSet):
+    """Jours du programme avec leurs sessions, intervenants et modérateur"""
+
+    fields = PROGRAM_DAY_FIELDS
+    ordering = ("day_number", "id")
+
+    def get_queryset(self):
+        sessions = ProgramSession.objects.filter(is_active=True).prefetch_related(
+            # Forward relations are prefetched with the base manager otherwise
+            Prefetch("moderator", queryset=Speaker.objects.all()),
+            Prefetch("speakers", queryset=_active_speakers()),
+        )
+        return ProgramDay.objects.filter(is_active=True).prefetch_related(
+            Prefetch("sessions", queryset=sessions)
+        )
+
+
+class SpeakerViewSet(ContentViewSet):
+    fields = SPEAKER_FIELDS
+    filterset_fields = ["category"]
+
+    def get_queryset(self):
+        return _active_speakers()
+
+
+class VenueViewSet(ContentViewSet):
+    fields = VENUE_FIELDS
+
+    def get_queryset(self):
+        return Venue.objects.filter(is_active=True)
+
+
+class HotelViewSet(ContentViewSet):
+    fields = HOTEL_FIELDS
+    filterset_fields = ["stars"]
+
+    def get_queryset(self):
+        room_types = RoomType.objects.filter(is_active=True)
+        return Hotel.objects.filter(is_active=True).prefetch_related(
+            Prefetch("room_types", queryset=room_types)
+        )
+
+
+class LogisticInfoViewSet(ContentViewSet):
+    fields = LOGISTIC_FIELDS
+    ordering = ("logistic_type", "id")
+    filterset_fields = ["logistic_type"]
+
+    def get_queryset(self):
+        return LogisticInfo.objects.filter(is_active=True)
+
+
+class FAQViewSet(ContentViewSet):
+    fields = FAQ_FIELDS
+
+    def get_queryset(self):
+        return FAQ.objects.filter(is_active=True)
+
+
+router = SimpleRouter()
+router.register("program", ProgramViewSet, basename="api-program")
+router.register("speakers", SpeakerViewSet, basename="api-speakers")
+router.register("venues", VenueViewSet, basename="api-venues")
+router.register("hotels", HotelViewSet, basename="api-hotels")
+router.register("logistics", LogisticInfoViewSet, basename="api-logistics")
+router.register("faqs", FAQViewSet, basename="api-faqs")
@@ -0,0 +1,290 @@
+import hashlib
+import posixpath
+import re
+from io import BytesIO
+from pathlib import Path
+from urllib.request import urlopen
+
+from django.conf import settings
+from PIL import Image, ImageChops
+
+# Third-party files served from our own domain instead of public CDNs
+# static path: upstream URL, downloaded once into STATIC_VENDOR_DIR
+VENDOR_FILES = {
+    "vendor/bootstrap/bootstrap.min.css": (
+        "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css"
+    ),
+    "vendor/bootstrap/bootstrap.bundle.min.js": (
+        "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"
+    ),
+    "vendor/fontawesome/css/all.min.css": (
+        "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.0/css/all.min.css"
+    ),
+    "vendor/fontawesome/css/v4-shims.min.css": (
+        "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.0/css/v4-shims.min.css"
+    ),
+}
+for _font in ("fa-brands-400", "fa-regular-400", "fa-solid-900", "fa-v4compatibility"):
+    for _extension in ("woff2", "ttf"):
+        VENDOR_FILES[f"vendor/fontawesome/webfonts/{_font}.{_extension}"] = (
+            "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.0/webfonts/"
+            f"{_font}.{_extension}"
+        )
+
+# bundle name: (output path, sources in order); sources are static paths,
+# vendor files come from STATIC_VENDOR_DIR, the others from STATIC_SOURCE_DIR
+ASSET_BUNDLES = {
+    "site.css": (
+        "bundles/site.min.css",
+        [
+            "vendor/fontawesome/css/all.min.css",
+            "vendor/fontawesome/css/v4-shims.min.css",
+            "vendor/bootstrap/bootstrap.min.css",
+            "css/styles.css",
+            "css/responsive.css",
+        ],
+    ),
+    "site.js": (
+        "bundles/site.min.js",
+        ["vendor/bootstrap/bootstrap.bundle.min.js", "js/forms.js"],
+    ),
+}
+
+# {% static 'path' %} and {% static_picture "path" ... %} in templates
+TEMPLATE_STATIC_RE = re.compile(r"""{%\s*static(?:_picture)?\s+['"]([^'"]+)['"]""")
+# url("...") / url('...') / url(...); quoted values may contain parentheses
+CSS_URL_RE = re.compile(r"""url\(\s*(?:(["'])(.*?)\1|([^)'"]*?))\s*\)""", re.S)
+CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+CSS_PROTECTED_RE = re.compile(r"""url\([^)]*\)|"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'""")
+SOURCE_MAP_RE = re.compile(r"/\*# sourceMappingURL=[^*]*\*/|//# sourceMappingURL=\S*")
+
+
+def source_path(path):
+    """Fichier source d'un chemin statique (vendor: copie téléchargée)"""
+    if path in VENDOR_FILES:
+        return Path(settings.STATIC_VENDOR_DIR) / path
+    return Path(settings.STATIC_SOURCE_DIR) / path
+
+
+def fetch_vendor_files(refresh=False):
+    """Télécharge les bibliothèques tierces dans STATIC_VENDOR_DIR"""
+
+    fetched = []
+    for path, url in VENDOR_FILES.items():
+        target = source_path(path)
+        if target.exists() and not refresh:
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with urlopen(url, timeout=30) as response:
+            target.write_bytes(response.read())
+        fetched.append(path)
+    return fetched
+
+
+def _css_url(match):
+    quote, quoted, bare = match.groups()
+    return (quote, quoted) if quote else ("", bare)
+
+
+def _is_external(url):
+    return url.startswith(("data:", "http:", "https:", "//", "#", "/"))
+
+
+def rewrite_css_urls(css, source, output):
+    """Rend les url() relatives d'une feuille valides depuis l'emplacement du bundle"""
+
+    source_dir = posixpath.dirname(source)
+    output_dir = posixpath.dirname(output)
+
+    def rewrite(match):
+        quote, url = _css_url(match)
+        if _is_external(url):
+            return match.group(0)
+        path, suffix = re.match(r"([^?#]*)(.*)", url).groups()
+        target = posixpath.normpath(posixpath.join(source_dir, path))
+        relative = posixpath.relpath(target, output_dir)
+        return f"url({quote}{relative}{suffix}{quote})"
+
+    return CSS_URL_RE.sub(rewrite, css)
+
+
+def css_references(css, path):
+    """Chemins statiques référencés par les url() d'une feuille de style"""
+
+    references = set()
+    for match in CSS_URL_RE.finditer(css):
+        _quote, url = _css_url(match)
+        if _is_external(url):
+            continue
+        url = re.split(r"[?#]", url, maxsplit=1)[0]
+        references.add(posixpath.normpath(posixpath.join(posixpath.dirname(path), url)))
+    return references
+
+
+def minify_css(css):
+    """Minification prudente: commentaires et espaces superflus"""
+
+    # Strings and url() values are put aside so their content is left untouched
+    protected = []
+
+    def protect(match):
+        protected.append(match.group(0))
+        return f"\x00{len(protected) - 1}\x00"
+
+    css = CSS_COMMENT_RE.sub("", css)
+    css = CSS_PROTECTED_RE.sub(protect, css)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = css.replace(";}", "}")
+    return re.sub(r"\x00(\d+)\x00", lambda m: protected[int(m.group(1))], css).strip()
+
+
+def build_bundle(name):
+    """Concatène (et minifie) les sources d'un bundle, retourne (chemin, contenu)"""
+
+    output, sources = ASSET_BUNDLES[name]
+    parts = []
+    for source in sources:
+        content = source_path(source).read_text(encoding="utf-8")
+        # The .map files are not shipped, the manifest storage would reject them
+        content = SOURCE_MAP_RE.sub("", content).rstrip()
+        if output.endswith(".css"):
+            if not source.endswith(".min.css"):
+                content = minify_css(content)
+            content = rewrite_css_urls(content, source, output)
+        elif not content.endswith(";"):
+            # Keep the scripts apart once concatenated
+            content += ";"
+        parts.append(content)
+    return output, "\n".join(parts)
+
+
+def template_references():
+    """Chemins statiques utilisés par les gabarits du projet"""
+
+    references = set()
+    for directory in settings.TEMPLATES[0]["DIRS"]:
+        for template in Path(directory).rglob("*.html"):
+            references.update(
+                TEMPLATE_STATIC_RE.findall(template.read_text(encoding="utf-8"))
+            )
+    return references
+
+
+def file_digest(path):
+    return hashlib.md5(Path(path).read_bytes()).hexdigest()
+
+
+# ========== IMAGE OPTIMIZATION (optimize_assets) ==========
+
+RASTER_EXTENSIONS = {".png", ".jpg", ".jpeg"}
+# sibling extension: (Pillow format, options for PNG sources, options for JPEG)
+SIBLING_FORMATS = {
+    ".webp": ("WEBP", {"lossless": True, "method": 6}, {"quality": 85, "method": 6}),
+    ".avif": ("AVIF", {"quality": 90}, {"quality": 70}),
+}
+SVG_PATTERNS = [
+    re.compile(r"<\?xml[^>]*\?>", re.S),
+    re.compile(r"<!--.*?-->", re.S),
+    re.compile(r"<metadata\b.*?</metadata>", re.S),
+    re.compile(r"<sodipodi:namedview\b.*?(?:/>|</sodipodi:namedview>)", re.S),
+    re.compile(r"""\s(?:inkscape|sodipodi):[\w-]+="[^"]*\"""", re.S),
+]
+
+try:
+    import pillow_avif  # noqa: F401 (registers the AVIF encoder)
+except ImportError:
+    pass
+
+
+def _encode(image, pillow_format, **options):
+    buffer = BytesIO()
+    image.save(buffer, pillow_format, **options)
+    return buffer.getvalue()
+
+
+def _as_palette(image):
+    """Version palette d'une image de 256 couleurs au plus, si elle est identique"""
+
+    if image.mode not in ("RGB", "RGBA") or image.getcolors(256) is None:
+        return None
+    palette = image.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+    if ImageChops.difference(palette.convert(image.mode), image).getbbox():
+        return None
+    return palette
+
+
+def optimize_raster(path):
+    """Recompresse un PNG sans perte, un JPEG avec ses propres tables de quantification"""
+
+    original = path.read_bytes()
+    with Image.open(BytesIO(original)) as image:
+        image.load()
+        # Metadata (EXIF, XMP, comments) is dropped, the ICC profile is kept
+        options = {"optimize": True}
+        if image.info.get("icc_profile"):
+            options["icc_profile"] = image.info["icc_profile"]
+        if image.format == "JPEG":
+            optimized = _encode(
+                image,
+                "JPEG",
+                quality="keep",
+                subsampling="keep",
+                progressive=True,
+                **options,
+            )
+        else:
+            optimized = _encode(image, "PNG", **options)
+            palette = _as_palette(image)
+            if palette is not None:
+                optimized = min(optimized, _encode(palette, "PNG", **options), key=len)
+    if len(optimized) < len(original):
+        path.write_bytes(optimized)
+        return len(original) - len(optimized)
+    return 0
+
+
+def minify_svg(path):
+    """Retire commentaires, métadonnées d'éditeur et espaces entre balises"""
+
+    original = path.read_bytes()
+    svg = original.decode("utf-8")
+    for pattern in SVG_PATTERNS:
+        svg = pattern.sub("", svg)
+    svg = re.sub(r">\s+<", "><", svg).strip().encode("utf-8")
+    if len(svg) < len(original):
+        path.write_bytes(svg)
+        return len(original) - len(svg)
+    return 0
+
+
+def write_siblings(path):
+    """Écrit les copies WebP/AVIF d'une image quand elles sont plus légères"""
+
+    Image.init()
+    written = []
+    with Image.open(path) as image:
+        image.load()
+        for extension, (pillow_format, lossless, lossy) in SIBLING_FORMATS.items():
+            sibling = path.with_suffix(extension)
+            if pillow_format not in Image.SAVE:
+                continue
+            options = lossy if image.format == "JPEG" else lossless
+            content = _encode(image, pillow_format, **options)
+            if len(content) < path.stat().st_size:
+                sibling.write_bytes(content)
+                written.append(sibling)
+            elif sibling.exists():
+                sibling.unlink()
+    return written
+
+
+def image_siblings(path):
+    """Chemins statiques des copies WebP/AVIF existantes d'une image"""
+    source = source_path(path)
+    return [
+        posixpath.splitext(path)[0] + extension
+        for extension in SIBLING_FORMATS
+        if source.suffix.lower() in RASTER_EXTENSIONS
+        and source.with_suffix(extension).is_file()
+    ]
@@ -0,0 +1,242 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from redis.exceptions import ConnectionError, TimeoutError
+
+logger = logging.getLogger("events")
+
+REDIS_ERRORS = (ConnectionError, TimeoutError)
+# Keys deleted per command when the whole namespace is dropped
+RECONCILE_BATCH_SIZE = 1000
+
+_MISSING = object()
+
+
+class ResilientRedisCache(RedisCache):
+    """Cache Redis qui se replie sur la mémoire du processus quand Redis est indisponible
+
+    After FAILURE_THRESHOLD consecutive connection errors or timeouts the
+    circuit opens: calls go to a bounded in-process LRU (LocMemCache) without
+    trying Redis, which is tried again RETRY_AFTER seconds later. The keys
+    written meanwhile are deleted from Redis before it is used again, so the
+    values it held from before the outage (invalidated since) do not come back.
+    When more than FALLBACK_MAX_ENTRIES keys were written, every key of this
+    cache (KEY_PREFIX and VERSION) is deleted instead; the rest of the Redis
+    database is left alone.
+
+    CACHES = {"default": {
+        "BACKEND": "landing.cache_backend.ResilientRedisCache",
+        "LOCATION": "redis://127.0.0.1:6379/1",
+        "KEY_PREFIX": "custompact",
+        "OPTIONS": {"socket_connect_timeout": 0.25, "socket_timeout": 0.25},
+        "FAILURE_THRESHOLD": 3, "RETRY_AFTER": 5, "FALLBACK_MAX_ENTRIES": 1000,
+    }}
+    """
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        self.failure_threshold = int(params.get("FAILURE_THRESHOLD", 3))
+        self.retry_after = float(params.get("RETRY_AFTER", 5))
+        max_entries = int(params.get("FALLBACK_MAX_ENTRIES", 1000))
+        # Same key prefix, version and key function: the keys match Redis'
+        self._fallback = LocMemCache(
+            f"resilient-fallback-{id(self)}",
+            {
+                "TIMEOUT": params.get("TIMEOUT", DEFAULT_TIMEOUT),
+                "KEY_PREFIX": params.get("KEY_PREFIX", ""),
+                "VERSION": params.get("VERSION", 1),
+                "KEY_FUNCTION": params.get("KEY_FUNCTION"),
+                "OPTIONS": {"MAX_ENTRIES": max_entries},
+            },
+        )
+        self._dirty_keys_max = max_entries
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_until = None
+        self._dirty_keys = set()
+        self._dirty_overflow = False
+        self._metrics = Counter()
+
+    # ========== CIRCUIT BREAKER ==========
+
+    @property
+    def degraded(self):
+        return self._open_until is not None
+
+    def _redis_available(self):
+        if self._open_until is None:
+            return True
+        with self._lock:
+            if self._open_until is None:
+                return True
+            if time.monotonic() < self._open_until:
+                return False
+            # Half open: this call tries Redis, starting with the reconciliation,
+            # while the other threads keep using the fallback
+            self._open_until = time.monotonic() + self.retry_after
+        try:
+            self._reconcile()
+        except REDIS_ERRORS as exc:
+            logger.warning("Redis still unavailable: %s", exc)
+            return False
+        with self._lock:
+            self._open_until = None
+            self._failures = 0
+        logger.info("Redis available again, cache circuit closed")
+        return True
+
+    def _count(self, **deltas):
+        with self._lock:
+            self._metrics.update(deltas)
+
+    def _record_failure(self, exc):
+        with self._lock:
+            self._metrics["errors"] += 1
+            self._failures += 1
+            if self._open_until is None and self._failures >= self.failure_threshold:
+                self._open_until = time.monotonic() + self.retry_after
+                self._metrics["circuit_opened"] += 1
+                logger.error(
+                    "Redis unavailable (%s), using the local fallback cache", exc
+                )
+
+    def _reconcile(self):
+        with self._lock:
+            dirty, self._dirty_keys = self._dirty_keys, set()
+            overflow, self._dirty_overflow = self._dirty_overflow, False
+        try:
+            if overflow:
+                # Too many keys to know which ones Redis has wrong
+                dropped = self._delete_namespace()
+            else:
+                self._cache.delete_many(list(dirty))
+                dropped = len(dirty)
+        except REDIS_ERRORS:
+            with self._lock:
+                self._dirty_keys |= dirty
+                self._dirty_overflow |= overflow
+            raise
+        self._fallback.clear()
+        self._count(reconciliations=1)
+        logger.info("Cache reconciled after an outage: %s key(s) dropped", dropped)
+
+    def _delete_namespace(self):
+        """Supprime de Redis toutes les clés de ce cache, et seulement elles"""
+
+        client = self._cache.get_client(write=True)
+        # make_key("") is "<KEY_PREFIX>:<VERSION>:", escaped for the glob pattern
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", self.make_key("")) + "*"
+        deleted = 0
+        batch = []
+        for key in client.scan_iter(match=pattern, count=RECONCILE_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= RECONCILE_BATCH_SIZE:
+                deleted += client.delete(*batch)
+                batch = []
+        if batch:
+            deleted += client.delete(*batch)
+        return deleted
+
+    def _mark_dirty(self, keys, version=None):
+        with self._lock:
+            if self._dirty_overflow:
+                return
+            self._dirty_keys.update(self.make_key(key, version) for key in keys)
+            if len(self._dirty_keys) > self._dirty_keys_max:
+                self._dirty_keys.clear()
+                self._dirty_overflow = True
+
+    def _call(self, name, *args, written=(), version=None, **kwargs):
+        """Appelle Redis, ou le cache local quand le circuit est ouvert ou l'appel échoue"""
+
+        self._count(calls=1)
+        if self._redis_available():
+            try:
+                result = getattr(super(), name)(*args, version=version, **kwargs)
+            except REDIS_ERRORS as exc:
+                self._record_failure(exc)
+            else:
+                if self._failures:
+                    with self._lock:
+                        self._failures = 0
+                return result
+        self._count(fallback_calls=1)
+        if written:
+            self._mark_dirty(written, version)
+        return getattr(self._fallback, name)(*args, version=version, **kwargs)
+
+    # ========== CACHE API ==========
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call("add", key, value, timeout, written=[key], version=version)
+
+    def get(self, key, default=None, version=None):
+        value = self._call("get", key, _MISSING, version=version)
+        if value is _MISSING:
+            self._count(misses=1)
+            return default
+        self._count(hits=1)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._call("set", key, value, timeout, written=[key], version=version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call("touch", key, timeout, written=[key], version=version)
+
+    def delete(self, key, version=None):
+        return self._call("delete", key, written=[key], version=version)
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        values = self._call("get_many", keys, version=version)
+        self._count(hits=len(values), misses=len(keys) - len(values))
+        return values
+
+    def has_key(self, key, version=None):
+        return self._call("has_key", key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        return self._call("incr", key, delta, written=[key], version=version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call("set_many", data, timeout, written=data, version=version)
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        self._call("delete_many", keys, written=keys, version=version)
+
+    def clear(self):
+        self._fallback.clear()
+        if self._redis_available():
+            try:
+                return super().clear()
+            except REDIS_ERRORS as exc:
+                self._record_failure(exc)
+        with self._lock:
+            self._dirty_keys.clear()
+            self._dirty_overflow = True
+        return True
+
+    # ========== METRICS ==========
+
+    def metrics(self):
+        """Compteurs de ce processus: appels, succès, échecs, repli et état du circuit"""
+
+        with self._lock:
+            metrics = dict(self._metrics)
+        lookups = metrics.get("hits", 0) + metrics.get("misses", 0)
+        calls = metrics.get("calls", 0)
+        metrics["hit_rate"] = metrics.get("hits", 0) / lookups if lookups else None
+        metrics["miss_rate"] = metrics.get("misses", 0) / lookups if lookups else None
+        metrics["fallback_rate"] = (
+            metrics.get("fallback_calls", 0) / calls if calls else None
+        )
+        metrics["circuit"] = "open" if self.degraded else "closed"
+        return metrics
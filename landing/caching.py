@@ -0,0 +1,119 @@
+import logging
+import math
+import random
+import time
+import uuid
+from typing import Any, NamedTuple
+
+from django.core.cache import cache as default_cache
+
+logger = logging.getLogger("events")
+
+# Recomputing workers hold "<key>:lock" at most this long (seconds)
+RECOMPUTE_LOCK_TIMEOUT = 30
+# How long a worker without any value waits for the one recomputing it
+RECOMPUTE_WAIT = 10
+RECOMPUTE_POLL_INTERVAL = 0.05
+# Expired values stay readable this long, served while they are recomputed
+STALE_TIMEOUT = 60 * 5
+# Probabilistic early refresh: >1 refreshes earlier, <1 closer to expiry
+EARLY_REFRESH_BETA = 1.0
+
+
+class CachedValue(NamedTuple):
+    """Valeur en cache avec son expiration logique et la durée de son calcul"""
+
+    value: Any
+    expires_at: float
+    compute_time: float
+
+
+def _lock_key(key):
+    return f"{key}:lock"
+
+
+def _get_entry(cache, key):
+    entry = cache.get(key)
+    # Values written before this wrapper are treated as missing
+    return entry if isinstance(entry, CachedValue) else None
+
+
+def _needs_refresh(entry):
+    # XFetch: the closer to expiry and the longer the computation, the more
+    # likely a single request refreshes the value before it expires
+    jitter = -entry.compute_time * EARLY_REFRESH_BETA * math.log(1 - random.random())
+    return time.time() + jitter >= entry.expires_at
+
+
+def _acquire(cache, key):
+    token = uuid.uuid4().hex
+    if cache.add(_lock_key(key), token, RECOMPUTE_LOCK_TIMEOUT):
+        return token
+    return None
+
+
+def _release(cache, key, token):
+    # Not atomic, but a lock is only ever taken over once it has expired
+    if cache.get(_lock_key(key)) == token:
+        cache.delete(_lock_key(key))
+
+
+def _compute_and_store(cache, key, compute, timeout):
+    started = time.monotonic()
+    value = compute()
+    compute_time = time.monotonic() - started
+    entry = CachedValue(value, time.time() + timeout, compute_time)
+    cache.set(key, entry, timeout + STALE_TIMEOUT)
+    return value
+
+
+def get_or_compute(key, compute, timeout, cache=default_cache):
+    """Valeur en cache de `key`, calculée par un seul worker à la fois
+
+    While one worker recomputes an expired value under the lock, the others
+    get the stale one; without any value they wait for it, up to
+    RECOMPUTE_WAIT seconds.
+    """
+
+    entry = _get_entry(cache, key)
+    if entry is not None and not _needs_refresh(entry):
+        return entry.value
+
+    token = _acquire(cache, key)
+    if token is None and entry is not None:
+        return entry.value
+
+    deadline = time.monotonic() + RECOMPUTE_WAIT
+    while token is None:
+        if time.monotonic() >= deadline:
+            logger.warning("Cache lock wait timed out for %s, computing anyway", key)
+            return _compute_and_store(cache, key, compute, timeout)
+        time.sleep(RECOMPUTE_POLL_INTERVAL)
+        entry = _get_entry(cache, key)
+        if entry is not None:
+            return entry.value
+        token = _acquire(cache, key)
+
+    try:
+        return _compute_and_store(cache, key, compute, timeout)
+    finally:
+        _release(cache, key, token)
+
+
+def recompute(key, compute, timeout, cache=default_cache):
+    """Recalcule `key` maintenant, après le worker qui le recalcule éventuellement
+
+    Waiting for the lock keeps a computation started before a change was
+    committed from overwriting the fresh value afterwards.
+    """
+
+    deadline = time.monotonic() + RECOMPUTE_LOCK_TIMEOUT
+    token = _acquire(cache, key)
+    while token is None and time.monotonic() < deadline:
+        time.sleep(RECOMPUTE_POLL_INTERVAL)
+        token = _acquire(cache, key)
+    try:
+        return _compute_and_store(cache, key, compute, timeout)
+    finally:
+        if token is not None:
+            _release(cache, key, token)
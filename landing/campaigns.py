@@ -0,0 +1,224 @@
+import datetime
+import logging
+import time
+
+from django.conf import settings
+from django.core import signing
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils import timezone, translation
+
+from .i18n import absolute_url
+from .models import Newsletter, NewsletterCampaign
+
+logger = logging.getLogger("events")
+
+CAMPAIGN_BATCH_SIZE = 500
+# The checkpoint is written for every message, so a campaign whose row has not
+# moved for this long belongs to a crashed worker and can be resumed
+CAMPAIGN_STALE_AFTER = datetime.timedelta(minutes=10)
+UNSUBSCRIBE_SALT = "landing.newsletter.unsubscribe"
+# Rendered once per language, replaced by each subscriber's link when sending
+UNSUBSCRIBE_PLACEHOLDER = "__unsubscribe_url__"
+
+
+class Throttle:
+    """Espace les envois pour respecter le débit autorisé par le fournisseur"""
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate else 0
+        self.next_at = time.monotonic()
+
+    def wait(self):
+        now = time.monotonic()
+        if self.next_at > now:
+            time.sleep(self.next_at - now)
+        self.next_at = max(now, self.next_at) + self.interval
+
+
+# ========== UNSUBSCRIBE ==========
+
+
+def unsubscribe_url(subscriber_id, language):
+    """Lien de désabonnement signé d'un abonné, sans date d'expiration"""
+
+    token = signing.dumps(str(subscriber_id), salt=UNSUBSCRIBE_SALT)
+    with translation.override(language):
+        return absolute_url(reverse("landing:newsletter_unsubscribe", args=[token]))
+
+
+def unsubscribe_token_subscriber(token):
+    """Identifiant de l'abonné d'un lien de désabonnement, ou None s'il est invalide"""
+
+    try:
+        return signing.loads(token, salt=UNSUBSCRIBE_SALT)
+    except signing.BadSignature:
+        return None
+
+
+def unsubscribe_subscriber(subscriber_id):
+    updated = Newsletter.objects.filter(pk=subscriber_id, is_active=True).update(
+        is_active=False, updated_at=timezone.now()
+    )
+    if updated:
+        logger.info("Newsletter subscriber %s unsubscribed", subscriber_id)
+
+
+# ========== SENDING ==========
+
+
+def render_campaign(campaign):
+    """Rend la campagne une seule fois par langue: {langue: (sujet, texte, html)}"""
+
+    rendered = {}
+    for language, _name in settings.LANGUAGES:
+        with translation.override(language):
+            campaign.set_current_language(language)
+            subject = campaign.safe_translation_getter("subject", any_language=True)
+            body = campaign.safe_translation_getter("body", any_language=True)
+            context = {
+                "campaign": campaign,
+                "subject": subject,
+                "body": body,
+                "unsubscribe_url": UNSUBSCRIBE_PLACEHOLDER,
+            }
+            rendered[language] = (
+                subject,
+                render_to_string("emails/newsletter.txt", context),
+                render_to_string("emails/newsletter.html", context),
+            )
+    return rendered
+
+
+def campaign_recipients(campaign):
+    """Abonnés actifs restant à traiter, dans l'ordre du checkpoint"""
+    subscribers = Newsletter.objects.filter(is_active=True).order_by("pk")
+    if campaign.last_subscriber_id:
+        subscribers = subscribers.filter(pk__gt=campaign.last_subscriber_id)
+    return subscribers
+
+
+def _checkpoint(campaign, subscriber_id, sent=0, failed=0):
+    NewsletterCampaign.objects.filter(pk=campaign.pk).update(
+        last_subscriber_id=subscriber_id,
+        sent_count=F("sent_count") + sent,
+        failed_count=F("failed_count") + failed,
+        updated_at=timezone.now(),
+    )
+    campaign.last_subscriber_id = subscriber_id
+
+
+def send_campaign(campaign, batch_size=CAMPAIGN_BATCH_SIZE, rate=None):
+    """Envoie une campagne par lots (pagination par clé) en reprenant au checkpoint"""
+
+    rendered = render_campaign(campaign)
+    default = rendered[settings.LANGUAGE_CODE]
+    throttle = Throttle(settings.NEWSLETTER_SEND_RATE if rate is None else rate)
+    connection = get_connection()
+    try:
+        while True:
+            status = (
+                NewsletterCampaign.objects.filter(pk=campaign.pk)
+                .values_list("status", flat=True)
+                .first()
+            )
+            if status != "sending":
+                logger.info("Campaign %s stopped (%s)", campaign.pk, status)
+                return
+            batch = list(
+                campaign_recipients(campaign).values_list("pk", "email", "language")[
+                    :batch_size
+                ]
+            )
+            if not batch:
+                break
+            outcome = {"sent": 0, "failed": 0}
+            for subscriber_id, email, language in batch:
+                subject, body, html_body = rendered.get(language, default)
+                url = unsubscribe_url(subscriber_id, language)
+                message = EmailMultiAlternatives(
+                    subject,
+                    body.replace(UNSUBSCRIBE_PLACEHOLDER, url),
+                    to=[email],
+                    connection=connection,
+                    # One-click unsubscribe from the mail client (RFC 8058)
+                    headers={
+                        "List-Unsubscribe": f"<{url}>",
+                        "List-Unsubscribe-Post": "List-Unsubscribe=One-Click",
+                    },
+                )
+                message.attach_alternative(
+                    html_body.replace(UNSUBSCRIBE_PLACEHOLDER, url), "text/html"
+                )
+                throttle.wait()
+                # Checkpoint first (with the previous outcome): after a crash the
+                # resumed run may skip this subscriber but never emails them twice
+                _checkpoint(campaign, subscriber_id, **outcome)
+                outcome = {"sent": 0, "failed": 0}
+                try:
+                    connection.open()
+                    connection.send_messages([message])
+                except Exception as exc:
+                    connection.close()
+                    logger.warning(
+                        "Campaign %s to %s failed: %s", campaign.pk, email, exc
+                    )
+                    outcome["failed"] += 1
+                else:
+                    outcome["sent"] += 1
+            _checkpoint(campaign, campaign.last_subscriber_id, **outcome)
+    finally:
+        connection.close()
+
+    NewsletterCampaign.objects.filter(pk=campaign.pk, status="sending").update(
+        status="sent", finished_at=timezone.now(), updated_at=timezone.now()
+    )
+    campaign.refresh_from_db()
+    logger.info(
+        "Campaign %s sent: %s sent, %s failed",
+        campaign.pk,
+        campaign.sent_count,
+        campaign.failed_count,
+    )
+
+
+def claim_next_campaign():
+    """Réserve une campagne programmée, ou une campagne abandonnée par un worker"""
+
+    stale = timezone.now() - CAMPAIGN_STALE_AFTER
+    with transaction.atomic():
+        campaign = (
+            NewsletterCampaign.objects.select_for_update(skip_locked=True)
+            .filter(Q(status="scheduled") | Q(status="sending", updated_at__lt=stale))
+            .order_by("created_at")
+            .first()
+        )
+        if campaign is not None:
+            if campaign.status == "scheduled":
+                campaign.started_at = timezone.now()
+                campaign.total_recipients = Newsletter.objects.filter(
+                    is_active=True
+                ).count()
+            else:
+                logger.info("Resuming campaign %s", campaign.pk)
+            campaign.status = "sending"
+            campaign.save(
+                update_fields=[
+                    "status",
+                    "started_at",
+                    "total_recipients",
+                    "updated_at",
+                ]
+            )
+    return campaign
+
+
+def run_pending_campaigns(batch_size=CAMPAIGN_BATCH_SIZE):
+    count = 0
+    while (campaign := claim_next_campaign()) is not None:
+        send_campaign(campaign, batch_size=batch_size)
+        count += 1
+    return count
@@ -0,0 +1,235 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max, Prefetch
+from django.utils import timezone, translation
+from parler.models import TranslatedFieldsModel
+
+from .caching import get_or_compute, recompute
+from .singletons import get_singleton
+from .models import (
+    EventConfiguration,
+    AboutSection,
+    Speaker,
+    ProgramDay,
+    ProgramSession,
+    Venue,
+    Partner,
+    Hotel,
+    RoomType,
+    LogisticInfo,
+    Contact,
+    FAQ,
+)
+
+logger = logging.getLogger("events")
+
+LANDING_CACHE_PREFIX = "landing:context"
+LANDING_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Modèles dont le contenu alimente la page d'accueil
+LANDING_MODELS = (
+    EventConfiguration,
+    AboutSection,
+    Speaker,
+    ProgramDay,
+    ProgramSession,
+    Venue,
+    Partner,
+    Hotel,
+    RoomType,
+    LogisticInfo,
+    Contact,
+    FAQ,
+)
+
+
+# Sections of the page cached as template fragments ({% cache %} in index.html),
+# each keyed by the language and the version stamp of its content group
+CONTENT_GROUPS = {
+    "program": (Speaker, ProgramDay, ProgramSession),
+    "logistics": (Hotel, RoomType, LogisticInfo),
+    "venues": (EventConfiguration, Venue),
+    "faq": (FAQ,),
+}
+CONTENT_VERSION_PREFIX = "landing:version"
+LAST_MODIFIED_KEY = "landing:last_modified"
+
+
+def landing_cache_key(language_code):
+    return f"{LANDING_CACHE_PREFIX}:{language_code}"
+
+
+def _active_speakers():
+    return Speaker.objects.filter(is_active=True)
+
+
+def build_landing_context():
+    """Construit le contexte complet de la page d'accueil en un nombre fixe de requêtes"""
+
+    # Translations come from the shared cache (translation_cache), loaded for
+    # each queryset in one round-trip: they are not prefetched
+    sessions = ProgramSession.objects.filter(is_active=True).prefetch_related(
+        # Forward relations are prefetched with the base manager otherwise
+        Prefetch("moderator", queryset=Speaker.objects.all()),
+        Prefetch("speakers", queryset=_active_speakers()),
+    )
+    room_types = RoomType.objects.filter(is_active=True)
+    logistic_positions = {
+        value: position
+        for position, (value, _label) in enumerate(LogisticInfo.LOGISTIC_TYPES)
+    }
+
+    return {
+        "event": get_singleton(EventConfiguration),
+        "about": get_singleton(AboutSection),
+        "speakers": list(_active_speakers()),
+        "program_days": list(
+            ProgramDay.objects.filter(is_active=True).prefetch_related(
+                Prefetch("sessions", queryset=sessions)
+            )
+        ),
+        "venues": list(Venue.objects.filter(is_active=True)),
+        "partners": list(Partner.objects.filter(is_active=True)),
+        "hotels": list(
+            Hotel.objects.filter(is_active=True).prefetch_related(
+                Prefetch("room_types", queryset=room_types)
+            )
+        ),
+        # One tab per type, in the order of LOGISTIC_TYPES; types no longer
+        # listed there (older rows) come last instead of breaking the page
+        "logistics": sorted(
+            LogisticInfo.objects.filter(is_active=True),
+            key=lambda info: logistic_positions.get(
+                info.logistic_type, len(logistic_positions)
+            ),
+        ),
+        "contacts": list(Contact.objects.filter(is_active=True)),
+        "faqs": list(FAQ.objects.filter(is_active=True)),
+    }
+
+
+def _landing_context_builder(language_code):
+    def build():
+        with translation.override(language_code):
+            return build_landing_context()
+
+    return build
+
+
+def get_landing_context(language_code=None):
+    """Retourne le contexte de la page d'accueil, mis en cache par langue
+
+    Built by one worker at a time; the others keep the previous context
+    meanwhile (see caching.get_or_compute).
+    """
+
+    language_code = language_code or translation.get_language()
+    return get_or_compute(
+        landing_cache_key(language_code),
+        _landing_context_builder(language_code),
+        LANDING_CACHE_TIMEOUT,
+    )
+
+
+def clear_landing_context():
+    cache.delete_many([landing_cache_key(code) for code, _name in settings.LANGUAGES])
+    logger.debug("Landing page cache cleared")
+
+
+def rebuild_landing_context():
+    """Reconstruit le contexte de chaque langue avec le contenu actuel
+
+    Requests keep getting the previous context meanwhile, so the fragment
+    versions and the last-modified stamp must only change afterwards (see
+    prerender.refresh_landing_pages).
+    """
+    for code, _name in settings.LANGUAGES:
+        recompute(
+            landing_cache_key(code),
+            _landing_context_builder(code),
+            LANDING_CACHE_TIMEOUT,
+        )
+
+
+# ========== FRAGMENT VERSION STAMPS ==========
+
+
+def content_version_key(group):
+    return f"{CONTENT_VERSION_PREFIX}:{group}"
+
+
+def content_group(model):
+    """Groupe de contenu d'un modèle (ou de son modèle de traduction parler)"""
+    if issubclass(model, TranslatedFieldsModel):
+        model = model._meta.get_field("master").related_model
+    for group, models in CONTENT_GROUPS.items():
+        if model in models:
+            return group
+    return None
+
+
+def get_content_versions():
+    """Version courante de chaque groupe, en un seul aller-retour au cache"""
+
+    keys = {group: content_version_key(group) for group in CONTENT_GROUPS}
+    cached = cache.get_many(keys.values())
+    versions = {}
+    missing = {}
+    for group, key in keys.items():
+        versions[group] = cached.get(key)
+        if versions[group] is None:
+            versions[group] = missing[key] = time.time_ns()
+    if missing:
+        cache.set_many(missing, None)
+    return versions
+
+
+def bump_content_version(group):
+    """Invalide les fragments d'un groupe: ils sont rendus à nouveau avec la nouvelle version"""
+    cache.set(content_version_key(group), time.time_ns(), None)
+    logger.debug("Landing fragments of %s invalidated", group)
+
+
+def get_landing_page_context(language_code=None):
+    """Contexte du gabarit index.html: contenu mis en cache et versions des fragments"""
+    # Versions first: a version is only bumped once the context holds the
+    # content it stands for, never the other way round
+    content_versions = get_content_versions()
+    return {
+        **get_landing_context(language_code),
+        "content_versions": content_versions,
+        "fragment_timeout": LANDING_CACHE_TIMEOUT,
+    }
+
+
+# ========== CONDITIONAL GET VALIDATORS ==========
+
+
+def get_landing_last_modified():
+    """Date de dernière modification du contenu public, sans parcourir les tables
+
+    Deletes leave no updated_at behind, so the signals set the cached value on
+    every change; the database is only read when the cache is cold.
+    """
+
+    last_modified = cache.get(LAST_MODIFIED_KEY)
+    if last_modified is None:
+        dates = [
+            model.objects.aggregate(last=Max("updated_at"))["last"]
+            for model in LANDING_MODELS
+        ]
+        last_modified = max(filter(None, dates), default=timezone.now())
+        cache.add(LAST_MODIFIED_KEY, last_modified, None)
+    return last_modified
+
+
+def touch_landing_last_modified():
+    cache.set(LAST_MODIFIED_KEY, timezone.now(), None)
+
+
+def landing_etag(language_code=None):
+    language_code = language_code or translation.get_language()
+    return f"{language_code}-{get_landing_last_modified().timestamp():.6f}"
@@ -0,0 +1,176 @@
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+
+from .models import ContactMessage, Registration
+from .stats import (
+    adjust_stats,
+    reconcile_registration_stats,
+    update_stat_deltas,
+    update_stat_fields,
+)
+
+COUNTER_PREFIX = "counter"
+# Safety net: a drifted counter is recomputed at the latest after this delay
+COUNTER_TIMEOUT = 60 * 60
+
+# name: (model, filter for the database count, same condition on an instance, field)
+COUNTERS = {
+    "registrations_pending": (
+        Registration,
+        Q(status="pending"),
+        lambda obj: obj.status == "pending",
+        "status",
+    ),
+    "messages_unread": (
+        ContactMessage,
+        Q(is_read=False),
+        lambda obj: not obj.is_read,
+        "is_read",
+    ),
+}
+
+
+def counter_key(name):
+    return f"{COUNTER_PREFIX}:{name}"
+
+
+def reconcile_counter(name):
+    """Recalcule un compteur depuis la base et met à jour le cache"""
+    model, condition, _predicate, _field = COUNTERS[name]
+    count = model.objects.filter(condition).count()
+    cache.set(counter_key(name), count, COUNTER_TIMEOUT)
+    return count
+
+
+def reconcile_counters():
+    return {name: reconcile_counter(name) for name in COUNTERS}
+
+
+def get_counter(name):
+    count = cache.get(counter_key(name))
+    if count is None:
+        count = reconcile_counter(name)
+    return count
+
+
+def adjust_counter(name, delta):
+    """Applique une variation au compteur une fois la transaction validée"""
+    if not delta:
+        return
+
+    def apply():
+        try:
+            cache.incr(counter_key(name), delta)
+        except ValueError:
+            # Not cached yet: the next read recomputes it from the database
+            pass
+
+    transaction.on_commit(apply)
+
+
+def update_with_counters(queryset, **values):
+    """queryset.update() qui répercute la variation sur les compteurs concernés
+
+    The previous values of the counted fields come from one grouped query on
+    the selection, the new ones from `values`. Registration statistics
+    (landing.stats) are adjusted the same way.
+    """
+
+    model = queryset.model
+    tracked = {
+        name: predicate
+        for name, (counter_model, _condition, predicate, field) in COUNTERS.items()
+        if counter_model is model and field in values
+    }
+    stat_fields = update_stat_fields(model, values)
+    fields = sorted({COUNTERS[name][3] for name in tracked} | set(stat_fields))
+    if not fields:
+        return queryset.update(**values)
+
+    if any(hasattr(values[field], "resolve_expression") for field in fields):
+        # New values computed by the database: recounted once committed
+        updated = queryset.update(**values)
+        for name in tracked:
+            _forget_counter(name)
+        if stat_fields:
+            transaction.on_commit(reconcile_registration_stats)
+        return updated
+
+    with transaction.atomic():
+        rows = queryset.order_by().values(*fields).annotate(rows=Count("pk"))
+        groups = [
+            ({field: row[field] for field in fields}, row["rows"]) for row in rows
+        ]
+        updated = queryset.update(**values)
+
+        for name, predicate in tracked.items():
+            delta = 0
+            for previous, count in groups:
+                before = SimpleNamespace(**previous)
+                after = SimpleNamespace(**{**previous, **values})
+                delta += count * (int(predicate(after)) - int(predicate(before)))
+            adjust_counter(name, delta)
+        if stat_fields:
+            # Last, so the shared statistic rows are only locked until commit
+            stat_groups = [
+                ({field: previous[field] for field in stat_fields}, count)
+                for previous, count in groups
+            ]
+            adjust_stats(update_stat_deltas(stat_groups, values))
+    return updated
+
+
+# ========== BADGES (UNFOLD["SIDEBAR"]) ==========
+
+
+def pending_registrations_badge(request):
+    return get_counter("registrations_pending")
+
+
+def unread_messages_badge(request):
+    return get_counter("messages_unread")
+
+
+# ========== MODEL HOOKS (see signals.py) ==========
+
+
+def remember_counter_state(instance):
+    deferred = instance.get_deferred_fields()
+    instance._counter_state = {
+        name: None if field in deferred else predicate(instance)
+        for name, (model, _condition, predicate, field) in COUNTERS.items()
+        if model is type(instance)
+    }
+
+
+def _forget_counter(name):
+    # Unknown previous state: drop the cached value instead of guessing
+    transaction.on_commit(lambda: cache.delete(counter_key(name)))
+
+
+def counters_on_save(instance, created):
+    previous = getattr(instance, "_counter_state", {})
+    for name, (model, _condition, predicate, _field) in COUNTERS.items():
+        if model is not type(instance):
+            continue
+        before = False if created else previous.get(name)
+        if before is None:
+            _forget_counter(name)
+        else:
+            adjust_counter(name, int(predicate(instance)) - int(before))
+    remember_counter_state(instance)
+
+
+def counters_on_delete(instance):
+    previous = getattr(instance, "_counter_state", {})
+    for name, (model, _condition, _predicate, _field) in COUNTERS.items():
+        if model is not type(instance):
+            continue
+        before = previous.get(name)
+        if before is None:
+            _forget_counter(name)
+        elif before:
+            adjust_counter(name, -1)
@@ -0,0 +1,192 @@
+import logging
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.utils import translation
+from django_countries import countries
+
+from .models import Registration, RegistrationCountryCount
+
+logger = logging.getLogger("events")
+
+# Spellings seen in registrations that the country name tables do not contain
+COUNTRY_ALIASES = {
+    "ivory coast": "CI",
+    "rci": "CI",
+    "drc": "CD",
+    "rdc": "CD",
+    "dr congo": "CD",
+    "rd congo": "CD",
+    "congo kinshasa": "CD",
+    "congo brazzaville": "CG",
+    "usa": "US",
+    "united states of america": "US",
+    "etats unis": "US",
+    "uk": "GB",
+    "england": "GB",
+    "great britain": "GB",
+    "uae": "AE",
+    "swaziland": "SZ",
+    "cape verde": "CV",
+    "gambia": "GM",
+    "the gambia": "GM",
+    "sao tome": "ST",
+    "tanzania": "TZ",
+    "guinea bissau": "GW",
+}
+
+
+def _lookup_key(value):
+    # Case, accents and punctuation are ignored: "Côte-d'Ivoire" == "cote d ivoire"
+    text = unicodedata.normalize("NFKD", str(value)).encode("ascii", "ignore")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text.decode().lower()).split())
+
+
+@lru_cache(maxsize=None)
+def _country_lookup():
+    lookup = {_lookup_key(alias): code for alias, code in COUNTRY_ALIASES.items()}
+    for language_code, _name in settings.LANGUAGES:
+        with translation.override(language_code):
+            for country in countries:
+                lookup.setdefault(_lookup_key(country.name), country.code)
+    for code in countries.countries:
+        alpha3, numeric = countries.alt_codes[code]
+        lookup[code.lower()] = lookup[alpha3.lower()] = code
+        if numeric:
+            lookup[f"{numeric:03d}"] = lookup[str(numeric)] = code
+    return lookup
+
+
+def normalize_country(value):
+    """Code ISO 3166-1 alpha-2 d'un pays saisi librement (nom FR/EN, code), ou None"""
+    return _country_lookup().get(_lookup_key(value or ""))
+
+
+# ========== FACET COUNTS ==========
+# One row per country in RegistrationCountryCount, changed in the same
+# transaction as the registrations, read by the admin filter and
+# RegistrationFilterForm instead of a DISTINCT over the registrations
+
+
+def adjust_country_count(code, delta):
+    if not code or not delta:
+        return
+    code = str(code)
+    updated = RegistrationCountryCount.objects.filter(country=code).update(
+        count=F("count") + delta
+    )
+    if updated or delta < 0:
+        return
+    try:
+        with transaction.atomic():
+            RegistrationCountryCount.objects.create(country=code, count=delta)
+    except IntegrityError:
+        # Created by a concurrent registration in the meantime
+        adjust_country_count(code, delta)
+
+
+def adjust_country_counts(codes):
+    """Répercute une liste de pays ajoutés (bulk_create) sur les compteurs"""
+    for code, count in Counter(map(str, codes)).items():
+        adjust_country_count(code, count)
+
+
+def reconcile_country_counts():
+    """Recalcule les compteurs par pays depuis les inscriptions"""
+
+    counts = (
+        Registration.objects.order_by()
+        .values_list("country")
+        .annotate(count=Count("pk"))
+    )
+    with transaction.atomic():
+        RegistrationCountryCount.objects.all().delete()
+        RegistrationCountryCount.objects.bulk_create(
+            RegistrationCountryCount(country=code, count=count)
+            for code, count in counts
+            # Values left over from before the backfill are not counted
+            if code in countries
+        )
+    return RegistrationCountryCount.objects.count()
+
+
+def country_facets():
+    """(code, nom, nombre) des pays ayant des inscriptions, triés par nom"""
+
+    facets = [
+        (row.country.code, row.country.name, row.count)
+        for row in RegistrationCountryCount.objects.filter(count__gt=0)
+    ]
+    return sorted(facets, key=lambda facet: _lookup_key(facet[1]))
+
+
+# ========== BACKFILL ==========
+
+
+def normalize_registration_countries(dry_run=False):
+    """Remplace les pays saisis librement par leur code ISO
+
+    Returns the number of updated registrations and the values that could not
+    be resolved, with their number of rows.
+    """
+
+    updated = 0
+    unresolved = {}
+    values = (
+        Registration.objects.order_by()
+        .values_list("country")
+        .annotate(count=Count("pk"))
+    )
+    for value, count in values:
+        code = normalize_country(value)
+        if code is None:
+            unresolved[value] = count
+        elif code != value and not dry_run:
+            updated += Registration.objects.filter(country=value).update(country=code)
+        elif code != value:
+            updated += count
+
+    if not dry_run:
+        reconcile_country_counts()
+    logger.info(
+        "Registration countries normalized: %s updated, %s unresolved value(s)%s",
+        updated,
+        len(unresolved),
+        " (dry run)" if dry_run else "",
+    )
+    return updated, unresolved
+
+
+# ========== MODEL HOOKS (see signals.py) ==========
+
+
+def remember_country(instance):
+    deferred = "country" in instance.get_deferred_fields()
+    instance._facet_country = None if deferred else str(instance.country)
+
+
+def country_on_save(instance, created):
+    previous = getattr(instance, "_facet_country", None)
+    current = str(instance.country)
+    if created:
+        adjust_country_count(current, 1)
+    elif previous is None:
+        # Previous value unknown (deferred field): recount once committed
+        transaction.on_commit(reconcile_country_counts)
+    elif previous != current:
+        adjust_country_count(previous, -1)
+        adjust_country_count(current, 1)
+    instance._facet_country = current
+
+
+def country_on_delete(instance):
+    previous = getattr(instance, "_facet_country", None)
+    if previous is None:
+        transaction.on_commit(reconcile_country_counts)
+    else:
+        adjust_country_count(previous, -1)
@@ -0,0 +1,160 @@
+import csv
+import datetime
+import json
+import logging
+import tempfile
+import uuid
+
+from django.apps import apps
+from django.contrib import admin
+from django.core.files import File
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.test import RequestFactory
+from django.utils import timezone
+from openpyxl import Workbook
+
+from .models import ExportJob
+
+logger = logging.getLogger("events")
+
+EXPORT_CHUNK_SIZE = 2000
+PROGRESS_EVERY = 5000
+# A running job whose progress has not moved for this long lost its worker
+EXPORT_STALE_AFTER = datetime.timedelta(minutes=15)
+
+STREAMING_FORMATS = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+
+
+class Echo:
+    """Pseudo-fichier dont write() retourne la valeur, pour csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+def export_rows(queryset, fields):
+    return queryset.values_list(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def stream_csv(queryset, fields):
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in export_rows(queryset, fields):
+        yield writer.writerow(row)
+
+
+def stream_jsonl(queryset, fields):
+    for row in export_rows(queryset, fields):
+        yield json.dumps(dict(zip(fields, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+def streaming_export_response(queryset, fields, file_format, filename):
+    """Réponse streamée qui lit le queryset par lots au lieu de tout charger en mémoire"""
+
+    stream = stream_csv if file_format == "csv" else stream_jsonl
+    response = StreamingHttpResponse(
+        stream(queryset, fields), content_type=STREAMING_FORMATS[file_format]
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{file_format}"'
+    return response
+
+
+def _xlsx_value(value):
+    # openpyxl cannot write timezone-aware datetimes or UUIDs
+    if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        return timezone.make_naive(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def write_xlsx(queryset, fields, file, on_progress=None):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(fields)
+    processed = 0
+    for row in export_rows(queryset, fields):
+        sheet.append([_xlsx_value(value) for value in row])
+        processed += 1
+        if on_progress and processed % PROGRESS_EVERY == 0:
+            on_progress(processed)
+    workbook.save(file)
+    return processed
+
+
+def get_export_queryset(job):
+    """Reconstruit le queryset filtré de la liste d'administration d'origine"""
+
+    model = apps.get_model(job.model_label)
+    model_admin = admin.site._registry[model]
+    request = RequestFactory().get(f"/?{job.query_string}")
+    request.user = job.requested_by
+    return (
+        model_admin.get_export_queryset(request),
+        model_admin.get_streaming_export_fields(),
+    )
+
+
+def run_export_job(job):
+    def on_progress(processed):
+        # updated_at doubles as the heartbeat checked by claim_next_export_job
+        ExportJob.objects.filter(pk=job.pk).update(
+            processed_rows=processed, updated_at=timezone.now()
+        )
+
+    try:
+        queryset, fields = get_export_queryset(job)
+        job.total_rows = queryset.count()
+        ExportJob.objects.filter(pk=job.pk).update(
+            total_rows=job.total_rows, updated_at=timezone.now()
+        )
+        with tempfile.TemporaryFile() as tmp:
+            job.processed_rows = write_xlsx(queryset, fields, tmp, on_progress)
+            tmp.seek(0)
+            name = job.model_label.split(".")[-1]
+            job.file.save(
+                f"{name}-{timezone.now():%Y%m%d-%H%M%S}.xlsx", File(tmp), save=False
+            )
+    except Exception as exc:
+        logger.exception("Export job %s failed", job.pk)
+        job.status = "failed"
+        job.error = str(exc)
+    else:
+        job.status = "done"
+    job.finished_at = timezone.now()
+    job.save()
+    return job
+
+
+def claim_next_export_job():
+    """Réserve un export en attente, ou un export abandonné par un worker"""
+
+    stale = timezone.now() - EXPORT_STALE_AFTER
+    with transaction.atomic():
+        job = (
+            ExportJob.objects.select_for_update(skip_locked=True)
+            .filter(Q(status="pending") | Q(status="running", updated_at__lt=stale))
+            .order_by("created_at")
+            .first()
+        )
+        if job is not None:
+            if job.status == "running":
+                logger.info("Restarting stale export job %s", job.pk)
+            job.status = "running"
+            job.processed_rows = 0
+            job.save(update_fields=["status", "processed_rows", "updated_at"])
+    return job
+
+
+def run_pending_export_jobs():
+    count = 0
+    while (job := claim_next_export_job()) is not None:
+        run_export_job(job)
+        count += 1
+    return count
@@ -1,5 +1,7 @@
 from django import forms
 from django.core.exceptions import ValidationError
+from django.utils.translation import get_language
+from parler.forms import TranslatableModelForm
 from .models import (
     Registration,
     ContactMessage,
@@ -8,6 +10,8 @@ from .models import (
     ProgramSession,
     Hotel,
 )
+from .countries import country_facets, normalize_country
+from .search import search
 import re
 
 
@@ -20,6 +24,18 @@ class RegistrationForm(forms.ModelForm):
         label="I accept the terms and conditions",
         widget=forms.CheckboxInput(attrs={"class": "form-check-input"}),
     )
+    # Free text, stored as an ISO code (see clean_country)
+    country = forms.CharField(
+        max_length=255,
+        label="Country / Region *",
+        widget=forms.TextInput(
+            attrs={
+                "class": "form-control",
+                "placeholder": "Country / Region",
+                "required": True,
+            }
+        ),
+    )
 
     class Meta:
         model = Registration
@@ -62,13 +78,6 @@ class RegistrationForm(forms.ModelForm):
             "city": forms.TextInput(
                 attrs={"class": "form-control", "placeholder": "City / Location"}
             ),
-            "country": forms.TextInput(
-                attrs={
-                    "class": "form-control",
-                    "placeholder": "Country / Region",
-                    "required": True,
-                }
-            ),
             "email": forms.EmailInput(
                 attrs={
                     "class": "form-control",
@@ -119,7 +128,6 @@ class RegistrationForm(forms.ModelForm):
             "organization": "Organization / Company *",
             "position": "Position / Title",
             "city": "City / Location",
-            "country": "Country / Region *",
             "email": "Email Address *",
             "phone": "Phone Number *",
             "arrival_date": "Arrival Date",
@@ -135,10 +143,16 @@ class RegistrationForm(forms.ModelForm):
     def clean_email(self):
         email = self.cleaned_data.get("email")
         # Check if email is already registered
-        if Registration.objects.filter(email=email).exists():
+        if Registration.objects.filter(email__lower=email.lower()).exists():
             raise ValidationError("This email address is already registered.")
         return email.lower()
 
+    def clean_country(self):
+        country = normalize_country(self.cleaned_data.get("country"))
+        if country is None:
+            raise ValidationError("Please enter a valid country.")
+        return country
+
     def clean_phone(self):
         phone = self.cleaned_data.get("phone")
         # Remove spaces and special characters for validation
@@ -238,12 +252,17 @@ class NewsletterForm(forms.ModelForm):
 
     def clean_email(self):
         email = self.cleaned_data.get("email").lower()
-        if Newsletter.objects.filter(email=email).exists():
+        if Newsletter.objects.filter(email__lower=email).exists():
             raise ValidationError("This email is already subscribed.")
         return email
 
+    def save(self, commit=True):
+        # Campaigns are sent in the language the visitor subscribed in
+        self.instance.language = get_language()
+        return super().save(commit)
 
-class SpeakerForm(forms.ModelForm):
+
+class SpeakerForm(TranslatableModelForm):
     """Formulaire pour devenir speaker"""
 
     class Meta:
@@ -392,6 +411,12 @@ class SearchForm(forms.Form):
         ),
     )
 
+    def results(self):
+        """Résultats classés de la recherche (landing.search)"""
+        if not self.is_valid():
+            return []
+        return search(self.cleaned_data["query"], get_language())
+
 
 class RegistrationFilterForm(forms.Form):
     """Formulaire de filtrage des inscriptions (Admin)"""
@@ -410,12 +435,10 @@ class RegistrationFilterForm(forms.Form):
         widget=forms.Select(attrs={"class": "form-select"}),
     )
 
-    country = forms.CharField(
-        max_length=255,
+    # Choices: countries that have registrations, with their counts
+    country = forms.ChoiceField(
         required=False,
-        widget=forms.TextInput(
-            attrs={"class": "form-control", "placeholder": "Filter by country"}
-        ),
+        widget=forms.Select(attrs={"class": "form-select"}),
     )
 
     date_from = forms.DateField(
@@ -439,3 +462,30 @@ class RegistrationFilterForm(forms.Form):
             ],
         ),
     )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["country"].choices = [("", "All Countries")] + [
+            (code, f"{name} ({count})") for code, name, count in country_facets()
+        ]
+
+
+class RegistrationBulkImportForm(forms.Form):
+    """Formulaire d'import en masse des inscriptions (Admin)"""
+
+    import_file = forms.FileField(
+        label="Spreadsheet (.xlsx)",
+        widget=forms.FileInput(attrs={"class": "form-control", "accept": ".xlsx"}),
+    )
+
+    dry_run = forms.BooleanField(
+        required=False,
+        label="Validate only (do not create registrations)",
+        widget=forms.CheckboxInput(attrs={"class": "form-check-input"}),
+    )
+
+    def clean_import_file(self):
+        import_file = self.cleaned_data.get("import_file")
+        if import_file and not import_file.name.lower().endswith(".xlsx"):
+            raise ValidationError("Only .xlsx files are supported.")
+        return import_file
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.urls import reverse, translate_url
+from django.utils import translation
+from django.utils.translation.trans_real import parse_accept_lang_header
+
+
+def accepted_language(request):
+    """Langue du site préférée par le navigateur, d'après Accept-Language seul"""
+
+    # The language cookie is ignored on purpose: responses chosen from it
+    # would have to vary on Cookie
+    header = request.headers.get("Accept-Language", "")
+    for language_code, _quality in parse_accept_lang_header(header):
+        if language_code == "*":
+            break
+        try:
+            return translation.get_supported_language_variant(language_code)
+        except LookupError:
+            continue
+    return settings.LANGUAGE_CODE
+
+
+def absolute_url(path):
+    return settings.SITE_URL.rstrip("/") + path
+
+
+def language_alternates(path=None):
+    """(code, chemin) d'une page dans chaque langue du site (accueil par défaut)"""
+
+    path = path or reverse("landing:index")
+    return [(code, translate_url(path, code)) for code, _name in settings.LANGUAGES]
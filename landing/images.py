@@ -0,0 +1,185 @@
+import logging
+import posixpath
+from io import BytesIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from PIL import ExifTags, Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger("events")
+
+# name: target width in pixels
+IMAGE_SIZES = {
+    "thumb": 160,
+    "card": 480,
+    "hero": 1600,
+}
+# format: (Pillow format, extension, save options)
+IMAGE_FORMATS = {
+    "webp": ("WEBP", "webp", {"quality": 80, "method": 6}),
+    "jpeg": ("JPEG", "jpg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+VARIANTS_DIR = "variants"
+# Variants are named after the original, which gets a new name when replaced:
+# their metadata (or the lack of them) stays valid as long as the file exists
+VARIANTS_CACHE_TIMEOUT = None
+
+# model label: image fields that get derivatives
+IMAGE_FIELDS = {
+    "landing.EventConfiguration": ("logo", "favicon"),
+    "landing.AboutSection": ("comptroller_photo",),
+    "landing.Speaker": ("photo",),
+    "landing.Venue": ("image",),
+    "landing.Partner": ("logo",),
+    "landing.Hotel": ("image",),
+}
+
+
+def variant_name(name, size, fmt):
+    """speakers/jane.png -> speakers/variants/jane.png-480.webp"""
+    # The whole file name, extension included: jane.jpg and jane.png can
+    # share a directory without sharing variants
+    directory, filename = posixpath.split(name)
+    extension = IMAGE_FORMATS[fmt][1]
+    return posixpath.join(
+        directory, VARIANTS_DIR, f"{filename}-{IMAGE_SIZES[size]}.{extension}"
+    )
+
+
+def _cache_key(name):
+    return f"image:variants:{name}"
+
+
+def _encode(image, fmt):
+    pillow_format, _extension, options = IMAGE_FORMATS[fmt]
+    if pillow_format == "JPEG" and image.mode != "RGB":
+        # JPEG has no alpha channel: flatten transparent logos on white
+        background = Image.new("RGB", image.size, "white")
+        background.paste(
+            image, mask=image.getchannel("A") if "A" in image.mode else None
+        )
+        image = background
+    buffer = BytesIO()
+    image.save(buffer, pillow_format, **options)
+    return ContentFile(buffer.getvalue())
+
+
+def _oriented_width(image):
+    """Largeur de l'image une fois redressée, lue dans l'en-tête sans décoder"""
+    # Orientations 5 to 8 are quarter turns: exif_transpose swaps the sides
+    if image.getexif().get(ExifTags.Base.Orientation) in (5, 6, 7, 8):
+        return image.height
+    return image.width
+
+
+def _target_sizes(width):
+    # Never upscale: small originals only get the sizes they can fill,
+    # and at least the smallest one
+    sizes = list(IMAGE_SIZES)
+    return [size for size in sizes if size == sizes[0] or IMAGE_SIZES[size] <= width]
+
+
+def _stored_width(storage, name):
+    with storage.open(name, "rb") as file, Image.open(file) as image:
+        return image.width
+
+
+def generate_variants(fieldfile, force=False):
+    """Crée les dérivés WebP et JPEG d'une image: {taille: {"width", format: nom}}
+
+    The original is only decoded when a variant is missing from the storage
+    (or with force): otherwise the headers are enough.
+    """
+
+    storage = fieldfile.storage
+    variants = {}
+    try:
+        with fieldfile.open("rb"), Image.open(fieldfile) as original:
+            names = {
+                size: {
+                    fmt: variant_name(fieldfile.name, size, fmt)
+                    for fmt in IMAGE_FORMATS
+                }
+                for size in _target_sizes(_oriented_width(original))
+            }
+            missing = {
+                size
+                for size, formats in names.items()
+                if force or not all(storage.exists(name) for name in formats.values())
+            }
+            if missing:
+                original = ImageOps.exif_transpose(original)
+                if original.mode not in ("RGB", "RGBA"):
+                    original = original.convert(
+                        "RGBA" if "transparency" in original.info else "RGB"
+                    )
+            for size, formats in names.items():
+                if size not in missing:
+                    width = _stored_width(storage, formats["webp"])
+                    variants[size] = {"width": width, **formats}
+                    continue
+                width = IMAGE_SIZES[size]
+                resized = original.copy()
+                resized.thumbnail((width, width * 4), Image.LANCZOS)
+                for fmt, name in formats.items():
+                    if storage.exists(name):
+                        storage.delete(name)
+                    storage.save(name, _encode(resized, fmt))
+                variants[size] = {"width": resized.width, **formats}
+    except (FileNotFoundError, UnidentifiedImageError, OSError) as exc:
+        # Cached as well: a missing or broken original is not reopened on
+        # every page view, until a new upload gives the field another name
+        logger.warning("Cannot build variants for %s: %s", fieldfile.name, exc)
+        variants = {}
+
+    cache.set(_cache_key(fieldfile.name), variants, VARIANTS_CACHE_TIMEOUT)
+    return variants
+
+
+def image_variants(fieldfile):
+    """Dérivés d'une image, générés au premier accès puis mis en cache"""
+
+    if not fieldfile:
+        return {}
+    variants = cache.get(_cache_key(fieldfile.name))
+    if variants is None:
+        variants = generate_variants(fieldfile)
+    return variants
+
+
+def variant_url(fieldfile, size, fmt="webp"):
+    """URL du dérivé demandé, ou de l'image originale s'il n'existe pas"""
+
+    if not fieldfile:
+        return ""
+    variants = image_variants(fieldfile)
+    if size not in variants:
+        # Small originals stop at their largest generated size
+        size = next(reversed(variants), None)
+    if size is None:
+        return fieldfile.url
+    return fieldfile.storage.url(variants[size][fmt])
+
+
+def srcset(fieldfile, fmt="webp"):
+    """Valeur d'attribut srcset: "url 160w, url 480w, ..." """
+
+    variants = image_variants(fieldfile)
+    storage = fieldfile.storage if fieldfile else None
+    return ", ".join(
+        f"{storage.url(variant[fmt])} {variant['width']}w"
+        for variant in variants.values()
+    )
+
+
+def generate_instance_variants(instance, force=False):
+    """Génère les dérivés de tous les champs image suivis d'une instance"""
+    for field in IMAGE_FIELDS.get(instance._meta.label, ()):
+        fieldfile = getattr(instance, field)
+        if not fieldfile:
+            continue
+        if force:
+            generate_variants(fieldfile, force=True)
+        else:
+            # Cached after the first run, so re-saving an instance costs nothing
+            image_variants(fieldfile)
@@ -0,0 +1,206 @@
+import logging
+from itertools import islice
+
+import pandas as pd
+from django.db import transaction
+from openpyxl import load_workbook
+
+from .counters import adjust_counter
+from .countries import adjust_country_counts, normalize_country
+from .stats import add_registrations_to_stats
+from .forms import RegistrationForm
+from .mail import registration_confirmation
+from .models import OutboxEmail, Registration, RegistrationCounter
+
+logger = logging.getLogger("events")
+
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_FIELDS = RegistrationForm.Meta.fields
+REQUIRED_FIELDS = ["fullname", "organization", "country", "email", "phone"]
+DATE_FIELDS = ["arrival_date", "departure_date"]
+BOOLEAN_FIELDS = [
+    "needs_visa_assistance",
+    "interested_in_panels",
+    "interested_in_capacity_building",
+    "interested_in_networking",
+    "receive_updates",
+]
+TEXT_FIELDS = [f for f in IMPORT_FIELDS if f not in DATE_FIELDS + BOOLEAN_FIELDS]
+
+PHONE_REGEX = r"^\+?1?\d{9,15}$"
+EMAIL_REGEX = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+TRUE_VALUES = {"1", "true", "yes", "y", "oui", "x"}
+FALSE_VALUES = {"0", "false", "no", "n", "non"}
+
+
+class ImportResult:
+    """Bilan d'un import en masse"""
+
+    def __init__(self):
+        self.total = 0
+        self.created = 0
+        self.errors = []  # (row number, message)
+
+    @property
+    def skipped(self):
+        return len(self.errors)
+
+
+def iter_xlsx_rows(file, sheet_name=None):
+    """Lit un fichier .xlsx ligne par ligne et retourne (numéro de ligne, dict)"""
+
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.active
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        aliases = _header_aliases()
+        columns = []
+        for cell in header:
+            name = str(cell or "").strip().lower()
+            columns.append(aliases.get(name, name))
+        for row_number, values in enumerate(rows, start=2):
+            if not any(value not in (None, "") for value in values):
+                continue
+            yield row_number, dict(zip(columns, values))
+    finally:
+        workbook.close()
+
+
+def _header_aliases():
+    # Accept both field names and their verbose names ("Full Name") as headers
+    return {
+        str(Registration._meta.get_field(field).verbose_name).lower(): field
+        for field in IMPORT_FIELDS
+    }
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _to_bool(series, default):
+    values = series.fillna("").astype(str).str.strip().str.lower()
+    result = pd.Series(default, index=series.index)
+    result[values.isin(TRUE_VALUES)] = True
+    result[values.isin(FALSE_VALUES)] = False
+    return result
+
+
+def normalize_chunk(rows, seen_emails):
+    """Valide et normalise un lot de lignes, retourne (DataFrame valide, erreurs)"""
+
+    row_numbers = [row_number for row_number, _values in rows]
+    df = pd.DataFrame(
+        [values for _row_number, values in rows],
+        index=row_numbers,
+        columns=IMPORT_FIELDS,
+        dtype=object,
+    )
+    errors = pd.Series("", index=df.index)
+
+    def flag(mask, message):
+        errors[mask & (errors == "")] = message
+
+    for field in TEXT_FIELDS:
+        df[field] = df[field].fillna("").astype(str).str.strip()
+
+    for field in REQUIRED_FIELDS:
+        flag(df[field] == "", f"Missing required field: {field}.")
+
+    countries = df["country"].map(normalize_country)
+    flag(countries.isna(), "Unknown country.")
+    df["country"] = countries.fillna("")
+
+    for field in TEXT_FIELDS:
+        max_length = Registration._meta.get_field(field).max_length
+        if max_length:
+            flag(df[field].str.len() > max_length, f"{field} is too long.")
+
+    df["email"] = df["email"].str.lower()
+    flag(~df["email"].str.match(EMAIL_REGEX), "Enter a valid email address.")
+
+    df["phone"] = df["phone"].str.replace(r"[^\d+]", "", regex=True)
+    flag(
+        ~df["phone"].str.match(PHONE_REGEX),
+        "Please enter a valid phone number (9-15 digits).",
+    )
+
+    for field in DATE_FIELDS:
+        raw = df[field]
+        parsed = pd.to_datetime(raw, errors="coerce", format="mixed")
+        flag(raw.notna() & (raw != "") & parsed.isna(), f"Invalid date: {field}.")
+        df[field] = parsed
+    flag(
+        df["departure_date"] <= df["arrival_date"],
+        "Departure date must be after arrival date.",
+    )
+
+    for field in BOOLEAN_FIELDS:
+        default = Registration._meta.get_field(field).default
+        df[field] = _to_bool(df[field], default)
+
+    flag(df["email"].duplicated(), "Duplicate email in the file.")
+    flag(df["email"].isin(seen_emails), "Duplicate email in the file.")
+    existing = set(
+        email.lower()
+        for email in Registration.objects.filter(
+            email__lower__in=df.loc[errors == "", "email"].unique().tolist()
+        ).values_list("email", flat=True)
+    )
+    flag(df["email"].isin(existing), "This email address is already registered.")
+
+    valid = df[errors == ""].copy()
+    for field in DATE_FIELDS:
+        valid[field] = [
+            None if pd.isna(value) else value.date() for value in valid[field]
+        ]
+    return valid, list(errors[errors != ""].items())
+
+
+def import_registrations(
+    file, chunk_size=IMPORT_CHUNK_SIZE, dry_run=False, sheet_name=None
+):
+    """Importe des inscriptions depuis un fichier .xlsx par lots avec bulk_create"""
+
+    result = ImportResult()
+    seen_emails = set()
+
+    for rows in _chunks(iter_xlsx_rows(file, sheet_name), chunk_size):
+        result.total += len(rows)
+        valid, errors = normalize_chunk(rows, seen_emails)
+        result.errors.extend(errors)
+        seen_emails.update(valid["email"])
+        if valid.empty or dry_run:
+            continue
+
+        numbers = RegistrationCounter.allocate(count=len(valid))
+        registrations = [
+            Registration(registration_number=number, **record)
+            for number, record in zip(numbers, valid.to_dict("records"))
+        ]
+        with transaction.atomic():
+            Registration.objects.bulk_create(registrations, batch_size=chunk_size)
+            # bulk_create sends no post_save: new rows are all pending and the
+            # confirmations are queued here instead of in signals.py
+            adjust_counter("registrations_pending", len(registrations))
+            adjust_country_counts(r.country for r in registrations)
+            add_registrations_to_stats(registrations)
+            OutboxEmail.objects.bulk_create(
+                [registration_confirmation(r) for r in registrations],
+                batch_size=chunk_size,
+            )
+        result.created += len(registrations)
+
+    logger.info(
+        "Bulk registration import: %s rows, %s created, %s skipped%s",
+        result.total,
+        result.created,
+        result.skipped,
+        " (dry run)" if dry_run else "",
+    )
+    return result
@@ -0,0 +1,162 @@
+import datetime
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.template import TemplateDoesNotExist
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+logger = logging.getLogger("events")
+
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_MAX_ATTEMPTS = 6
+OUTBOX_RETRY_BASE = 60  # seconds, doubled after each failed attempt
+OUTBOX_RETRY_MAX = 60 * 60
+# A message left in "sending" longer than this belongs to a crashed worker
+OUTBOX_STALE_AFTER = datetime.timedelta(minutes=15)
+
+
+# ========== QUEUEING ==========
+
+
+def build_email(to, subject, template_name, context, reference="", reply_to=""):
+    """Prépare un OutboxEmail à partir des gabarits emails/<nom>.txt (et .html)"""
+
+    try:
+        html_body = render_to_string(f"emails/{template_name}.html", context)
+    except TemplateDoesNotExist:
+        html_body = ""
+    return OutboxEmail(
+        to=to if isinstance(to, str) else ", ".join(to),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        reply_to=reply_to,
+        subject=subject,
+        body=render_to_string(f"emails/{template_name}.txt", context),
+        html_body=html_body,
+        reference=reference,
+    )
+
+
+def queue_email(email):
+    """Enregistre l'e-mail dans la transaction courante, envoyé par send_outbox"""
+    email.save()
+    return email
+
+
+def registration_confirmation(registration):
+    return build_email(
+        registration.email,
+        f"Registration received - {registration.registration_number}",
+        "registration_confirmation",
+        {"registration": registration},
+        reference=registration.registration_number,
+    )
+
+
+def contact_reply(message):
+    return build_email(
+        message.email,
+        f"Re: {message.get_subject_display()}",
+        "contact_reply",
+        {"message": message},
+        reference=str(message.pk),
+        reply_to=settings.ADMIN_EMAIL,
+    )
+
+
+# ========== DISPATCH ==========
+
+
+def _retry_delay(attempts):
+    return datetime.timedelta(
+        seconds=min(OUTBOX_RETRY_BASE * 2 ** (attempts - 1), OUTBOX_RETRY_MAX)
+    )
+
+
+def _to_message(email, connection):
+    message = EmailMultiAlternatives(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email or settings.DEFAULT_FROM_EMAIL,
+        to=email.recipients,
+        reply_to=[email.reply_to] if email.reply_to else None,
+        connection=connection,
+    )
+    if email.html_body:
+        message.attach_alternative(email.html_body, "text/html")
+    return message
+
+
+def release_stale_emails():
+    return OutboxEmail.objects.filter(
+        status="sending", updated_at__lt=timezone.now() - OUTBOX_STALE_AFTER
+    ).update(status="pending", updated_at=timezone.now())
+
+
+def claim_batch(batch_size=OUTBOX_BATCH_SIZE):
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(status="pending", next_attempt_at__lte=now)
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        OutboxEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+            status="sending", updated_at=now
+        )
+    return emails
+
+
+def send_batch(emails):
+    """Envoie un lot sur une seule connexion SMTP et enregistre le statut de chacun"""
+
+    sent = 0
+    connection = get_connection()
+    try:
+        for email in emails:
+            email.attempts += 1
+            try:
+                connection.open()
+                connection.send_messages([_to_message(email, connection)])
+            except Exception as exc:
+                # The connection may be unusable after an SMTP error
+                connection.close()
+                email.last_error = str(exc)
+                if email.attempts >= OUTBOX_MAX_ATTEMPTS:
+                    email.status = "failed"
+                    logger.error("Outbox email %s failed: %s", email.pk, exc)
+                else:
+                    email.status = "pending"
+                    email.next_attempt_at = timezone.now() + _retry_delay(
+                        email.attempts
+                    )
+            else:
+                email.status = "sent"
+                email.sent_at = timezone.now()
+                email.last_error = ""
+                sent += 1
+            email.save(
+                update_fields=[
+                    "status",
+                    "attempts",
+                    "next_attempt_at",
+                    "last_error",
+                    "sent_at",
+                    "updated_at",
+                ]
+            )
+    finally:
+        connection.close()
+    return sent
+
+
+def dispatch_outbox(batch_size=OUTBOX_BATCH_SIZE):
+    release_stale_emails()
+    total = 0
+    while emails := claim_batch(batch_size):
+        total += send_batch(emails)
+    return total
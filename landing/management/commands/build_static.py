@@ -0,0 +1,126 @@
+import shutil
+from collections import defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from landing.assets import (
+    ASSET_BUNDLES,
+    build_bundle,
+    css_references,
+    fetch_vendor_files,
+    file_digest,
+    image_siblings,
+    source_path,
+    template_references,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the static output in STATIC_BUILD_DIR: self-hosted vendor files, "
+        "minified bundles and the static files the templates actually use, then "
+        "run collectstatic (hashed names, gzip and brotli copies)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--refresh-vendors",
+            action="store_true",
+            help="Download the vendor files again",
+        )
+        parser.add_argument(
+            "--no-collectstatic",
+            action="store_true",
+            help="Only build STATIC_BUILD_DIR",
+        )
+
+    def handle(self, *args, **options):
+        build_dir = Path(settings.STATIC_BUILD_DIR)
+        source_dir = Path(settings.STATIC_SOURCE_DIR)
+
+        try:
+            fetched = fetch_vendor_files(refresh=options["refresh_vendors"])
+        except OSError as exc:
+            raise CommandError(
+                f"Cannot download the vendor files ({exc}). Copy them into "
+                f"{settings.STATIC_VENDOR_DIR} by hand on offline hosts."
+            )
+        if fetched:
+            self.stdout.write(f"Downloaded {len(fetched)} vendor file(s).")
+
+        outputs = {}
+        for name in ASSET_BUNDLES:
+            path, content = build_bundle(name)
+            outputs[path] = content.encode("utf-8")
+
+        # Everything reachable from the templates and the bundles is kept
+        needed = set(template_references())
+        for path, content in outputs.items():
+            if path.endswith(".css"):
+                needed |= css_references(content.decode("utf-8"), path)
+        needed -= set(outputs)
+        # WebP/AVIF copies written by optimize_assets ship with their image
+        needed |= {sibling for path in needed for sibling in image_siblings(path)}
+
+        missing = sorted(p for p in needed if not source_path(p).is_file())
+        if missing:
+            raise CommandError("Missing static files: " + ", ".join(missing))
+
+        for path, content in outputs.items():
+            self._write(build_dir / path, content)
+        for path in needed:
+            target = build_dir / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source_path(path), target)
+
+        kept = needed | set(outputs)
+        for stale in [p for p in build_dir.rglob("*") if p.is_file()]:
+            if stale.relative_to(build_dir).as_posix() not in kept:
+                stale.unlink()
+
+        self._report(source_dir, needed, outputs)
+
+        if options["no_collectstatic"]:
+            return
+        if build_dir not in map(Path, settings.STATICFILES_DIRS):
+            raise CommandError(
+                "STATICFILES_DIRS does not point to STATIC_BUILD_DIR, "
+                "set STATIC_BUNDLES_ENABLED=True before collecting."
+            )
+        call_command(
+            "collectstatic",
+            interactive=False,
+            clear=True,
+            verbosity=options["verbosity"],
+        )
+
+    def _write(self, path, content):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+    def _report(self, source_dir, needed, outputs):
+        sources = [p for p in source_dir.rglob("*") if p.is_file()]
+        dropped = [
+            p for p in sources if p.relative_to(source_dir).as_posix() not in needed
+        ]
+        dropped_bytes = sum(p.stat().st_size for p in dropped)
+        self.stdout.write(
+            f"{len(sources) - len(dropped)} of {len(sources)} source file(s) used, "
+            f"{len(dropped)} unreferenced file(s) left out ({dropped_bytes // 1024} KB)."
+        )
+        for path, content in outputs.items():
+            self.stdout.write(f"{path}: {len(content) // 1024} KB")
+
+        by_digest = defaultdict(list)
+        for path in sources:
+            by_digest[file_digest(path)].append(path.relative_to(source_dir))
+        for paths in by_digest.values():
+            if len(paths) > 1:
+                self.stdout.write(
+                    self.style.WARNING(
+                        "Identical files: " + ", ".join(map(str, sorted(paths)))
+                    )
+                )
@@ -0,0 +1,120 @@
+import datetime
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from landing.models import (
+    ContactMessage,
+    Newsletter,
+    ProgramSession,
+    Registration,
+    Speaker,
+)
+
+SAMPLE_EMAIL = "someone@example.org"
+
+
+def hot_paths():
+    """Requêtes les plus fréquentes du site et de l'admin"""
+
+    week_ago = timezone.now() - datetime.timedelta(days=7)
+    return {
+        "registration duplicate email (RegistrationForm.clean_email)": (
+            Registration.objects.filter(email__lower=SAMPLE_EMAIL)
+            .order_by()
+            .values("pk")[:1]
+        ),
+        "newsletter duplicate email (NewsletterForm.clean_email)": (
+            Newsletter.objects.filter(email__lower=SAMPLE_EMAIL)
+            .order_by()
+            .values("pk")[:1]
+        ),
+        "registration changelist filtered by status": (
+            Registration.objects.filter(status="pending").order_by("-created_at")[:50]
+        ),
+        "registration changelist filtered by country": (
+            Registration.objects.filter(country="Nigeria").order_by("-created_at")[:50]
+        ),
+        "registrations created in the last 7 days": (
+            Registration.objects.filter(created_at__gte=week_ago).values("pk")
+        ),
+        "unread contact messages": (
+            ContactMessage.objects.filter(is_read=False).order_by("-created_at")[:50]
+        ),
+        "active speakers in display order": (
+            Speaker.objects.filter(is_active=True).order_by("order", "full_name")
+        ),
+        "active sessions of a program day": (
+            ProgramSession.objects.filter(
+                is_active=True, program_day_id=uuid.uuid4()
+            ).order_by("start_time", "order")
+        ),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Print query plans and timings for the hot lookup paths. Run it before "
+        "and after applying the index migrations to compare."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Use EXPLAIN ANALYZE (runs the queries)",
+        )
+        parser.add_argument(
+            "--sample-rows",
+            type=int,
+            default=0,
+            help="Insert this many synthetic registrations first (rolled back)",
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["sample_rows"]:
+                self._seed(options["sample_rows"])
+            for label, queryset in hot_paths().items():
+                self._report(label, queryset, options)
+            # Never keep the synthetic rows
+            transaction.set_rollback(True)
+
+    def _seed(self, count):
+        countries = ["Nigeria", "Ghana", "Kenya", "Senegal", "Egypt", "Benin"]
+        statuses = ["pending", "approved", "rejected", "waitlist"]
+        Registration.objects.bulk_create(
+            (
+                Registration(
+                    registration_number=f"BENCH-{i:07d}",
+                    fullname=f"Benchmark {i}",
+                    organization="Benchmark",
+                    country=countries[i % len(countries)],
+                    email=f"bench{i}@example.org",
+                    phone="+234800000000",
+                    status=statuses[i % len(statuses)],
+                )
+                for i in range(count)
+            ),
+            batch_size=5000,
+        )
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE landing_registration")
+        self.stdout.write(f"Seeded {count} synthetic registrations.\n")
+
+    def _report(self, label, queryset, options):
+        explain_options = {"analyze": True} if options["analyze"] else {}
+        plan = queryset.explain(**explain_options)
+        started = time.perf_counter()
+        for _ in range(options["repeat"]):
+            list(queryset.all())
+        elapsed = (time.perf_counter() - started) * 1000 / options["repeat"]
+
+        self.stdout.write(self.style.MIGRATE_HEADING(label))
+        self.stdout.write(plan)
+        self.stdout.write(f"avg {elapsed:.2f} ms over {options['repeat']} runs\n")
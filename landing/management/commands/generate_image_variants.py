@@ -0,0 +1,22 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from landing.images import IMAGE_FIELDS, generate_instance_variants
+
+
+class Command(BaseCommand):
+    help = "Build the resized WebP/JPEG variants of every uploaded image"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force", action="store_true", help="Rebuild existing variants"
+        )
+
+    def handle(self, *args, **options):
+        for label, fields in IMAGE_FIELDS.items():
+            model = apps.get_model(label)
+            count = 0
+            for instance in model.objects.only("pk", *fields).iterator():
+                generate_instance_variants(instance, force=options["force"])
+                count += 1
+            self.stdout.write(f"{label}: {count} object(s) processed.")
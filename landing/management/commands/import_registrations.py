@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from landing.imports import IMPORT_CHUNK_SIZE, import_registrations
+
+
+class Command(BaseCommand):
+    help = "Bulk import registrations from an .xlsx spreadsheet"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the .xlsx file")
+        parser.add_argument(
+            "--sheet", help="Worksheet name (defaults to the active one)"
+        )
+        parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate the file without writing anything",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], "rb") as file:
+                result = import_registrations(
+                    file,
+                    chunk_size=options["chunk_size"],
+                    dry_run=options["dry_run"],
+                    sheet_name=options["sheet"],
+                )
+        except (OSError, KeyError) as exc:
+            raise CommandError(exc)
+
+        for row_number, message in result.errors:
+            self.stderr.write(f"Row {row_number}: {message}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.total} row(s) read, {result.created} registration(s) "
+                f"created, {result.skipped} skipped."
+            )
+        )
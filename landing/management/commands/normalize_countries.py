@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from landing.countries import normalize_registration_countries
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert the free-text countries of existing registrations to ISO codes "
+        "and rebuild the per-country counts. Migration 0003_registration_countries "
+        "does it before narrowing Registration.country to two characters; run "
+        "--dry-run first to list the values it cannot resolve (they are cleared "
+        "and kept in the admin notes)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without writing",
+        )
+
+    def handle(self, *args, **options):
+        updated, unresolved = normalize_registration_countries(
+            dry_run=options["dry_run"]
+        )
+        self.stdout.write(f"{updated} registration(s) normalized.")
+        for value, count in sorted(unresolved.items(), key=lambda item: -item[1]):
+            self.stdout.write(
+                self.style.WARNING(f"Unknown country {value!r}: {count} row(s)")
+            )
+        if unresolved:
+            self.stdout.write(
+                "Fix these rows by hand (or add them to COUNTRY_ALIASES) "
+                "and run the command again."
+            )
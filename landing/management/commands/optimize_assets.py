@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from landing.assets import (
+    RASTER_EXTENSIONS,
+    file_digest,
+    minify_svg,
+    optimize_raster,
+    write_siblings,
+)
+
+STATE_FILE = ".optimized.json"
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompress PNG/JPEG images losslessly, minify SVGs and write WebP/AVIF "
+        "siblings. Files already optimized are skipped, run it before build_static."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "directories",
+            nargs="*",
+            help="Directories to optimize in place (default: STATIC_SOURCE_DIR)",
+        )
+        parser.add_argument(
+            "--force", action="store_true", help="Ignore the record of done files"
+        )
+
+    def handle(self, *args, **options):
+        directories = options["directories"] or [settings.STATIC_SOURCE_DIR]
+        total_saved = 0
+        for directory in map(Path, directories):
+            total_saved += self._optimize_directory(directory, options["force"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Total saved: {total_saved / 1024:.0f} KB")
+        )
+
+    def _optimize_directory(self, directory, force):
+        state_path = directory / STATE_FILE
+        state = {}
+        if state_path.exists() and not force:
+            state = json.loads(state_path.read_text())
+
+        saved = 0
+        for path in sorted(directory.rglob("*")):
+            extension = path.suffix.lower()
+            if not path.is_file() or extension not in RASTER_EXTENSIONS | {".svg"}:
+                continue
+            name = path.relative_to(directory).as_posix()
+            if state.get(name) == file_digest(path):
+                continue
+
+            before = path.stat().st_size
+            if extension == ".svg":
+                file_saved = minify_svg(path)
+                siblings = []
+            else:
+                file_saved = optimize_raster(path)
+                siblings = write_siblings(path)
+            saved += file_saved
+            state[name] = file_digest(path)
+
+            details = ", ".join(
+                f"{sibling.suffix[1:]} {sibling.stat().st_size // 1024} KB"
+                for sibling in siblings
+            )
+            self.stdout.write(
+                f"{name}: {before // 1024} KB -> {path.stat().st_size // 1024} KB"
+                + (f" ({details})" if details else "")
+            )
+
+        state_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+        self.stdout.write(f"{directory}: {saved / 1024:.0f} KB saved")
+        return saved
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from landing.prerender import clear_prerendered_pages, prerender_landing_pages
+
+
+class Command(BaseCommand):
+    help = "Pre-render the landing page to static HTML files, one per language"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Remove the pre-rendered pages instead of generating them",
+        )
+
+    def handle(self, *args, **options):
+        if options["clear"]:
+            clear_prerendered_pages()
+            self.stdout.write(self.style.SUCCESS("Pre-rendered pages removed."))
+            return
+
+        for path in prerender_landing_pages():
+            self.stdout.write(f"Wrote {path}")
+        self.stdout.write(self.style.SUCCESS("Landing page pre-rendered."))
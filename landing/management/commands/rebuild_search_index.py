@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from landing.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the full-text search vectors of every translation "
+        "(after an import, a raw load or a change of SEARCH_MODELS)"
+    )
+
+    def handle(self, *args, **options):
+        count = rebuild_search_index()
+        self.stdout.write(
+            self.style.SUCCESS(f"Search vectors rebuilt for {count} objects.")
+        )
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from landing.counters import reconcile_counters
+from landing.countries import reconcile_country_counts
+from landing.stats import reconcile_registration_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the admin badge counters, the per-country counts and the "
+        "registration statistics from the database (run periodically)"
+    )
+
+    def handle(self, *args, **options):
+        for name, count in reconcile_counters().items():
+            self.stdout.write(f"{name}: {count}")
+        self.stdout.write(f"countries: {reconcile_country_counts()}")
+        self.stdout.write(f"registration stats: {reconcile_registration_stats()}")
@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from landing.exports import run_pending_export_jobs
+
+
+class Command(BaseCommand):
+    help = "Run queued XLSX export jobs (use --loop to keep polling as a worker)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="Keep polling for jobs")
+        parser.add_argument(
+            "--interval", type=float, default=5, help="Polling interval in seconds"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            count = run_pending_export_jobs()
+            if count:
+                self.stdout.write(f"{count} export job(s) processed.")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from landing.campaigns import CAMPAIGN_BATCH_SIZE, run_pending_campaigns
+
+
+class Command(BaseCommand):
+    help = (
+        "Send scheduled newsletter campaigns and resume interrupted ones "
+        "(use --loop to keep polling as a worker)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="Keep polling")
+        parser.add_argument(
+            "--interval", type=float, default=30, help="Polling interval in seconds"
+        )
+        parser.add_argument("--batch-size", type=int, default=CAMPAIGN_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        while True:
+            count = run_pending_campaigns(batch_size=options["batch_size"])
+            if count:
+                self.stdout.write(f"{count} campaign(s) processed.")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from landing.mail import OUTBOX_BATCH_SIZE, dispatch_outbox
+
+
+class Command(BaseCommand):
+    help = "Send queued transactional emails (use --loop to keep polling as a worker)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop", action="store_true", help="Keep polling the outbox"
+        )
+        parser.add_argument(
+            "--interval", type=float, default=5, help="Polling interval in seconds"
+        )
+        parser.add_argument("--batch-size", type=int, default=OUTBOX_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        while True:
+            count = dispatch_outbox(batch_size=options["batch_size"])
+            if count:
+                self.stdout.write(f"{count} email(s) sent.")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
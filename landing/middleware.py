@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.utils import translation
+from whitenoise.base import WhiteNoise
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class PrerenderedPageMiddleware:
+    """Sert les pages pré-rendues par `prerender_landing` avant tout rendu Django"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # Pages are rewritten in place whenever content changes, so files are
+        # looked up on each request instead of being indexed once at startup
+        self.pages = WhiteNoise(
+            None,
+            autorefresh=True,
+            index_file=True,
+            allow_all_origins=False,
+            max_age=settings.PRERENDER_MAX_AGE,
+        )
+        self.pages.add_files(settings.PRERENDER_ROOT)
+
+    def __call__(self, request):
+        if request.method not in ("GET", "HEAD"):
+            return self.get_response(request)
+
+        # Pages live under their language prefix (/fr/, /en/), which is all a
+        # cache needs to tell them apart
+        language_code = translation.get_language_from_path(request.path_info)
+        if language_code is None:
+            return self.get_response(request)
+        static_file = self.pages.find_file(request.path_info)
+        if static_file is None:
+            return self.get_response(request)
+
+        response = WhiteNoiseMiddleware.serve(static_file, request)
+        response["Content-Language"] = language_code
+        return response
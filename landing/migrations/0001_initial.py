@@ -0,0 +1,1452 @@
+# Generated by Django 5.0.1 on 2026-10-16 19:45
+
+import ckeditor.fields
+import django.core.validators
+import django.db.models.deletion
+import parler.fields
+import parler.models
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="AboutSection",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "comptroller_name",
+                    models.CharField(max_length=255, verbose_name="Comptroller Name"),
+                ),
+                (
+                    "comptroller_organization",
+                    models.CharField(
+                        max_length=255, verbose_name="Comptroller Organization"
+                    ),
+                ),
+                (
+                    "comptroller_photo",
+                    models.ImageField(
+                        upload_to="about/comptroller/", verbose_name="Comptroller Photo"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+            ],
+            options={
+                "verbose_name": "About Section",
+                "verbose_name_plural": "About Section",
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="Contact",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "contact_type",
+                    models.CharField(
+                        choices=[
+                            ("ncs", "Nigeria Customs Service"),
+                            ("afcfta", "AfCFTA Secretariat"),
+                            ("afreximbank", "Afreximbank"),
+                            ("wco", "World Customs Organization"),
+                            ("other", "Other"),
+                        ],
+                        max_length=20,
+                        verbose_name="Contact Type",
+                    ),
+                ),
+                (
+                    "full_name",
+                    models.CharField(max_length=255, verbose_name="Full Name"),
+                ),
+                (
+                    "rank",
+                    models.CharField(blank=True, max_length=255, verbose_name="Rank"),
+                ),
+                ("email", models.EmailField(max_length=254, verbose_name="Email")),
+                ("phone", models.CharField(max_length=50, verbose_name="Phone")),
+                ("order", models.IntegerField(default=0, verbose_name="Display Order")),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+            ],
+            options={
+                "verbose_name": "Contact",
+                "verbose_name_plural": "Contacts",
+                "ordering": ["contact_type", "order"],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="ContactMessage",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "first_name",
+                    models.CharField(max_length=255, verbose_name="First Name"),
+                ),
+                (
+                    "last_name",
+                    models.CharField(max_length=255, verbose_name="Last Name"),
+                ),
+                ("email", models.EmailField(max_length=254, verbose_name="Email")),
+                (
+                    "phone",
+                    models.CharField(blank=True, max_length=50, verbose_name="Phone"),
+                ),
+                (
+                    "organization",
+                    models.CharField(
+                        blank=True, max_length=255, verbose_name="Organization"
+                    ),
+                ),
+                (
+                    "subject",
+                    models.CharField(
+                        choices=[
+                            ("general", "General Inquiry"),
+                            ("registration", "Event Registration"),
+                            ("partnership", "Partnership Opportunities"),
+                            ("sponsorship", "Sponsorship"),
+                            ("media", "Media & Press"),
+                            ("technical", "Technical Support"),
+                            ("other", "Other"),
+                        ],
+                        max_length=20,
+                        verbose_name="Subject",
+                    ),
+                ),
+                ("message", models.TextField(verbose_name="Message")),
+                ("is_read", models.BooleanField(default=False, verbose_name="Is Read")),
+                (
+                    "is_replied",
+                    models.BooleanField(default=False, verbose_name="Is Replied"),
+                ),
+                (
+                    "admin_reply",
+                    models.TextField(blank=True, verbose_name="Admin Reply"),
+                ),
+            ],
+            options={
+                "verbose_name": "Contact Message",
+                "verbose_name_plural": "Contact Messages",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="EventConfiguration",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("start_date", models.DateTimeField(verbose_name="Start Date")),
+                ("end_date", models.DateTimeField(verbose_name="End Date")),
+                (
+                    "location",
+                    models.CharField(
+                        default="Abuja, Nigeria",
+                        max_length=255,
+                        verbose_name="Location",
+                    ),
+                ),
+                (
+                    "registration_deadline",
+                    models.DateTimeField(verbose_name="Registration Deadline"),
+                ),
+                (
+                    "logo",
+                    models.ImageField(upload_to="event/logos/", verbose_name="Logo"),
+                ),
+                (
+                    "favicon",
+                    models.ImageField(
+                        upload_to="event/favicons/", verbose_name="Favicon"
+                    ),
+                ),
+                (
+                    "hero_video_url",
+                    models.URLField(
+                        blank=True, null=True, verbose_name="Hero Video URL"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                (
+                    "registration_open",
+                    models.BooleanField(default=True, verbose_name="Registration Open"),
+                ),
+            ],
+            options={
+                "verbose_name": "Event Configuration",
+                "verbose_name_plural": "Event Configuration",
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="FAQ",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("order", models.IntegerField(default=0, verbose_name="Display Order")),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+            ],
+            options={
+                "verbose_name": "FAQ",
+                "verbose_name_plural": "FAQs",
+                "ordering": ["order"],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="Hotel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("name", models.CharField(max_length=255, verbose_name="Name")),
+                ("website_url", models.URLField(verbose_name="Website URL")),
+                (
+                    "stars",
+                    models.IntegerField(
+                        choices=[(1, "1★"), (2, "2★"), (3, "3★"), (4, "4★"), (5, "5★")],
+                        verbose_name="Stars",
+                    ),
+                ),
+                ("image", models.ImageField(upload_to="hotels/", verbose_name="Image")),
+                (
+                    "has_breakfast",
+                    models.BooleanField(default=True, verbose_name="Has Breakfast"),
+                ),
+                (
+                    "has_wifi",
+                    models.BooleanField(default=True, verbose_name="Has WiFi"),
+                ),
+                (
+                    "has_pool",
+                    models.BooleanField(default=False, verbose_name="Has Pool"),
+                ),
+                ("has_gym", models.BooleanField(default=False, verbose_name="Has Gym")),
+                ("has_spa", models.BooleanField(default=False, verbose_name="Has Spa")),
+                (
+                    "has_restaurant",
+                    models.BooleanField(default=False, verbose_name="Has Restaurant"),
+                ),
+                ("order", models.IntegerField(default=0, verbose_name="Display Order")),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+            ],
+            options={
+                "verbose_name": "Hotel",
+                "verbose_name_plural": "Hotels",
+                "ordering": ["order"],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="LogisticInfo",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "logistic_type",
+                    models.CharField(
+                        choices=[
+                            ("visa", "Visa Information"),
+                            ("travel", "Travel Information"),
+                            ("transport", "On Ground Transport"),
+                            ("accommodation", "Accommodation"),
+                            ("informations", "Important Information"),
+                        ],
+                        max_length=20,
+                        unique=True,
+                        verbose_name="Logistic Type",
+                    ),
+                ),
+                (
+                    "icon_class",
+                    models.CharField(max_length=50, verbose_name="Icon Class"),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+            ],
+            options={
+                "verbose_name": "Logistic Information",
+                "verbose_name_plural": "Logistic Information",
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="Newsletter",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "email",
+                    models.EmailField(
+                        max_length=254, unique=True, verbose_name="Email"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+            ],
+            options={
+                "verbose_name": "Newsletter Subscription",
+                "verbose_name_plural": "Newsletter Subscriptions",
+            },
+        ),
+        migrations.CreateModel(
+            name="Partner",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("name", models.CharField(max_length=255, verbose_name="Name")),
+                (
+                    "partner_type",
+                    models.CharField(
+                        choices=[
+                            ("powered", "Powered By"),
+                            ("collaboration", "In Collaboration With"),
+                            ("supported", "Supported By"),
+                            ("sponsor", "Sponsor"),
+                        ],
+                        max_length=20,
+                        verbose_name="Partner Type",
+                    ),
+                ),
+                ("logo", models.ImageField(upload_to="partners/", verbose_name="Logo")),
+                (
+                    "website_url",
+                    models.URLField(blank=True, null=True, verbose_name="Website URL"),
+                ),
+                ("order", models.IntegerField(default=0, verbose_name="Display Order")),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+            ],
+            options={
+                "verbose_name": "Partner",
+                "verbose_name_plural": "Partners",
+                "ordering": ["order"],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="ProgramDay",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "day_number",
+                    models.IntegerField(
+                        help_text="0, 1, 2, 3", unique=True, verbose_name="Day Number"
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="Date")),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+            ],
+            options={
+                "verbose_name": "Program Day",
+                "verbose_name_plural": "Program Days",
+                "ordering": ["day_number"],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="Registration",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "fullname",
+                    models.CharField(max_length=255, verbose_name="Full Name"),
+                ),
+                (
+                    "organization",
+                    models.CharField(max_length=255, verbose_name="Organization"),
+                ),
+                (
+                    "position",
+                    models.CharField(
+                        blank=True, max_length=255, verbose_name="Position"
+                    ),
+                ),
+                (
+                    "city",
+                    models.CharField(blank=True, max_length=255, verbose_name="City"),
+                ),
+                ("country", models.CharField(max_length=255, verbose_name="Country")),
+                ("email", models.EmailField(max_length=254, verbose_name="Email")),
+                (
+                    "phone",
+                    models.CharField(
+                        max_length=17,
+                        validators=[
+                            django.core.validators.RegexValidator(
+                                message="Format: '+999999999'. 9-15 digits.",
+                                regex="^\\+?1?\\d{9,15}$",
+                            )
+                        ],
+                        verbose_name="Phone",
+                    ),
+                ),
+                (
+                    "arrival_date",
+                    models.DateField(
+                        blank=True, null=True, verbose_name="Arrival Date"
+                    ),
+                ),
+                (
+                    "departure_date",
+                    models.DateField(
+                        blank=True, null=True, verbose_name="Departure Date"
+                    ),
+                ),
+                (
+                    "needs_visa_assistance",
+                    models.BooleanField(
+                        default=False, verbose_name="Needs Visa Assistance"
+                    ),
+                ),
+                (
+                    "interested_in_panels",
+                    models.BooleanField(
+                        default=False, verbose_name="Interested in Panels"
+                    ),
+                ),
+                (
+                    "interested_in_capacity_building",
+                    models.BooleanField(
+                        default=False, verbose_name="Interested in Capacity Building"
+                    ),
+                ),
+                (
+                    "interested_in_networking",
+                    models.BooleanField(
+                        default=False, verbose_name="Interested in Networking"
+                    ),
+                ),
+                (
+                    "dietary_restrictions",
+                    models.TextField(blank=True, verbose_name="Dietary Restrictions"),
+                ),
+                (
+                    "receive_updates",
+                    models.BooleanField(default=True, verbose_name="Receive Updates"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending Review"),
+                            ("approved", "Approved"),
+                            ("rejected", "Rejected"),
+                            ("waitlist", "Waitlist"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "registration_number",
+                    models.CharField(
+                        blank=True,
+                        max_length=50,
+                        unique=True,
+                        verbose_name="Registration Number",
+                    ),
+                ),
+                (
+                    "admin_notes",
+                    models.TextField(blank=True, verbose_name="Admin Notes"),
+                ),
+            ],
+            options={
+                "verbose_name": "Registration",
+                "verbose_name_plural": "Registrations",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Speaker",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "full_name",
+                    models.CharField(max_length=255, verbose_name="Full Name"),
+                ),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("keynote", "Keynote Speaker"),
+                            ("panelist", "Panelist"),
+                            ("moderator", "Moderator"),
+                        ],
+                        max_length=20,
+                        verbose_name="Category",
+                    ),
+                ),
+                (
+                    "photo",
+                    models.ImageField(
+                        blank=True,
+                        null=True,
+                        upload_to="speakers/",
+                        verbose_name="Photo",
+                    ),
+                ),
+                (
+                    "linkedin_url",
+                    models.URLField(blank=True, null=True, verbose_name="LinkedIn URL"),
+                ),
+                (
+                    "twitter_url",
+                    models.URLField(blank=True, null=True, verbose_name="Twitter URL"),
+                ),
+                ("order", models.IntegerField(default=0, verbose_name="Display Order")),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+            ],
+            options={
+                "verbose_name": "Speaker",
+                "verbose_name_plural": "Speakers",
+                "ordering": ["order", "full_name"],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="Venue",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("google_maps_url", models.URLField(verbose_name="Google Maps URL")),
+                (
+                    "website_url",
+                    models.URLField(blank=True, null=True, verbose_name="Website URL"),
+                ),
+                (
+                    "image",
+                    models.ImageField(
+                        blank=True, null=True, upload_to="venues/", verbose_name="Image"
+                    ),
+                ),
+                ("order", models.IntegerField(default=0, verbose_name="Display Order")),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+            ],
+            options={
+                "verbose_name": "Venue",
+                "verbose_name_plural": "Venues",
+                "ordering": ["order"],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="ProgramSession",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "session_type",
+                    models.CharField(
+                        choices=[
+                            ("plenary", "Plenary Session"),
+                            ("panel", "Panel Discussion"),
+                            ("workshop", "Workshop"),
+                            ("networking", "Networking"),
+                            ("break", "Break"),
+                            ("meal", "Meal"),
+                            ("ceremony", "Ceremony"),
+                            ("other", "Other"),
+                        ],
+                        max_length=20,
+                        verbose_name="Session Type",
+                    ),
+                ),
+                ("start_time", models.TimeField(verbose_name="Start Time")),
+                ("end_time", models.TimeField(verbose_name="End Time")),
+                (
+                    "interpretation_languages",
+                    models.CharField(
+                        blank=True,
+                        help_text="e.g., EN, FR, AR",
+                        max_length=100,
+                        verbose_name="Interpretation Languages",
+                    ),
+                ),
+                (
+                    "capacity",
+                    models.IntegerField(blank=True, null=True, verbose_name="Capacity"),
+                ),
+                ("order", models.IntegerField(default=0, verbose_name="Display Order")),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                (
+                    "program_day",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sessions",
+                        to="landing.programday",
+                        verbose_name="Program Day",
+                    ),
+                ),
+                (
+                    "moderator",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="moderated_sessions",
+                        to="landing.speaker",
+                        verbose_name="Moderator",
+                    ),
+                ),
+                (
+                    "speakers",
+                    models.ManyToManyField(
+                        blank=True,
+                        related_name="speaking_sessions",
+                        to="landing.speaker",
+                        verbose_name="Speakers",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Program Session",
+                "verbose_name_plural": "Program Sessions",
+                "ordering": ["program_day__day_number", "start_time", "order"],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="RoomType",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "icon_class",
+                    models.CharField(
+                        default="fas fa-bed", max_length=50, verbose_name="Icon Class"
+                    ),
+                ),
+                (
+                    "price_ngn",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=10, verbose_name="Price (NGN)"
+                    ),
+                ),
+                ("order", models.IntegerField(default=0, verbose_name="Display Order")),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                (
+                    "hotel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="room_types",
+                        to="landing.hotel",
+                        verbose_name="Hotel",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Room Type",
+                "verbose_name_plural": "Room Types",
+                "ordering": ["hotel", "order"],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="AboutSectionTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                (
+                    "title",
+                    models.CharField(
+                        default="About the Customs PACT",
+                        max_length=255,
+                        verbose_name="Title",
+                    ),
+                ),
+                (
+                    "comptroller_title",
+                    models.CharField(max_length=255, verbose_name="Comptroller Title"),
+                ),
+                (
+                    "message_paragraph_1",
+                    ckeditor.fields.RichTextField(verbose_name="Message Paragraph 1"),
+                ),
+                (
+                    "message_paragraph_2",
+                    ckeditor.fields.RichTextField(verbose_name="Message Paragraph 2"),
+                ),
+                (
+                    "message_paragraph_3",
+                    ckeditor.fields.RichTextField(verbose_name="Message Paragraph 3"),
+                ),
+                (
+                    "message_paragraph_4",
+                    ckeditor.fields.RichTextField(verbose_name="Message Paragraph 4"),
+                ),
+                (
+                    "closing_statement",
+                    models.CharField(max_length=255, verbose_name="Closing Statement"),
+                ),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.aboutsection",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "About Section Translation",
+                "db_table": "landing_aboutsection_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="ContactTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                ("title", models.CharField(max_length=255, verbose_name="Title")),
+                (
+                    "organization",
+                    models.CharField(
+                        blank=True, max_length=255, verbose_name="Organization"
+                    ),
+                ),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.contact",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Contact Translation",
+                "db_table": "landing_contact_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="EventConfigurationTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                (
+                    "event_name",
+                    models.CharField(
+                        default="The Customs PACT 2025",
+                        max_length=255,
+                        verbose_name="Event Name",
+                    ),
+                ),
+                (
+                    "tagline",
+                    models.CharField(
+                        default="Breaking Barriers, Building Bridges",
+                        max_length=255,
+                        verbose_name="Tagline",
+                    ),
+                ),
+                (
+                    "subtitle",
+                    models.CharField(
+                        default="Partnership for African Cooperation in Trade",
+                        max_length=255,
+                        verbose_name="Subtitle",
+                    ),
+                ),
+                (
+                    "meta_description",
+                    models.TextField(max_length=160, verbose_name="Meta Description"),
+                ),
+                (
+                    "meta_keywords",
+                    models.CharField(max_length=255, verbose_name="Meta Keywords"),
+                ),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.eventconfiguration",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Event Configuration Translation",
+                "db_table": "landing_eventconfiguration_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="FAQTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                ("question", models.CharField(max_length=500, verbose_name="Question")),
+                ("answer", ckeditor.fields.RichTextField(verbose_name="Answer")),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.faq",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "FAQ Translation",
+                "db_table": "landing_faq_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="HotelTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                (
+                    "description",
+                    ckeditor.fields.RichTextField(verbose_name="Description"),
+                ),
+                ("address", models.TextField(verbose_name="Address")),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.hotel",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Hotel Translation",
+                "db_table": "landing_hotel_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="LogisticInfoTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                ("title", models.CharField(max_length=255, verbose_name="Title")),
+                (
+                    "description",
+                    ckeditor.fields.RichTextField(verbose_name="Description"),
+                ),
+                ("content", ckeditor.fields.RichTextField(verbose_name="Content")),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.logisticinfo",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Logistic Information Translation",
+                "db_table": "landing_logisticinfo_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="PartnerTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                (
+                    "description",
+                    models.TextField(blank=True, verbose_name="Description"),
+                ),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.partner",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Partner Translation",
+                "db_table": "landing_partner_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="ProgramDayTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                (
+                    "title",
+                    models.CharField(
+                        help_text="e.g., Day 1, Day 2",
+                        max_length=255,
+                        verbose_name="Title",
+                    ),
+                ),
+                (
+                    "description",
+                    models.TextField(blank=True, verbose_name="Description"),
+                ),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.programday",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Program Day Translation",
+                "db_table": "landing_programday_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="ProgramSessionTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                ("title", models.CharField(max_length=255, verbose_name="Title")),
+                (
+                    "description",
+                    ckeditor.fields.RichTextField(
+                        blank=True, verbose_name="Description"
+                    ),
+                ),
+                (
+                    "venue",
+                    models.CharField(blank=True, max_length=255, verbose_name="Venue"),
+                ),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.programsession",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Program Session Translation",
+                "db_table": "landing_programsession_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="RoomTypeTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, verbose_name="Name")),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.roomtype",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Room Type Translation",
+                "db_table": "landing_roomtype_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="SpeakerTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                (
+                    "title",
+                    models.CharField(
+                        help_text="e.g., Secretary General",
+                        max_length=255,
+                        verbose_name="Title",
+                    ),
+                ),
+                (
+                    "organization",
+                    models.CharField(max_length=255, verbose_name="Organization"),
+                ),
+                ("bio", models.TextField(verbose_name="Bio")),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.speaker",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Speaker Translation",
+                "db_table": "landing_speaker_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name="VenueTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, verbose_name="Name")),
+                ("address", models.TextField(verbose_name="Address")),
+                (
+                    "description",
+                    ckeditor.fields.RichTextField(verbose_name="Description"),
+                ),
+                (
+                    "day_badge",
+                    models.CharField(
+                        help_text="e.g., Day 1 - November 17",
+                        max_length=100,
+                        verbose_name="Day Badge",
+                    ),
+                ),
+                (
+                    "sessions_info",
+                    models.CharField(max_length=255, verbose_name="Sessions Info"),
+                ),
+                ("capacity", models.CharField(max_length=100, verbose_name="Capacity")),
+                (
+                    "distance_from_airport",
+                    models.CharField(
+                        max_length=100, verbose_name="Distance from Airport"
+                    ),
+                ),
+                (
+                    "rating",
+                    models.CharField(blank=True, max_length=50, verbose_name="Rating"),
+                ),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.venue",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Venue Translation",
+                "db_table": "landing_venue_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.0.1 on 2026-10-16 19:45
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("landing", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RegistrationCounter",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "prefix",
+                    models.CharField(max_length=20, unique=True, verbose_name="Prefix"),
+                ),
+                (
+                    "last_number",
+                    models.PositiveIntegerField(default=0, verbose_name="Last Number"),
+                ),
+            ],
+            options={
+                "verbose_name": "Registration Counter",
+                "verbose_name_plural": "Registration Counters",
+            },
+        ),
+        migrations.AddField(
+            model_name="eventconfiguration",
+            name="registration_prefix",
+            field=models.CharField(
+                default="TCP2025",
+                help_text="e.g., TCP2025 gives TCP2025-0001",
+                max_length=20,
+                verbose_name="Registration Number Prefix",
+            ),
+        ),
+    ]
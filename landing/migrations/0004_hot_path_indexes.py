@@ -0,0 +1,130 @@
+# Generated by Django 5.0.1 on 2026-10-16 19:46
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("landing", "0003_export_jobs"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="newsletter",
+            name="email",
+            field=models.EmailField(max_length=254, verbose_name="Email"),
+        ),
+        migrations.AddIndex(
+            model_name="contact",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["contact_type", "order"],
+                name="contact_active_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contactmessage",
+            index=models.Index(
+                condition=models.Q(("is_read", False)),
+                fields=["-created_at"],
+                name="contactmessage_unread_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contactmessage",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="contactmessage_created_brin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="faq",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["order"],
+                name="faq_active_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="hotel",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["order"],
+                name="hotel_active_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="partner",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["order"],
+                name="partner_active_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="programsession",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["program_day", "start_time", "order"],
+                name="session_active_day_time_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="registration",
+            index=models.Index(
+                django.db.models.functions.text.Lower("email"),
+                name="registration_email_lower_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="registration",
+            index=models.Index(
+                fields=["status", "-created_at"], name="registration_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="registration",
+            index=models.Index(
+                fields=["country", "-created_at"], name="registration_country_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="registration",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="registration_created_brin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="roomtype",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["hotel", "order"],
+                name="roomtype_active_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="speaker",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["order", "full_name"],
+                name="speaker_active_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="venue",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["order"],
+                name="venue_active_order_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="newsletter",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                name="newsletter_email_lower_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,138 @@
+# Generated by Django 5.0.1 on 2026-10-16 19:46
+
+import ckeditor.fields
+import django.db.models.deletion
+import parler.fields
+import parler.models
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("landing", "0005_outbox"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NewsletterCampaign",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("draft", "Draft"),
+                            ("scheduled", "Scheduled"),
+                            ("sending", "Sending"),
+                            ("sent", "Sent"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        default="draft",
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "last_subscriber_id",
+                    models.UUIDField(
+                        blank=True, null=True, verbose_name="Last Subscriber"
+                    ),
+                ),
+                (
+                    "total_recipients",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Total Recipients"
+                    ),
+                ),
+                (
+                    "sent_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Sent"),
+                ),
+                (
+                    "failed_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Failed"),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Started At"
+                    ),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Finished At"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Newsletter Campaign",
+                "verbose_name_plural": "Newsletter Campaigns",
+                "ordering": ["-created_at"],
+            },
+            bases=(parler.models.TranslatableModelMixin, models.Model),
+        ),
+        migrations.AddField(
+            model_name="newsletter",
+            name="language",
+            field=models.CharField(
+                choices=[("fr", "Français"), ("en", "English")],
+                default="en",
+                max_length=10,
+                verbose_name="Language",
+            ),
+        ),
+        migrations.CreateModel(
+            name="NewsletterCampaignTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        db_index=True, max_length=15, verbose_name="Language"
+                    ),
+                ),
+                ("subject", models.CharField(max_length=255, verbose_name="Subject")),
+                ("body", ckeditor.fields.RichTextField(verbose_name="Body")),
+                (
+                    "master",
+                    parler.fields.TranslationsForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="landing.newslettercampaign",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Newsletter Campaign Translation",
+                "db_table": "landing_newslettercampaign_translation",
+                "db_tablespace": "",
+                "managed": True,
+                "default_permissions": (),
+                "unique_together": {("language_code", "master")},
+            },
+            bases=(parler.models.TranslatedFieldsModelMixin, models.Model),
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 5.0.1 on 2026-10-16 19:46
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("landing", "0006_newsletter_campaigns"),
+    ]
+
+    operations = [
+        # gin_trgm_ops (speaker_name_trgm_idx) and the %> lookup of
+        # landing.search come with pg_trgm
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="faqtranslation",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="logisticinfotranslation",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="programsessiontranslation",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="speakertranslation",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="venuetranslation",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="faqtranslation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="faq_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="logisticinfotranslation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="logistic_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="programsessiontranslation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="session_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="speaker",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["full_name"],
+                name="speaker_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="speakertranslation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="speaker_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="venuetranslation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="venue_search_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,135 @@
+import logging
+import re
+import unicodedata
+
+import django_countries.fields
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import translation
+from django_countries import countries
+
+logger = logging.getLogger("events")
+
+# Frozen copy of landing.countries as of this migration: later edits to the
+# aliases or the matching rules must not change what the migration does
+COUNTRY_ALIASES = {
+    "ivory coast": "CI",
+    "rci": "CI",
+    "drc": "CD",
+    "rdc": "CD",
+    "dr congo": "CD",
+    "rd congo": "CD",
+    "congo kinshasa": "CD",
+    "congo brazzaville": "CG",
+    "usa": "US",
+    "united states of america": "US",
+    "etats unis": "US",
+    "uk": "GB",
+    "england": "GB",
+    "great britain": "GB",
+    "uae": "AE",
+    "swaziland": "SZ",
+    "cape verde": "CV",
+    "gambia": "GM",
+    "the gambia": "GM",
+    "sao tome": "ST",
+    "tanzania": "TZ",
+    "guinea bissau": "GW",
+}
+COUNTRY_NAME_LANGUAGES = ("fr", "en")
+
+
+def lookup_key(value):
+    text = unicodedata.normalize("NFKD", str(value)).encode("ascii", "ignore")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text.decode().lower()).split())
+
+
+def country_lookup():
+    lookup = {lookup_key(alias): code for alias, code in COUNTRY_ALIASES.items()}
+    for language_code in COUNTRY_NAME_LANGUAGES:
+        with translation.override(language_code):
+            for country in countries:
+                lookup.setdefault(lookup_key(country.name), country.code)
+    for code in countries.countries:
+        alpha3, numeric = countries.alt_codes[code]
+        lookup[code.lower()] = lookup[alpha3.lower()] = code
+        if numeric:
+            lookup[f"{numeric:03d}"] = lookup[str(numeric)] = code
+    return lookup
+
+
+def normalize_countries(apps, schema_editor):
+    """Remplace les pays saisis librement par leur code ISO avant de réduire la colonne"""
+
+    Registration = apps.get_model("landing", "Registration")
+    lookup = country_lookup()
+    values = Registration.objects.order_by().values_list("country").distinct()
+    for (value,) in values:
+        code = lookup.get(lookup_key(value or ""))
+        if not value or code == value:
+            continue
+        registrations = Registration.objects.filter(country=value)
+        if code is not None:
+            registrations.update(country=code)
+            continue
+        # Would not fit in two characters: kept in the notes, to be fixed by hand
+        logger.warning("Unknown registration country %r, cleared", value)
+        for registration in registrations:
+            note = f"Country as entered: {value}"
+            registration.admin_notes = "\n".join(
+                filter(None, [registration.admin_notes, note])
+            )
+            registration.country = ""
+            registration.save(update_fields=["admin_notes", "country"])
+
+
+def count_countries(apps, schema_editor):
+    Registration = apps.get_model("landing", "Registration")
+    RegistrationCountryCount = apps.get_model("landing", "RegistrationCountryCount")
+    counts = (
+        Registration.objects.exclude(country="")
+        .order_by()
+        .values_list("country")
+        .annotate(count=Count("pk"))
+    )
+    RegistrationCountryCount.objects.bulk_create(
+        RegistrationCountryCount(country=code, count=count) for code, count in counts
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("landing", "0007_search"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_countries, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="registration",
+            name="country",
+            field=django_countries.fields.CountryField(
+                max_length=2, verbose_name="Country"
+            ),
+        ),
+        migrations.CreateModel(
+            name="RegistrationCountryCount",
+            fields=[
+                (
+                    "country",
+                    django_countries.fields.CountryField(
+                        max_length=2,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Country",
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0, verbose_name="Count")),
+            ],
+            options={
+                "verbose_name": "Registrations per Country",
+                "verbose_name_plural": "Registrations per Country",
+            },
+        ),
+        migrations.RunPython(count_countries, migrations.RunPython.noop),
+    ]
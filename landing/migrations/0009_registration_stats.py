@@ -0,0 +1,94 @@
+# Generated by Django 5.0.1 on 2026-10-16 19:25
+
+from collections import Counter
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+# Boolean fields counted when true, as of this migration
+STAT_FLAGS = [
+    "needs_visa_assistance",
+    "interested_in_panels",
+    "interested_in_capacity_building",
+    "interested_in_networking",
+    "receive_updates",
+]
+
+
+def count_registrations(apps, schema_editor):
+    Registration = apps.get_model("landing", "Registration")
+    RegistrationStat = apps.get_model("landing", "RegistrationStat")
+    registrations = Registration.objects.order_by()
+
+    counts = Counter()
+    counts[("total", "")] = registrations.count()
+    for status, count in registrations.values_list("status").annotate(
+        count=Count("pk")
+    ):
+        counts[("status", status)] = count
+    days = (
+        registrations.annotate(
+            day=TruncDate("created_at", tzinfo=timezone.get_current_timezone())
+        )
+        .values_list("day")
+        .annotate(count=Count("pk"))
+    )
+    for day, count in days:
+        counts[("day", day.isoformat())] = count
+    flags = registrations.aggregate(
+        **{flag: Count("pk", filter=Q(**{flag: True})) for flag in STAT_FLAGS}
+    )
+    for flag, count in flags.items():
+        counts[("flag", flag)] = count
+
+    RegistrationStat.objects.bulk_create(
+        RegistrationStat(dimension=dimension, value=value, count=count)
+        for (dimension, value), count in counts.items()
+        if count
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("landing", "0008_registration_countries"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RegistrationStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "dimension",
+                    models.CharField(max_length=20, verbose_name="Dimension"),
+                ),
+                (
+                    "value",
+                    models.CharField(blank=True, max_length=50, verbose_name="Value"),
+                ),
+                ("count", models.IntegerField(default=0, verbose_name="Count")),
+            ],
+            options={
+                "verbose_name": "Registration Statistic",
+                "verbose_name_plural": "Registration Statistics",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="registrationstat",
+            constraint=models.UniqueConstraint(
+                fields=("dimension", "value"), name="registration_stat_unique"
+            ),
+        ),
+        migrations.RunPython(count_registrations, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,26 @@
 import uuid
-from django.db import models
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, connection, models, transaction
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import RegexValidator
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from ckeditor.fields import RichTextField
 from django.utils.text import slugify
+from django_countries.fields import CountryField
 from parler.models import TranslatableModel, TranslatedFields
 
+from .singletons import get_singleton
+from .translation_cache import TranslationCacheManager
+
+# email__lower=... compiles to LOWER(email) = ..., which the functional
+# indexes on Lower("email") below can serve (iexact uses UPPER on PostgreSQL)
+models.EmailField.register_lookup(Lower)
+
 
 class TimeStampedModel(models.Model):
     """Modèle abstrait pour ajouter id UUID, created_at et updated_at"""
@@ -18,7 +33,19 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
-class EventConfiguration(TimeStampedModel, TranslatableModel):
+class CachedTranslatableModel(TranslatableModel):
+    """Modèle abstrait bilingue dont les traductions sont lues via le cache partagé"""
+
+    objects = TranslationCacheManager()
+
+    class Meta:
+        abstract = True
+
+
+DEFAULT_REGISTRATION_PREFIX = "TCP2025"
+
+
+class EventConfiguration(TimeStampedModel, CachedTranslatableModel):
     """Configuration générale de l'événement - Bilingue"""
 
     translations = TranslatedFields(
@@ -41,6 +68,12 @@ class EventConfiguration(TimeStampedModel, TranslatableModel):
     end_date = models.DateTimeField(_("End Date"))
     location = models.CharField(_("Location"), max_length=255, default="Abuja, Nigeria")
     registration_deadline = models.DateTimeField(_("Registration Deadline"))
+    registration_prefix = models.CharField(
+        _("Registration Number Prefix"),
+        max_length=20,
+        default=DEFAULT_REGISTRATION_PREFIX,
+        help_text=_("e.g., TCP2025 gives TCP2025-0001"),
+    )
 
     # Assets
     logo = models.ImageField(_("Logo"), upload_to="event/logos/")
@@ -58,8 +91,19 @@ class EventConfiguration(TimeStampedModel, TranslatableModel):
     def __str__(self):
         return self.safe_translation_getter("event_name", any_language=True)
 
+    def is_registration_open(self):
+        """Inscriptions ouvertes et date limite non dépassée"""
+        return self.registration_open and timezone.now() <= self.registration_deadline
+
+    @classmethod
+    def current_registration_prefix(cls):
+        event = get_singleton(cls)
+        if event is None or not event.registration_prefix:
+            return DEFAULT_REGISTRATION_PREFIX
+        return event.registration_prefix
 
-class AboutSection(TimeStampedModel, TranslatableModel):
+
+class AboutSection(TimeStampedModel, CachedTranslatableModel):
     """Section À propos / Message du Comptroller - Bilingue"""
 
     translations = TranslatedFields(
@@ -91,7 +135,7 @@ class AboutSection(TimeStampedModel, TranslatableModel):
         return f"{self.safe_translation_getter('title', any_language=True)} - {self.comptroller_name}"
 
 
-class Speaker(TimeStampedModel, TranslatableModel):
+class Speaker(TimeStampedModel, CachedTranslatableModel):
     """Intervenants de l'événement - Bilingue"""
 
     SPEAKER_CATEGORIES = [
@@ -106,6 +150,11 @@ class Speaker(TimeStampedModel, TranslatableModel):
         ),
         organization=models.CharField(_("Organization"), max_length=255),
         bio=models.TextField(_("Bio")),
+        # Weighted vector in the translation's own language, see landing.search
+        search_vector=SearchVectorField(null=True, editable=False),
+        meta={
+            "indexes": [GinIndex(fields=["search_vector"], name="speaker_search_idx")]
+        },
     )
 
     full_name = models.CharField(_("Full Name"), max_length=255)
@@ -126,12 +175,26 @@ class Speaker(TimeStampedModel, TranslatableModel):
         verbose_name = _("Speaker")
         verbose_name_plural = _("Speakers")
         ordering = ["order", "full_name"]
+        indexes = [
+            models.Index(
+                fields=["order", "full_name"],
+                condition=Q(is_active=True),
+                name="speaker_active_order_idx",
+            ),
+            # Misspelt names (landing.search); needs the pg_trgm extension,
+            # created by a TrigramExtension() operation before this index
+            GinIndex(
+                fields=["full_name"],
+                opclasses=["gin_trgm_ops"],
+                name="speaker_name_trgm_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.full_name} - {self.get_category_display()}"
 
 
-class ProgramDay(TimeStampedModel, TranslatableModel):
+class ProgramDay(TimeStampedModel, CachedTranslatableModel):
     """Jours du programme - Bilingue"""
 
     translations = TranslatedFields(
@@ -158,7 +221,7 @@ class ProgramDay(TimeStampedModel, TranslatableModel):
         )
 
 
-class ProgramSession(TimeStampedModel, TranslatableModel):
+class ProgramSession(TimeStampedModel, CachedTranslatableModel):
     """Sessions du programme - Bilingue"""
 
     SESSION_TYPES = [
@@ -176,6 +239,10 @@ class ProgramSession(TimeStampedModel, TranslatableModel):
         title=models.CharField(_("Title"), max_length=255),
         description=RichTextField(_("Description"), blank=True),
         venue=models.CharField(_("Venue"), max_length=255, blank=True),
+        search_vector=SearchVectorField(null=True, editable=False),
+        meta={
+            "indexes": [GinIndex(fields=["search_vector"], name="session_search_idx")]
+        },
     )
 
     program_day = models.ForeignKey(
@@ -222,12 +289,19 @@ class ProgramSession(TimeStampedModel, TranslatableModel):
         verbose_name = _("Program Session")
         verbose_name_plural = _("Program Sessions")
         ordering = ["program_day__day_number", "start_time", "order"]
+        indexes = [
+            models.Index(
+                fields=["program_day", "start_time", "order"],
+                condition=Q(is_active=True),
+                name="session_active_day_time_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.program_day} - {self.start_time} - {self.safe_translation_getter('title', any_language=True)}"
 
 
-class Venue(TimeStampedModel, TranslatableModel):
+class Venue(TimeStampedModel, CachedTranslatableModel):
     """Lieux de l'événement - Bilingue"""
 
     translations = TranslatedFields(
@@ -243,6 +317,8 @@ class Venue(TimeStampedModel, TranslatableModel):
             _("Distance from Airport"), max_length=100
         ),
         rating=models.CharField(_("Rating"), max_length=50, blank=True),
+        search_vector=SearchVectorField(null=True, editable=False),
+        meta={"indexes": [GinIndex(fields=["search_vector"], name="venue_search_idx")]},
     )
 
     # Links
@@ -259,12 +335,19 @@ class Venue(TimeStampedModel, TranslatableModel):
         verbose_name = _("Venue")
         verbose_name_plural = _("Venues")
         ordering = ["order"]
+        indexes = [
+            models.Index(
+                fields=["order"],
+                condition=Q(is_active=True),
+                name="venue_active_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.safe_translation_getter("name", any_language=True)
 
 
-class Partner(TimeStampedModel, TranslatableModel):
+class Partner(TimeStampedModel, CachedTranslatableModel):
     """Partenaires de l'événement - Bilingue"""
 
     PARTNER_TYPES = [
@@ -292,12 +375,19 @@ class Partner(TimeStampedModel, TranslatableModel):
         verbose_name = _("Partner")
         verbose_name_plural = _("Partners")
         ordering = ["order"]
+        indexes = [
+            models.Index(
+                fields=["order"],
+                condition=Q(is_active=True),
+                name="partner_active_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.get_partner_type_display()}"
 
 
-class Hotel(TimeStampedModel, TranslatableModel):
+class Hotel(TimeStampedModel, CachedTranslatableModel):
     """Hébergements recommandés - Bilingue"""
 
     translations = TranslatedFields(
@@ -325,12 +415,19 @@ class Hotel(TimeStampedModel, TranslatableModel):
         verbose_name = _("Hotel")
         verbose_name_plural = _("Hotels")
         ordering = ["order"]
+        indexes = [
+            models.Index(
+                fields=["order"],
+                condition=Q(is_active=True),
+                name="hotel_active_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
 
-class RoomType(TimeStampedModel, TranslatableModel):
+class RoomType(TimeStampedModel, CachedTranslatableModel):
     """Types de chambres d'hôtel - Bilingue"""
 
     translations = TranslatedFields(
@@ -353,12 +450,19 @@ class RoomType(TimeStampedModel, TranslatableModel):
         verbose_name = _("Room Type")
         verbose_name_plural = _("Room Types")
         ordering = ["hotel", "order"]
+        indexes = [
+            models.Index(
+                fields=["hotel", "order"],
+                condition=Q(is_active=True),
+                name="roomtype_active_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.hotel.name} - {self.safe_translation_getter('name', any_language=True)}"
 
 
-class LogisticInfo(TimeStampedModel, TranslatableModel):
+class LogisticInfo(TimeStampedModel, CachedTranslatableModel):
     """Informations logistiques - Bilingue"""
 
     LOGISTIC_TYPES = [
@@ -373,6 +477,10 @@ class LogisticInfo(TimeStampedModel, TranslatableModel):
         title=models.CharField(_("Title"), max_length=255),
         description=RichTextField(_("Description")),
         content=RichTextField(_("Content")),
+        search_vector=SearchVectorField(null=True, editable=False),
+        meta={
+            "indexes": [GinIndex(fields=["search_vector"], name="logistic_search_idx")]
+        },
     )
 
     logistic_type = models.CharField(
@@ -389,7 +497,7 @@ class LogisticInfo(TimeStampedModel, TranslatableModel):
         return f"{self.get_logistic_type_display()}"
 
 
-class Contact(TimeStampedModel, TranslatableModel):
+class Contact(TimeStampedModel, CachedTranslatableModel):
     """Contacts de l'organisation - Bilingue"""
 
     CONTACT_TYPES = [
@@ -420,11 +528,82 @@ class Contact(TimeStampedModel, TranslatableModel):
         verbose_name = _("Contact")
         verbose_name_plural = _("Contacts")
         ordering = ["contact_type", "order"]
+        indexes = [
+            models.Index(
+                fields=["contact_type", "order"],
+                condition=Q(is_active=True),
+                name="contact_active_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.full_name} - {self.get_contact_type_display()}"
 
 
+class RegistrationCounter(TimeStampedModel):
+    """Compteur des numéros d'inscription par préfixe d'événement"""
+
+    prefix = models.CharField(_("Prefix"), max_length=20, unique=True)
+    last_number = models.PositiveIntegerField(_("Last Number"), default=0)
+
+    class Meta:
+        verbose_name = _("Registration Counter")
+        verbose_name_plural = _("Registration Counters")
+
+    def __str__(self):
+        return f"{self.prefix} - {self.last_number}"
+
+    @staticmethod
+    def format_number(prefix, number):
+        return f"{prefix}-{number:04d}"
+
+    @classmethod
+    def allocate(cls, count=1, prefix=None):
+        """Réserve `count` numéros consécutifs et retourne les numéros formatés"""
+        prefix = prefix or EventConfiguration.current_registration_prefix()
+        last_number = cls._increment(prefix, count)
+        if last_number is None:
+            cls._create_counter(prefix)
+            last_number = cls._increment(prefix, count)
+        first_number = last_number - count + 1
+        return [
+            cls.format_number(prefix, number)
+            for number in range(first_number, last_number + 1)
+        ]
+
+    @classmethod
+    def _increment(cls, prefix, count):
+        # A single UPDATE ... RETURNING takes the row lock, bumps the counter
+        # and reads it back, so concurrent callers always get disjoint blocks
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET last_number = last_number + %s "
+                f"WHERE prefix = %s RETURNING last_number",
+                [count, prefix],
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    @classmethod
+    def _create_counter(cls, prefix):
+        # Seed from numbers issued before the counter existed
+        start = 0
+        existing = Registration.objects.filter(
+            registration_number__startswith=f"{prefix}-"
+        ).values_list("registration_number", flat=True)
+        for number in existing.iterator():
+            suffix = number.rsplit("-", 1)[-1]
+            if suffix.isdigit():
+                start = max(start, int(suffix))
+        try:
+            with transaction.atomic():
+                cls.objects.create(prefix=prefix, last_number=start)
+        except IntegrityError:
+            # Another worker created it first
+            pass
+
+
 class Registration(TimeStampedModel):
     """Inscriptions des participants"""
 
@@ -433,7 +612,9 @@ class Registration(TimeStampedModel):
     organization = models.CharField(_("Organization"), max_length=255)
     position = models.CharField(_("Position"), max_length=255, blank=True)
     city = models.CharField(_("City"), max_length=255, blank=True)
-    country = models.CharField(_("Country"), max_length=255)
+    # ISO 3166-1 alpha-2, normalized from the free text of the forms and imports
+    # (landing.countries); "normalize_countries" converts older values
+    country = CountryField(_("Country"))
 
     # Contact Details
     email = models.EmailField(_("Email"))
@@ -485,26 +666,62 @@ class Registration(TimeStampedModel):
         verbose_name = _("Registration")
         verbose_name_plural = _("Registrations")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(Lower("email"), name="registration_email_lower_idx"),
+            models.Index(
+                fields=["status", "-created_at"], name="registration_status_idx"
+            ),
+            models.Index(
+                fields=["country", "-created_at"], name="registration_country_idx"
+            ),
+            BrinIndex(fields=["created_at"], name="registration_created_brin"),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.registration_number:
-            # Generate registration number: TCP2025-XXXX
-            last_reg = Registration.objects.order_by("-created_at").first()
-            if last_reg and last_reg.registration_number:
-                try:
-                    last_num = int(last_reg.registration_number.split("-")[-1])
-                    new_num = last_num + 1
-                except:
-                    new_num = 1
-            else:
-                new_num = 1
-            self.registration_number = f"TCP2025-{new_num:04d}"
+            # Generate registration number: <prefix>-XXXX
+            self.registration_number = RegistrationCounter.allocate()[0]
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.registration_number} - {self.fullname}"
 
 
+class RegistrationCountryCount(models.Model):
+    """Nombre d'inscriptions par pays, tenu à jour à chaque écriture (filtres admin)"""
+
+    country = CountryField(_("Country"), primary_key=True)
+    count = models.PositiveIntegerField(_("Count"), default=0)
+
+    class Meta:
+        verbose_name = _("Registrations per Country")
+        verbose_name_plural = _("Registrations per Country")
+
+    def __str__(self):
+        return f"{self.country.name}: {self.count}"
+
+
+class RegistrationStat(models.Model):
+    """Compteurs agrégés des inscriptions (tableau de bord), tenus à jour à chaque écriture"""
+
+    # total / status / day (ISO date of created_at) / flag (boolean field name)
+    dimension = models.CharField(_("Dimension"), max_length=20)
+    value = models.CharField(_("Value"), max_length=50, blank=True)
+    count = models.IntegerField(_("Count"), default=0)
+
+    class Meta:
+        verbose_name = _("Registration Statistic")
+        verbose_name_plural = _("Registration Statistics")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dimension", "value"], name="registration_stat_unique"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.dimension}:{self.value} = {self.count}"
+
+
 class ContactMessage(TimeStampedModel):
     """Messages de contact depuis le formulaire"""
 
@@ -535,17 +752,27 @@ class ContactMessage(TimeStampedModel):
         verbose_name = _("Contact Message")
         verbose_name_plural = _("Contact Messages")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["-created_at"],
+                condition=Q(is_read=False),
+                name="contactmessage_unread_idx",
+            ),
+            BrinIndex(fields=["created_at"], name="contactmessage_created_brin"),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} - {self.get_subject_display()}"
 
 
-class FAQ(TimeStampedModel, TranslatableModel):
+class FAQ(TimeStampedModel, CachedTranslatableModel):
     """Questions fréquemment posées - Bilingue"""
 
     translations = TranslatedFields(
         question=models.CharField(_("Question"), max_length=500),
         answer=RichTextField(_("Answer")),
+        search_vector=SearchVectorField(null=True, editable=False),
+        meta={"indexes": [GinIndex(fields=["search_vector"], name="faq_search_idx")]},
     )
 
     order = models.IntegerField(_("Display Order"), default=0)
@@ -555,6 +782,13 @@ class FAQ(TimeStampedModel, TranslatableModel):
         verbose_name = _("FAQ")
         verbose_name_plural = _("FAQs")
         ordering = ["order"]
+        indexes = [
+            models.Index(
+                fields=["order"],
+                condition=Q(is_active=True),
+                name="faq_active_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.safe_translation_getter("question", any_language=True)
@@ -563,12 +797,171 @@ class FAQ(TimeStampedModel, TranslatableModel):
 class Newsletter(TimeStampedModel):
     """Abonnés à la newsletter"""
 
-    email = models.EmailField(_("Email"), unique=True)
+    # Unique ignoring case, through the constraint below
+    email = models.EmailField(_("Email"))
+    language = models.CharField(
+        _("Language"),
+        max_length=10,
+        choices=settings.LANGUAGES,
+        default=settings.LANGUAGE_CODE,
+    )
     is_active = models.BooleanField(_("Is Active"), default=True)
 
     class Meta:
         verbose_name = _("Newsletter Subscription")
         verbose_name_plural = _("Newsletter Subscriptions")
+        constraints = [
+            models.UniqueConstraint(
+                Lower("email"), name="newsletter_email_lower_unique"
+            ),
+        ]
 
     def __str__(self):
         return self.email
+
+
+class NewsletterCampaign(TimeStampedModel, CachedTranslatableModel):
+    """Campagnes de newsletter envoyées aux abonnés actifs - Bilingue"""
+
+    STATUS_CHOICES = [
+        ("draft", _("Draft")),
+        ("scheduled", _("Scheduled")),
+        ("sending", _("Sending")),
+        ("sent", _("Sent")),
+        ("cancelled", _("Cancelled")),
+    ]
+
+    translations = TranslatedFields(
+        subject=models.CharField(_("Subject"), max_length=255),
+        body=RichTextField(_("Body")),
+    )
+
+    status = models.CharField(
+        _("Status"), max_length=20, choices=STATUS_CHOICES, default="draft"
+    )
+    # Keyset checkpoint: every active subscriber with a smaller id has been handled
+    last_subscriber_id = models.UUIDField(_("Last Subscriber"), null=True, blank=True)
+    total_recipients = models.PositiveIntegerField(_("Total Recipients"), default=0)
+    sent_count = models.PositiveIntegerField(_("Sent"), default=0)
+    failed_count = models.PositiveIntegerField(_("Failed"), default=0)
+    started_at = models.DateTimeField(_("Started At"), null=True, blank=True)
+    finished_at = models.DateTimeField(_("Finished At"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("Newsletter Campaign")
+        verbose_name_plural = _("Newsletter Campaigns")
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return self.safe_translation_getter("subject", any_language=True) or ""
+
+    @property
+    def progress(self):
+        if not self.total_recipients:
+            return 100 if self.status == "sent" else 0
+        handled = self.sent_count + self.failed_count
+        return min(100, int(handled * 100 / self.total_recipients))
+
+
+def private_storage():
+    """Stockage des fichiers non publics (hors MEDIA_ROOT)"""
+    return FileSystemStorage(location=settings.PRIVATE_MEDIA_ROOT)
+
+
+class ExportJob(TimeStampedModel):
+    """Exports XLSX générés en arrière-plan"""
+
+    STATUS_CHOICES = [
+        ("pending", _("Pending")),
+        ("running", _("Running")),
+        ("done", _("Done")),
+        ("failed", _("Failed")),
+    ]
+
+    model_label = models.CharField(
+        _("Model"), max_length=100, help_text=_("e.g., landing.registration")
+    )
+    query_string = models.TextField(_("Filters"), blank=True)
+    status = models.CharField(
+        _("Status"), max_length=20, choices=STATUS_CHOICES, default="pending"
+    )
+    total_rows = models.PositiveIntegerField(_("Total Rows"), default=0)
+    processed_rows = models.PositiveIntegerField(_("Processed Rows"), default=0)
+    file = models.FileField(
+        _("File"), upload_to="exports/", storage=private_storage, blank=True
+    )
+    error = models.TextField(_("Error"), blank=True)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="export_jobs",
+        verbose_name=_("Requested By"),
+    )
+    finished_at = models.DateTimeField(_("Finished At"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("Export Job")
+        verbose_name_plural = _("Export Jobs")
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.model_label} - {self.get_status_display()}"
+
+    @property
+    def progress(self):
+        if not self.total_rows:
+            return 100 if self.status == "done" else 0
+        return int(self.processed_rows * 100 / self.total_rows)
+
+
+class OutboxEmail(TimeStampedModel):
+    """E-mails transactionnels en attente d'envoi (écrits dans la transaction métier)"""
+
+    STATUS_CHOICES = [
+        ("pending", _("Pending")),
+        ("sending", _("Sending")),
+        ("sent", _("Sent")),
+        ("failed", _("Failed")),
+    ]
+
+    to = models.TextField(_("Recipients"), help_text=_("Comma-separated addresses"))
+    from_email = models.CharField(_("From"), max_length=255, blank=True)
+    reply_to = models.CharField(_("Reply To"), max_length=255, blank=True)
+    subject = models.CharField(_("Subject"), max_length=255)
+    body = models.TextField(_("Body"))
+    html_body = models.TextField(_("HTML Body"), blank=True)
+    reference = models.CharField(
+        _("Reference"),
+        max_length=100,
+        blank=True,
+        help_text=_("e.g., registration number"),
+    )
+
+    status = models.CharField(
+        _("Status"), max_length=20, choices=STATUS_CHOICES, default="pending"
+    )
+    attempts = models.PositiveIntegerField(_("Attempts"), default=0)
+    next_attempt_at = models.DateTimeField(_("Next Attempt"), default=timezone.now)
+    last_error = models.TextField(_("Last Error"), blank=True)
+    sent_at = models.DateTimeField(_("Sent At"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("Outbox Email")
+        verbose_name_plural = _("Outbox Emails")
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at"],
+                condition=Q(status="pending"),
+                name="outbox_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.to} - {self.subject}"
+
+    @property
+    def recipients(self):
+        return [address.strip() for address in self.to.split(",") if address.strip()]
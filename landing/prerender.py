@@ -0,0 +1,129 @@
+import gzip
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils import translation
+
+from .content import (
+    bump_content_version,
+    clear_landing_context,
+    get_landing_page_context,
+    rebuild_landing_context,
+    touch_landing_last_modified,
+)
+from .singletons import bump_singleton_version
+from .translation_cache import bump_translation_versions
+
+logger = logging.getLogger("events")
+
+LANDING_TEMPLATE = "index.html"
+
+
+def prerendered_page_path(language_code):
+    return Path(settings.PRERENDER_ROOT) / language_code / "index.html"
+
+
+def _write_atomic(path, data):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def prerender_landing_pages():
+    """Génère une copie HTML statique de la page d'accueil pour chaque langue"""
+
+    written = []
+    for code, _name in settings.LANGUAGES:
+        with translation.override(code):
+            html = render_to_string(LANDING_TEMPLATE, get_landing_page_context(code))
+        content = html.encode(settings.DEFAULT_CHARSET)
+
+        path = prerendered_page_path(code)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # The compressed sibling is written first so WhiteNoise never pairs a
+        # fresh page with an outdated .gz
+        _write_atomic(path.with_name(path.name + ".gz"), gzip.compress(content))
+        _write_atomic(path, content)
+        written.append(path)
+
+    logger.info(
+        "Landing page pre-rendered for %s", ", ".join(c for c, _ in settings.LANGUAGES)
+    )
+    return written
+
+
+def clear_prerendered_pages():
+    shutil.rmtree(settings.PRERENDER_ROOT, ignore_errors=True)
+
+
+def refresh_landing_pages(groups=()):
+    """Publie un changement de contenu validé: contexte, fragments, validateurs, pages
+
+    The context is rebuilt before the fragment versions of `groups` and the
+    last-modified stamp change, so nothing gets cached or validated under the
+    new ones with the previous content.
+    """
+
+    try:
+        rebuild_landing_context()
+    except Exception:
+        # Rebuilt by the next request rather than served stale under new stamps
+        clear_landing_context()
+        raise
+    finally:
+        for group in groups:
+            bump_content_version(group)
+        touch_landing_last_modified()
+    prerender_landing_pages()
+
+
+class _PendingRefresh:
+    """Changements de contenu d'une transaction, publiés ensemble après validation"""
+
+    def __init__(self):
+        self.groups = set()
+        self.singletons = set()
+        # (model, pk) of the objects whose translations changed
+        self.translations = set()
+        self.done = False
+
+    def __call__(self):
+        # Queued once per savepoint level: only the first callback to run refreshes
+        if self.done:
+            return
+        self.done = True
+        connection = transaction.get_connection()
+        if getattr(connection, "_landing_refresh", None) is self:
+            # Changes made from now on queue a refresh of their own
+            connection._landing_refresh = None
+        # The caches the rebuild reads from are invalidated first
+        bump_translation_versions(self.translations)
+        for model in self.singletons:
+            bump_singleton_version(model)
+        refresh_landing_pages(sorted(self.groups))
+
+
+def queue_landing_refresh(groups=(), singletons=(), translations=()):
+    """Programme une seule actualisation des pages par transaction, après validation
+
+    Changes made later in the same transaction join the refresh queued by the
+    first one; outside a transaction it runs right away.
+    """
+
+    connection = transaction.get_connection()
+    pending = getattr(connection, "_landing_refresh", None)
+    if pending is None:
+        pending = connection._landing_refresh = _PendingRefresh()
+    pending.groups.update(groups)
+    pending.singletons.update(singletons)
+    pending.translations.update(translations)
+    # Registered on every call: a callback queued inside a savepoint that is
+    # rolled back is dropped, this one still runs at commit. After a full
+    # rollback nothing runs and the next transaction reuses the same pending
+    # refresh, which then only refreshes a little more than needed.
+    transaction.on_commit(pending, robust=True)
@@ -0,0 +1,231 @@
+import html
+import logging
+from operator import attrgetter
+
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, Func, TextField, Value
+from django.urls import reverse
+from django.utils import translation
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+
+from .models import FAQ, LogisticInfo, ProgramSession, Speaker, Venue
+
+logger = logging.getLogger("events")
+
+# Configuration text search PostgreSQL de chaque langue du site
+SEARCH_CONFIGS = {"fr": "french", "en": "english"}
+DEFAULT_SEARCH_CONFIG = "simple"
+
+# Indexed content, read from the translation rows ("master." for the shared
+# model): (attribute, weight) pairs, the result title and the headline source
+SEARCH_MODELS = {
+    Speaker: {
+        "fields": [
+            ("master.full_name", "A"),
+            ("title", "B"),
+            ("organization", "B"),
+            ("bio", "C"),
+        ],
+        "title": "master.full_name",
+        "headline": "bio",
+        "anchor": "speakers",
+    },
+    ProgramSession: {
+        "fields": [("title", "A"), ("venue", "B"), ("description", "C")],
+        "title": "title",
+        "headline": "description",
+        "anchor": "programs",
+    },
+    Venue: {
+        "fields": [
+            ("name", "A"),
+            ("address", "B"),
+            ("sessions_info", "C"),
+            ("description", "C"),
+        ],
+        "title": "name",
+        "headline": "description",
+        "anchor": "venues",
+    },
+    LogisticInfo: {
+        "fields": [("title", "A"), ("description", "B"), ("content", "C")],
+        "title": "title",
+        "headline": "content",
+        "anchor": "logistics",
+    },
+    FAQ: {
+        "fields": [("question", "A"), ("answer", "B")],
+        "title": "question",
+        "headline": "answer",
+        "anchor": "contact",
+    },
+}
+
+SEARCH_RESULTS_PER_MODEL = 20
+# Highlight markers, replaced by <mark> once the headline has been escaped
+START_SEL, STOP_SEL = "\x02", "\x03"
+
+
+class StripTags(Func):
+    """Texte d'un champ RichText sans balises, pour ts_headline"""
+
+    function = "regexp_replace"
+    template = "%(function)s(%(expressions)s, '<[^>]*>', ' ', 'g')"
+    output_field = TextField()
+
+
+def search_config(language_code):
+    return SEARCH_CONFIGS.get(language_code, DEFAULT_SEARCH_CONFIG)
+
+
+def _translation_model(model):
+    return model._parler_meta.root_model
+
+
+def _plain_text(value):
+    return html.unescape(strip_tags(value or ""))
+
+
+# ========== INDEXING ==========
+
+
+def update_translation_vector(row):
+    """Recalcule le vecteur pondéré d'une ligne de traduction"""
+
+    spec = SEARCH_MODELS[row.master.__class__]
+    config = search_config(row.language_code)
+    vector = None
+    for path, weight in spec["fields"]:
+        text = _plain_text(attrgetter(path)(row))
+        part = SearchVector(
+            Value(text, output_field=TextField()), weight=weight, config=config
+        )
+        vector = part if vector is None else vector + part
+    # update() sends no signal, the save that got us here is not re-entered
+    type(row).objects.filter(pk=row.pk).update(search_vector=vector)
+
+
+def update_search_vectors(instance):
+    """Recalcule les vecteurs de toutes les traductions d'un objet indexé"""
+    for row in instance.translations.all():
+        update_translation_vector(row)
+
+
+def rebuild_search_index():
+    count = 0
+    for model in SEARCH_MODELS:
+        for instance in model.objects.prefetch_related("translations"):
+            update_search_vectors(instance)
+            count += 1
+    logger.info("Search vectors rebuilt for %s objects", count)
+    return count
+
+
+# ========== QUERIES ==========
+
+
+def _highlight(headline):
+    return mark_safe(
+        escape(" ".join(html.unescape(headline or "").split()))
+        .replace(START_SEL, "<mark>")
+        .replace(STOP_SEL, "</mark>")
+    )
+
+
+def _result(model, row, rank, headline):
+    spec = SEARCH_MODELS[model]
+    return {
+        "model": model,
+        "type": model._meta.verbose_name,
+        "object": row.master,
+        "title": attrgetter(spec["title"])(row),
+        "headline": _highlight(headline),
+        "rank": rank,
+        "url": f"{reverse('landing:index')}#{spec['anchor']}",
+    }
+
+
+def _full_text_results(model, query, language_code, limit):
+    spec = SEARCH_MODELS[model]
+    rows = (
+        _translation_model(model)
+        .objects.filter(
+            language_code=language_code,
+            search_vector=query,
+            master__is_active=True,
+        )
+        .select_related("master")
+        # normalization 32: rank / (rank + 1), comparable across models
+        .annotate(
+            rank=SearchRank(F("search_vector"), query, normalization=32),
+            headline=SearchHeadline(
+                StripTags(spec["headline"]),
+                query,
+                config=search_config(language_code),
+                start_sel=START_SEL,
+                stop_sel=STOP_SEL,
+                max_fragments=2,
+            ),
+        )
+        .order_by("-rank")[:limit]
+    )
+    return [_result(model, row, row.rank, row.headline) for row in rows]
+
+
+def _speaker_name_results(text, language_code, limit):
+    """Intervenants au nom proche (fautes de frappe), par similarité trigramme"""
+
+    # The lookup (%> operator, pg_trgm.word_similarity_threshold) is the one
+    # the trigram index on full_name can serve
+    speakers = (
+        Speaker.objects.filter(is_active=True, full_name__trigram_word_similar=text)
+        .annotate(similarity=TrigramWordSimilarity(text, "full_name"))
+        .prefetch_related("translations")
+        .order_by("-similarity")[:limit]
+    )
+    results = []
+    for speaker in speakers:
+        speaker.set_current_language(language_code)
+        results.append(
+            {
+                "model": Speaker,
+                "type": Speaker._meta.verbose_name,
+                "object": speaker,
+                "title": speaker.full_name,
+                "headline": escape(
+                    speaker.safe_translation_getter("title", any_language=True)
+                ),
+                "rank": speaker.similarity,
+                "url": f"{reverse('landing:index')}#speakers",
+            }
+        )
+    return results
+
+
+def search(text, language_code=None, limit=SEARCH_RESULTS_PER_MODEL):
+    """Recherche classée dans le contenu publié, avec extraits surlignés"""
+
+    text = text.strip()
+    if not text:
+        return []
+    language_code = language_code or translation.get_language()
+    query = SearchQuery(
+        text, search_type="websearch", config=search_config(language_code)
+    )
+
+    results = []
+    for model in SEARCH_MODELS:
+        results.extend(_full_text_results(model, query, language_code, limit))
+
+    if not any(result["model"] is Speaker for result in results):
+        # Names are not stemmed words: a misspelt name finds nothing above
+        results.extend(_speaker_name_results(text, language_code, limit))
+
+    return sorted(results, key=lambda result: result["rank"], reverse=True)
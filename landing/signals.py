@@ -0,0 +1,204 @@
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from .content import LANDING_MODELS, content_group
+from .countries import country_on_delete, country_on_save, remember_country
+from .counters import (
+    COUNTERS,
+    counters_on_delete,
+    counters_on_save,
+    remember_counter_state,
+)
+from .images import IMAGE_FIELDS, generate_instance_variants
+from .mail import queue_email, registration_confirmation
+from .models import (
+    AboutSection,
+    CachedTranslatableModel,
+    EventConfiguration,
+    ProgramSession,
+    Registration,
+)
+from .prerender import queue_landing_refresh
+from .stats import remember_stat_keys, stats_on_delete, stats_on_save
+from .search import SEARCH_MODELS, update_search_vectors, update_translation_vector
+from .translation_cache import bump_translation_versions
+
+
+def _with_translations(models):
+    """Ajoute les modèles de traduction parler aux modèles donnés"""
+    senders = []
+    for model in models:
+        senders.append(model)
+        if hasattr(model, "_parler_meta"):
+            senders.extend(meta.model for meta in model._parler_meta)
+    return senders
+
+
+LANDING_SENDERS = _with_translations(LANDING_MODELS)
+# Kept in every worker's memory by singletons.get_singleton
+SINGLETON_SENDERS = {
+    sender: model
+    for model in (EventConfiguration, AboutSection)
+    for sender in _with_translations([model])
+}
+# Translation model -> model whose shared translation cache it invalidates
+TRANSLATION_MASTERS = {
+    meta.model: model for model in LANDING_MODELS for meta in model._parler_meta
+}
+
+
+# ========== TRANSLATION CACHE ==========
+
+
+def translation_changed(sender, instance, **kwargs):
+    master = (sender._meta.get_field("master").related_model, instance.master_id)
+    # Once committed, or a concurrent read could cache the previous rows again
+    transaction.on_commit(lambda: bump_translation_versions([master]))
+
+
+# Landing models are left to the page refresh, which invalidates their cached
+# translations before rebuilding the context (landing_content_changed)
+for _model in apps.get_app_config("landing").get_models():
+    if issubclass(_model, CachedTranslatableModel) and _model not in LANDING_MODELS:
+        for _meta in _model._parler_meta:
+            post_save.connect(
+                translation_changed,
+                sender=_meta.model,
+                dispatch_uid=f"translation_cache_save_{_meta.model.__name__}",
+            )
+            post_delete.connect(
+                translation_changed,
+                sender=_meta.model,
+                dispatch_uid=f"translation_cache_delete_{_meta.model.__name__}",
+            )
+
+
+# ========== LANDING PAGE ==========
+
+
+def landing_content_changed(sender, instance, **kwargs):
+    # Published once the change is visible to other connections, in one
+    # refresh per transaction however many rows it touches
+    group = content_group(sender)
+    singleton = SINGLETON_SENDERS.get(sender)
+    master = TRANSLATION_MASTERS.get(sender)
+    queue_landing_refresh(
+        groups=[group] if group else [],
+        singletons=[singleton] if singleton else [],
+        translations=[(master, instance.master_id)] if master else [],
+    )
+
+
+for _sender in LANDING_SENDERS:
+    post_save.connect(
+        landing_content_changed,
+        sender=_sender,
+        dispatch_uid=f"landing_save_{_sender.__name__}",
+    )
+    post_delete.connect(
+        landing_content_changed,
+        sender=_sender,
+        dispatch_uid=f"landing_delete_{_sender.__name__}",
+    )
+
+
+@receiver(m2m_changed, sender=ProgramSession.speakers.through)
+def session_speakers_changed(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        queue_landing_refresh(groups=["program"])
+
+
+@receiver(post_save, sender=Registration)
+def registration_created(sender, instance, created, raw=False, **kwargs):
+    # Written in the same transaction as the registration, sent by send_outbox
+    if created and not raw:
+        queue_email(registration_confirmation(instance))
+
+
+# ========== IMAGE VARIANTS ==========
+
+
+def image_model_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        # Built at upload time so visitors never wait for Pillow
+        transaction.on_commit(lambda: generate_instance_variants(instance))
+
+
+for _label in IMAGE_FIELDS:
+    post_save.connect(
+        image_model_saved,
+        sender=apps.get_model(_label),
+        dispatch_uid=f"image_variants_{_label}",
+    )
+
+
+# ========== SEARCH VECTORS ==========
+
+
+def searchable_saved(sender, instance, raw=False, **kwargs):
+    # Shared fields (Speaker.full_name) are part of every translation's vector
+    if not raw:
+        update_search_vectors(instance)
+
+
+def searchable_translation_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        update_translation_vector(instance)
+
+
+for _model in SEARCH_MODELS:
+    post_save.connect(
+        searchable_saved,
+        sender=_model,
+        dispatch_uid=f"search_vectors_{_model.__name__}",
+    )
+    post_save.connect(
+        searchable_translation_saved,
+        sender=_model._parler_meta.root_model,
+        dispatch_uid=f"search_vectors_{_model.__name__}_translation",
+    )
+
+
+# ========== ADMIN BADGE COUNTERS ==========
+
+
+def counter_model_loaded(sender, instance, **kwargs):
+    remember_counter_state(instance)
+
+
+def counter_model_saved(sender, instance, created, **kwargs):
+    counters_on_save(instance, created)
+
+
+def counter_model_deleted(sender, instance, **kwargs):
+    counters_on_delete(instance)
+
+
+for _model in {counter[0] for counter in COUNTERS.values()}:
+    post_init.connect(counter_model_loaded, sender=_model)
+    post_save.connect(counter_model_saved, sender=_model)
+    post_delete.connect(counter_model_deleted, sender=_model)
+
+
+# ========== COUNTRY FACETS AND STATISTICS ==========
+
+
+@receiver(post_init, sender=Registration)
+def registration_loaded(sender, instance, **kwargs):
+    remember_country(instance)
+    remember_stat_keys(instance)
+
+
+@receiver(post_save, sender=Registration)
+def registration_country_saved(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        country_on_save(instance, created)
+        stats_on_save(instance, created)
+
+
+@receiver(post_delete, sender=Registration)
+def registration_country_deleted(sender, instance, **kwargs):
+    country_on_delete(instance)
+    stats_on_delete(instance)
@@ -0,0 +1,87 @@
+import copy
+import logging
+import time
+from typing import Any, NamedTuple
+
+from django.core.cache import cache
+from django.utils import translation
+
+logger = logging.getLogger("events")
+
+SINGLETON_VERSION_PREFIX = "singleton:version"
+# Seconds during which a worker trusts its copy without asking the cache;
+# other workers see an admin change at most this late
+SINGLETON_CHECK_INTERVAL = 1.0
+
+
+class _LocalSingleton(NamedTuple):
+    version: int
+    instance: Any
+    exists: bool
+    checked_at: float
+
+
+# Per process: model -> copy loaded under the version stamp held in the cache
+_local = {}
+
+
+def singleton_version_key(model):
+    return f"{SINGLETON_VERSION_PREFIX}:{model._meta.label_lower}"
+
+
+def _current_version(model):
+    key = singleton_version_key(model)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def _load(model, version):
+    instance = model.objects.filter(is_active=True).prefetch_related("translations")
+    instance = instance.first()
+    exists = instance is not None or model.objects.exists()
+    return _LocalSingleton(version, instance, exists, time.monotonic())
+
+
+def _local_singleton(model):
+    local = _local.get(model)
+    now = time.monotonic()
+    if local is not None and now - local.checked_at < SINGLETON_CHECK_INTERVAL:
+        return local
+    # The version is read before the row, so the copy is never older than it
+    version = _current_version(model)
+    if local is not None and local.version == version:
+        local = local._replace(checked_at=now)
+    else:
+        local = _load(model, version)
+    _local[model] = local
+    return local
+
+
+def get_singleton(model, language_code=None):
+    """Instance active d'un modèle singleton, traductions comprises, sans requête
+
+    Each call gets its own shallow copy, set to the requested (or active)
+    language; the translations loaded with it are shared.
+    """
+
+    instance = _local_singleton(model).instance
+    if instance is None:
+        return None
+    instance = copy.copy(instance)
+    instance.set_current_language(language_code or translation.get_language())
+    return instance
+
+
+def singleton_exists(model):
+    """Vrai si le singleton a été créé, actif ou non (has_add_permission)"""
+    return _local_singleton(model).exists
+
+
+def bump_singleton_version(model):
+    """Invalide les copies du singleton de tous les workers"""
+    _local.pop(model, None)
+    cache.set(singleton_version_key(model), time.time_ns(), None)
+    logger.debug("Singleton %s invalidated", model._meta.label)
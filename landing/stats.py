@@ -0,0 +1,252 @@
+import json
+import logging
+from collections import Counter
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from .countries import country_facets
+from .models import Registration, RegistrationStat
+
+logger = logging.getLogger("events")
+
+# Boolean fields counted when true (visa demand, interests, newsletter opt-in)
+STAT_FLAGS = [
+    "needs_visa_assistance",
+    "interested_in_panels",
+    "interested_in_capacity_building",
+    "interested_in_networking",
+    "receive_updates",
+]
+STAT_FIELDS = ["status", "created_at", *STAT_FLAGS]
+
+
+def _local_day(value):
+    return timezone.localdate(value).isoformat()
+
+
+def _field_stat_keys(field, value):
+    if field == "status":
+        return [("status", value)]
+    if field == "created_at":
+        return [("day", _local_day(value))] if value else []
+    return [("flag", field)] if value else []
+
+
+def registration_stat_keys(registration):
+    """(dimension, valeur) comptées pour une inscription"""
+    return [("total", "")] + [
+        key
+        for field in STAT_FIELDS
+        for key in _field_stat_keys(field, getattr(registration, field))
+    ]
+
+
+def adjust_stats(deltas):
+    """Applique des variations {(dimension, valeur): delta} aux compteurs"""
+
+    # Always in the same order, so concurrent writers cannot deadlock
+    for (dimension, value), delta in sorted(deltas.items()):
+        if not delta:
+            continue
+        updated = RegistrationStat.objects.filter(
+            dimension=dimension, value=value
+        ).update(count=F("count") + delta)
+        if updated or delta < 0:
+            continue
+        try:
+            with transaction.atomic():
+                RegistrationStat.objects.create(
+                    dimension=dimension, value=value, count=delta
+                )
+        except IntegrityError:
+            # Created by a concurrent registration in the meantime
+            adjust_stats({(dimension, value): delta})
+
+
+def add_registrations_to_stats(registrations):
+    """Compte des inscriptions créées sans signal (bulk_create)"""
+    adjust_stats(Counter(k for r in registrations for k in registration_stat_keys(r)))
+
+
+def grouped_stats(queryset):
+    """Compteurs {(dimension, valeur): nombre} d'une sélection, calculés en base"""
+
+    counts = Counter()
+    counts[("total", "")] = queryset.count()
+    for status, count in (
+        queryset.order_by().values_list("status").annotate(count=Count("pk"))
+    ):
+        counts[("status", status)] = count
+    days = (
+        queryset.order_by()
+        .annotate(day=TruncDate("created_at", tzinfo=timezone.get_current_timezone()))
+        .values_list("day")
+        .annotate(count=Count("pk"))
+    )
+    for day, count in days:
+        counts[("day", day.isoformat())] = count
+    flags = queryset.aggregate(
+        **{flag: Count("pk", filter=Q(**{flag: True})) for flag in STAT_FLAGS}
+    )
+    for flag, count in flags.items():
+        counts[("flag", flag)] = count
+    return counts
+
+
+def update_stat_fields(model, values):
+    """Champs comptés dans les statistiques que modifie un queryset.update(**values)"""
+    if model is not Registration:
+        return []
+    return [field for field in STAT_FIELDS if field in values]
+
+
+def update_stat_deltas(groups, values):
+    """Variations des compteurs pour un update(**values) des lignes groupées
+
+    `groups` holds (previous values of the updated fields, number of rows)
+    pairs, read with one grouped query before the update.
+    """
+
+    deltas = Counter()
+    for previous, rows in groups:
+        for field, value in previous.items():
+            for key in _field_stat_keys(field, value):
+                deltas[key] -= rows
+            for key in _field_stat_keys(field, values[field]):
+                deltas[key] += rows
+    return deltas
+
+
+def reconcile_registration_stats():
+    """Recalcule tous les compteurs depuis la table des inscriptions"""
+
+    counts = grouped_stats(Registration.objects.all())
+    with transaction.atomic():
+        RegistrationStat.objects.all().delete()
+        RegistrationStat.objects.bulk_create(
+            RegistrationStat(dimension=dimension, value=value, count=count)
+            for (dimension, value), count in counts.items()
+            if count
+        )
+    logger.info("Registration statistics rebuilt (%s rows)", len(counts))
+    return len(counts)
+
+
+# ========== DASHBOARD ==========
+
+
+def registration_stats():
+    """Compteurs groupés par dimension: {"status": {"pending": 12, ...}, ...}"""
+
+    stats = {"total": {}, "status": {}, "day": {}, "flag": {}}
+    for dimension, value, count in RegistrationStat.objects.values_list(
+        "dimension", "value", "count"
+    ):
+        stats.setdefault(dimension, {})[value] = count
+    return stats
+
+
+def daily_series(days_counts, days=30):
+    """Inscriptions des `days` derniers jours, jours sans inscription compris"""
+
+    today = timezone.localdate()
+    return [
+        (day, days_counts.get(day.isoformat(), 0))
+        for day in (
+            today - timedelta(days=offset) for offset in range(days - 1, -1, -1)
+        )
+    ]
+
+
+def dashboard_callback(request, context):
+    """Statistiques d'inscription de l'accueil de l'admin (UNFOLD["DASHBOARD_CALLBACK"])"""
+
+    stats = registration_stats()
+    total = stats["total"].get("", 0)
+
+    def share(count):
+        return {"count": count, "percent": round(100 * count / total) if total else 0}
+
+    series = daily_series(stats["day"])
+    chart = {
+        "labels": [day.strftime("%d/%m") for day, _count in series],
+        "datasets": [
+            {
+                "label": _("Registrations"),
+                "data": [count for _day, count in series],
+                "backgroundColor": "#3b82f6",
+            }
+        ],
+    }
+    countries = sorted(country_facets(), key=lambda facet: -facet[2])
+    context["registration_dashboard"] = {
+        "total": total,
+        "today": stats["day"].get(timezone.localdate().isoformat(), 0),
+        "statuses": [
+            {"label": label, **share(stats["status"].get(code, 0))}
+            for code, label in Registration.STATUS_CHOICES
+        ],
+        "flags": [
+            {
+                "label": Registration._meta.get_field(flag).verbose_name,
+                **share(stats["flag"].get(flag, 0)),
+            }
+            for flag in STAT_FLAGS
+        ],
+        "countries": [
+            {"label": name, **share(count)} for _code, name, count in countries[:10]
+        ],
+        "country_count": len(countries),
+        "daily_chart": json.dumps(chart),
+    }
+    if request.user.is_superuser and hasattr(cache, "metrics"):
+        context["cache_metrics"] = cache_metrics()
+    return context
+
+
+def cache_metrics():
+    """Taux de succès, d'échec et de repli du cache de ce worker, en pourcentages"""
+
+    metrics = cache.metrics()
+    for rate in ("hit_rate", "miss_rate", "fallback_rate"):
+        if metrics[rate] is not None:
+            metrics[rate] = round(100 * metrics[rate], 1)
+    return metrics
+
+
+# ========== MODEL HOOKS (see signals.py) ==========
+
+
+def remember_stat_keys(instance):
+    deferred = instance.get_deferred_fields()
+    if deferred & set(STAT_FIELDS):
+        instance._stat_keys = None
+    else:
+        instance._stat_keys = registration_stat_keys(instance)
+
+
+def stats_on_save(instance, created):
+    previous = [] if created else getattr(instance, "_stat_keys", None)
+    current = registration_stat_keys(instance)
+    if previous is None:
+        # Previous values unknown (deferred fields): recount once committed
+        transaction.on_commit(reconcile_registration_stats)
+    else:
+        deltas = Counter(current)
+        deltas.subtract(previous)
+        adjust_stats(deltas)
+    instance._stat_keys = current
+
+
+def stats_on_delete(instance):
+    previous = getattr(instance, "_stat_keys", None)
+    if previous is None:
+        transaction.on_commit(reconcile_registration_stats)
+    else:
+        adjust_stats({key: -1 for key in previous})
@@ -0,0 +1,54 @@
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.contrib.staticfiles import finders
+from django.utils.html import format_html, format_html_join
+
+from landing.assets import ASSET_BUNDLES, SIBLING_FORMATS, VENDOR_FILES
+
+register = template.Library()
+
+
+@register.simple_tag
+def asset_bundle(name):
+    """Balises d'un bundle: le fichier construit par build_static, ou ses sources
+
+    Without STATIC_BUNDLES_ENABLED (development) the sources are linked one by
+    one and the vendor libraries come from their CDN.
+    """
+
+    output, sources = ASSET_BUNDLES[name]
+    if settings.STATIC_BUNDLES_ENABLED:
+        urls = [static(output)]
+    else:
+        urls = [VENDOR_FILES.get(source) or static(source) for source in sources]
+    if output.endswith(".css"):
+        html = '<link rel="stylesheet" href="{}">'
+    else:
+        html = '<script src="{}"></script>'
+    return format_html_join("\n", html, ((url,) for url in urls))
+
+
+@register.simple_tag
+def static_picture(path, alt="", **attrs):
+    """<picture> d'une image statique avec ses copies AVIF/WebP (optimize_assets)
+
+    {% static_picture 'assets/hilton.jpg' alt="Transcorp Hilton Abuja" width="100%" %}
+    """
+
+    attrs.setdefault("loading", "lazy")
+    extra = format_html_join("", ' {}="{}"', attrs.items())
+    img = format_html('<img src="{}" alt="{}"{}>', static(path), alt, extra)
+    stem = path.rsplit(".", 1)[0]
+    sources = [
+        (static(stem + extension), f"image/{extension[1:]}")
+        for extension in reversed(SIBLING_FORMATS)  # AVIF first, then WebP
+        if finders.find(stem + extension)
+    ]
+    if not sources:
+        return img
+    return format_html(
+        "<picture>{}{}</picture>",
+        format_html_join("", '<source srcset="{}" type="{}">', sources),
+        img,
+    )
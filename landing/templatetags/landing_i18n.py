@@ -0,0 +1,38 @@
+from django import template
+from django.utils import translation
+from django.utils.html import format_html, format_html_join
+
+from landing.i18n import absolute_url, language_alternates
+
+register = template.Library()
+
+
+def _page_path(context):
+    # Pre-rendered pages have no request: they are the home page
+    request = context.get("request")
+    return request.path if request is not None else None
+
+
+@register.simple_tag(takes_context=True)
+def alternate_links(context):
+    """<link> canonical et hreflang de la page courante, pour chaque langue"""
+
+    alternates = language_alternates(_page_path(context))
+    current = dict(alternates).get(translation.get_language(), alternates[0][1])
+    return format_html(
+        '<link rel="canonical" href="{}">\n{}\n'
+        '<link rel="alternate" hreflang="x-default" href="{}">',
+        absolute_url(current),
+        format_html_join(
+            "\n",
+            '<link rel="alternate" hreflang="{}" href="{}">',
+            ((code, absolute_url(path)) for code, path in alternates),
+        ),
+        absolute_url("/"),
+    )
+
+
+@register.simple_tag(takes_context=True)
+def page_languages(context):
+    """{% page_languages as languages %}: (code, chemin) de la page courante par langue"""
+    return language_alternates(_page_path(context))
@@ -0,0 +1,46 @@
+from django import template
+from django.utils.html import format_html
+
+from landing.images import srcset, variant_url
+
+register = template.Library()
+
+
+@register.filter
+def variant(fieldfile, size):
+    """{{ speaker.photo|variant:"card" }} -> URL du dérivé WebP"""
+    return variant_url(fieldfile, size)
+
+
+@register.filter(name="srcset")
+def srcset_filter(fieldfile, fmt="webp"):
+    """{{ speaker.photo|srcset }} -> "url 160w, url 480w, ..." """
+    return srcset(fieldfile, fmt)
+
+
+@register.simple_tag
+def responsive_image(fieldfile, alt="", size="card", sizes="100vw", **attrs):
+    """<picture> WebP avec repli JPEG, chargée en différé
+
+    {% responsive_image speaker.photo alt=speaker.full_name sizes="(max-width: 600px) 100vw, 480px" %}
+    """
+
+    if not fieldfile:
+        return ""
+    attrs.setdefault("loading", "lazy")
+    attrs.setdefault("decoding", "async")
+    extra = format_html(
+        "".join(f' {name.replace("_", "-")}="{{}}"' for name in attrs),
+        *attrs.values(),
+    )
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}" alt="{}"{}></picture>',
+        srcset(fieldfile, "webp"),
+        sizes,
+        variant_url(fieldfile, size, "jpeg"),
+        srcset(fieldfile, "jpeg"),
+        sizes,
+        alt,
+        extra,
+    )
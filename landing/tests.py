@@ -1,3 +1,611 @@
-from django.test import TestCase
+import datetime
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from io import BytesIO
+from unittest import mock
+from urllib.parse import urlsplit
 
-# Create your tests here.
+import redis
+from django.contrib.auth.models import Permission, User
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from .cache_backend import ResilientRedisCache
+from .campaigns import send_campaign
+from .exports import EXPORT_STALE_AFTER, claim_next_export_job
+from .images import image_variants, variant_url
+from .mail import (
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_RETRY_BASE,
+    OUTBOX_STALE_AFTER,
+    dispatch_outbox,
+)
+from .models import (
+    FAQ,
+    ExportJob,
+    Newsletter,
+    NewsletterCampaign,
+    OutboxEmail,
+    Registration,
+    Speaker,
+)
+from .prerender import queue_landing_refresh
+from .translation_cache import get_translation_versions
+
+LOCMEM_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+REDIS_SERVER = shutil.which(os.environ.get("REDIS_SERVER", "redis-server"))
+
+
+def create_registration(**kwargs):
+    values = {
+        "fullname": "Ama Mensah",
+        "organization": "Ghana Revenue Authority",
+        "country": "GH",
+        "email": "ama@example.org",
+        "phone": "+233201234567",
+    }
+    values.update(kwargs)
+    return Registration.objects.create(**values)
+
+
+# ========== OUTBOX ==========
+
+
+@override_settings(EMAIL_BACKEND=LOCMEM_BACKEND)
+class OutboxQueueingTests(TestCase):
+    def test_registration_queues_its_confirmation(self):
+        registration = create_registration()
+
+        email = OutboxEmail.objects.get(reference=registration.registration_number)
+        self.assertEqual(email.status, "pending")
+        self.assertEqual(email.to, "ama@example.org")
+        self.assertIn(registration.registration_number, email.subject)
+        # Queued only: nothing leaves before send_outbox runs
+        self.assertEqual(mail.outbox, [])
+
+    def test_rolled_back_registration_queues_nothing(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                create_registration()
+                raise RuntimeError("registration failed")
+
+        self.assertFalse(Registration.objects.exists())
+        self.assertFalse(OutboxEmail.objects.exists())
+
+
+@override_settings(EMAIL_BACKEND=LOCMEM_BACKEND)
+class OutboxDispatchTests(TestCase):
+    def setUp(self):
+        self.registration = create_registration()
+        self.email = OutboxEmail.objects.get()
+
+    def fail_sending(self):
+        return mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=OSError("Connection refused"),
+        )
+
+    def make_due(self):
+        OutboxEmail.objects.filter(pk=self.email.pk).update(
+            next_attempt_at=timezone.now()
+        )
+
+    def test_dispatch_delivers_pending_emails(self):
+        self.assertEqual(dispatch_outbox(), 1)
+
+        self.assertEqual(len(mail.outbox), 1)
+        message = mail.outbox[0]
+        self.assertEqual(message.to, ["ama@example.org"])
+        self.assertIn(self.registration.registration_number, message.subject)
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, "sent")
+        self.assertEqual(self.email.attempts, 1)
+        self.assertIsNotNone(self.email.sent_at)
+
+        # Already sent: a second run has nothing to do
+        self.assertEqual(dispatch_outbox(), 0)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_failed_delivery_is_retried_with_backoff(self):
+        before = timezone.now()
+        with self.fail_sending():
+            self.assertEqual(dispatch_outbox(), 0)
+
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, "pending")
+        self.assertEqual(self.email.attempts, 1)
+        self.assertEqual(self.email.last_error, "Connection refused")
+        first_delay = self.email.next_attempt_at - before
+        self.assertGreaterEqual(first_delay.total_seconds(), OUTBOX_RETRY_BASE)
+
+        # Not due yet: left alone
+        self.assertEqual(dispatch_outbox(), 0)
+        self.assertEqual(mail.outbox, [])
+
+        self.make_due()
+        before = timezone.now()
+        with self.fail_sending():
+            dispatch_outbox()
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.attempts, 2)
+        second_delay = self.email.next_attempt_at - before
+        self.assertGreaterEqual(second_delay.total_seconds(), 2 * OUTBOX_RETRY_BASE)
+
+        self.make_due()
+        self.assertEqual(dispatch_outbox(), 1)
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, "sent")
+        self.assertEqual(self.email.attempts, 3)
+        self.assertEqual(self.email.last_error, "")
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_delivery_gives_up_after_max_attempts(self):
+        for _attempt in range(OUTBOX_MAX_ATTEMPTS):
+            self.make_due()
+            with self.fail_sending():
+                dispatch_outbox()
+
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, "failed")
+        self.assertEqual(self.email.attempts, OUTBOX_MAX_ATTEMPTS)
+
+        self.make_due()
+        self.assertEqual(dispatch_outbox(), 0)
+        self.assertEqual(mail.outbox, [])
+
+    def test_stale_sending_email_is_released(self):
+        # Claimed by a worker that crashed before recording the result
+        OutboxEmail.objects.filter(pk=self.email.pk).update(
+            status="sending",
+            updated_at=timezone.now() - OUTBOX_STALE_AFTER - datetime.timedelta(1),
+        )
+
+        self.assertEqual(dispatch_outbox(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+
+# ========== LANDING REFRESH ==========
+
+
+@mock.patch("landing.prerender.refresh_landing_pages")
+class LandingRefreshQueueTests(TestCase):
+    def test_one_refresh_per_transaction(self, refresh):
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_landing_refresh(groups=["speakers"])
+            queue_landing_refresh(groups=["faq"])
+
+        refresh.assert_called_once_with(["faq", "speakers"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_landing_refresh(groups=["venues"])
+        refresh.assert_called_with(["venues"])
+        self.assertEqual(refresh.call_count, 2)
+
+    def test_refresh_survives_a_rolled_back_savepoint(self, refresh):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    queue_landing_refresh(groups=["speakers"])
+                    raise RuntimeError("speaker rejected")
+            except RuntimeError:
+                pass
+            queue_landing_refresh(groups=["faq"])
+
+        refresh.assert_called_once()
+
+    def test_refresh_after_a_rolled_back_transaction(self, refresh):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                queue_landing_refresh(groups=["speakers"])
+                raise RuntimeError("speaker rejected")
+        refresh.assert_not_called()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_landing_refresh(groups=["faq"])
+        refresh.assert_called_once()
+
+
+# ========== API ==========
+
+
+class ContentPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for number, order in enumerate([0, 0, 0, 1, 1, 0, 2, 1, 0]):
+            self.create_faq(f"Question {number}", order)
+        self.expected = [
+            str(pk)
+            for pk in FAQ.objects.order_by("order", "id").values_list("id", flat=True)
+        ]
+
+    def create_faq(self, question, order):
+        faq = FAQ(order=order)
+        faq.set_current_language("en")
+        faq.question = question
+        faq.answer = "Answer"
+        faq.save()
+        return faq
+
+    def walk(self, url, direction):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            pages.append([item["id"] for item in data["results"]])
+            url = data[direction]
+        return pages, data
+
+    def test_pages_follow_the_display_order_both_ways(self):
+        pages, last = self.walk("/api/v1/faqs/?page_size=2&lang=en", "next")
+        self.assertEqual([pk for page in pages for pk in page], self.expected)
+
+        previous, _first = self.walk(last["previous"], "previous")
+        backwards = [pk for page in reversed(previous) for pk in page] + pages[-1]
+        self.assertEqual(backwards, self.expected)
+
+    def test_rows_sharing_an_order_are_neither_skipped_nor_repeated(self):
+        first = self.client.get("/api/v1/faqs/?page_size=2&lang=en").json()
+        self.create_faq("Added while paging", 0)
+        cache.clear()
+
+        pages, _last = self.walk(first["next"], "next")
+        seen = [item["id"] for item in first["results"]]
+        seen += [pk for page in pages for pk in page]
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertLessEqual(set(self.expected), set(seen))
+
+    def test_malformed_cursor_is_not_found(self):
+        response = self.client.get("/api/v1/faqs/?cursor=cD1bIngiLCAieSJd")
+        self.assertEqual(response.status_code, 404)
+
+
+# ========== TRANSLATION CACHE ==========
+
+
+class TranslationVersionTests(TestCase):
+    def test_editing_one_object_keeps_the_others_cached(self):
+        faqs = []
+        with self.captureOnCommitCallbacks(execute=True):
+            for question in ("Visa?", "Hotel?"):
+                faq = FAQ(order=0)
+                faq.set_current_language("en")
+                faq.question = question
+                faq.answer = "Answer"
+                faq.save()
+                faqs.append(faq)
+        objects = [(FAQ, faq.pk) for faq in faqs]
+        before = get_translation_versions(objects)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            translation = faqs[0].translations.get(language_code="en")
+            translation.question = "Visa on arrival?"
+            translation.save()
+
+        after = get_translation_versions(objects)
+        self.assertNotEqual(after[objects[0]], before[objects[0]])
+        self.assertEqual(after[objects[1]], before[objects[1]])
+        question = FAQ.objects.get(pk=faqs[0].pk).safe_translation_getter("question")
+        self.assertEqual(question, "Visa on arrival?")
+
+
+# ========== EXPORTS ==========
+
+
+class ExportJobClaimTests(TestCase):
+    def test_stale_running_job_is_reclaimed(self):
+        job = ExportJob.objects.create(
+            model_label="landing.registration", status="running", processed_rows=5000
+        )
+        self.assertIsNone(claim_next_export_job())
+
+        # Worker crashed mid-export: no progress since
+        ExportJob.objects.filter(pk=job.pk).update(
+            updated_at=timezone.now() - EXPORT_STALE_AFTER - datetime.timedelta(1)
+        )
+        claimed = claim_next_export_job()
+        self.assertEqual(claimed, job)
+        self.assertEqual(claimed.status, "running")
+        self.assertEqual(claimed.processed_rows, 0)
+
+
+class ExportJobDownloadTests(TestCase):
+    def setUp(self):
+        self.owner = self.create_staff("owner")
+        self.job = ExportJob.objects.create(
+            model_label="landing.registration", status="done", requested_by=self.owner
+        )
+        self.job.file.save("registration.xlsx", ContentFile(b"xlsx"))
+        self.url = reverse("admin:landing_exportjob_download", args=[self.job.pk])
+        self.addCleanup(self.job.file.delete, save=False)
+
+    def create_staff(self, username, *codenames):
+        user = User.objects.create_user(username, password="secret", is_staff=True)
+        user.user_permissions.set(
+            Permission.objects.filter(
+                codename__in=["view_exportjob", "view_registration", *codenames]
+            )
+        )
+        return user
+
+    def download(self, user):
+        self.client.force_login(user)
+        return self.client.get(self.url)
+
+    def test_requester_downloads_the_file(self):
+        response = self.download(self.owner)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"xlsx")
+
+    def test_other_staff_cannot_download(self):
+        self.assertEqual(self.download(self.create_staff("other")).status_code, 403)
+
+    def test_requester_needs_view_permission_on_the_model(self):
+        self.owner.user_permissions.remove(
+            Permission.objects.get(codename="view_registration")
+        )
+        self.assertEqual(self.download(self.owner).status_code, 403)
+
+    def test_superuser_downloads_any_file(self):
+        admin_user = User.objects.create_superuser("admin", password="secret")
+        self.assertEqual(self.download(admin_user).status_code, 200)
+
+
+# ========== IMAGES ==========
+
+
+class ImageVariantTests(SimpleTestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+
+    def save_photo(self, name, color, pillow_format):
+        buffer = BytesIO()
+        Image.new("RGB", (600, 400), color).save(buffer, pillow_format)
+        default_storage.save(name, ContentFile(buffer.getvalue()))
+        return Speaker(photo=name).photo
+
+    def test_originals_differing_by_extension_keep_their_own_variants(self):
+        jpeg = self.save_photo("speakers/jane.jpg", "red", "JPEG")
+        png = self.save_photo("speakers/jane.png", "blue", "PNG")
+
+        self.assertNotEqual(variant_url(jpeg, "card"), variant_url(png, "card"))
+        with default_storage.open(image_variants(png)["card"]["jpeg"]) as file:
+            with Image.open(file) as image:
+                red, _green, blue = image.getpixel((0, 0))
+        self.assertGreater(blue, red)
+
+    def test_broken_original_is_not_reopened(self):
+        default_storage.save("speakers/broken.png", ContentFile(b"not an image"))
+        photo = Speaker(photo="speakers/broken.png").photo
+
+        self.assertEqual(variant_url(photo, "card"), photo.url)
+        with mock.patch("landing.images.Image.open") as image_open:
+            self.assertEqual(variant_url(photo, "card"), photo.url)
+        image_open.assert_not_called()
+
+
+# ========== NEWSLETTER ==========
+
+
+@override_settings(EMAIL_BACKEND=LOCMEM_BACKEND, NEWSLETTER_SEND_RATE=0)
+class NewsletterUnsubscribeTests(TestCase):
+    def setUp(self):
+        self.subscribers = [
+            Newsletter.objects.create(email="ama@example.org", language="en"),
+            Newsletter.objects.create(email="kofi@example.org", language="fr"),
+        ]
+        campaign = NewsletterCampaign(status="sending")
+        for language, subject in (("en", "Hello"), ("fr", "Bonjour")):
+            campaign.set_current_language(language)
+            campaign.subject = subject
+            campaign.body = "<p>News</p>"
+        campaign.save()
+        send_campaign(campaign)
+        self.messages = {message.to[0]: message for message in mail.outbox}
+
+    def unsubscribe_url(self, email):
+        return self.messages[email].extra_headers["List-Unsubscribe"].strip("<>")
+
+    def test_each_message_links_its_own_unsubscribe_url(self):
+        urls = {self.unsubscribe_url(s.email) for s in self.subscribers}
+        self.assertEqual(len(urls), 2)
+        for email, message in self.messages.items():
+            url = self.unsubscribe_url(email)
+            self.assertIn(url, message.body)
+            self.assertIn(url, message.alternatives[0][0])
+            self.assertEqual(
+                message.extra_headers["List-Unsubscribe-Post"],
+                "List-Unsubscribe=One-Click",
+            )
+        self.assertIn("/fr/", self.unsubscribe_url("kofi@example.org"))
+
+    def test_one_click_post_unsubscribes_only_that_subscriber(self):
+        path = urlsplit(self.unsubscribe_url("ama@example.org")).path
+        # Opening the link only asks for confirmation
+        self.assertEqual(self.client.get(path).status_code, 200)
+        self.assertTrue(Newsletter.objects.get(email="ama@example.org").is_active)
+
+        client = Client(enforce_csrf_checks=True)
+        response = client.post(path, {"List-Unsubscribe": "One-Click"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            dict(Newsletter.objects.values_list("email", "is_active")),
+            {"ama@example.org": False, "kofi@example.org": True},
+        )
+
+    def test_tampered_link_is_not_found(self):
+        path = urlsplit(self.unsubscribe_url("ama@example.org")).path
+        tampered = path[:-2] + ("A" if path[-2] != "A" else "B") + "/"
+        self.assertEqual(self.client.post(tampered).status_code, 404)
+        self.assertTrue(Newsletter.objects.get(email="ama@example.org").is_active)
+
+
+# ========== CACHE ==========
+
+
+class LocalRedis:
+    """Serveur redis-server local, arrêté et relancé par les tests"""
+
+    def __init__(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.url = f"redis://127.0.0.1:{self.port}/0"
+        self.process = None
+
+    def start(self):
+        self.process = subprocess.Popen(
+            [
+                REDIS_SERVER,
+                "--port",
+                str(self.port),
+                "--save",
+                "",
+                "--appendonly",
+                "no",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        client = redis.Redis.from_url(self.url)
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                client.ping()
+                return
+            except redis.ConnectionError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+
+    def pause(self):
+        # Still accepts connections but never answers: timeouts, data kept
+        os.kill(self.process.pid, signal.SIGSTOP)
+
+    def resume(self):
+        os.kill(self.process.pid, signal.SIGCONT)
+
+
+@unittest.skipUnless(REDIS_SERVER, "redis-server is not installed")
+class ResilientRedisCacheTests(SimpleTestCase):
+    RETRY_AFTER = 0.2
+
+    def setUp(self):
+        self.server = LocalRedis()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.cache = ResilientRedisCache(
+            self.server.url,
+            {
+                "KEY_PREFIX": "custompact-tests",
+                "OPTIONS": {"socket_connect_timeout": 0.2, "socket_timeout": 0.2},
+                "FAILURE_THRESHOLD": 2,
+                "RETRY_AFTER": self.RETRY_AFTER,
+                "FALLBACK_MAX_ENTRIES": 3,
+            },
+        )
+        self.redis = redis.Redis.from_url(self.server.url)
+
+    def open_circuit(self):
+        for _attempt in range(self.cache.failure_threshold):
+            self.cache.get("probe")
+        self.assertTrue(self.cache.degraded)
+
+    def wait_for_retry(self):
+        time.sleep(self.RETRY_AFTER * 1.5)
+
+    def test_stopped_redis_falls_back_and_recovers(self):
+        self.cache.set("speakers", "cached")
+        self.server.stop()
+
+        self.open_circuit()
+        self.cache.set("program", "during outage")
+        self.assertEqual(self.cache.get("program"), "during outage")
+
+        self.server.start()
+        self.wait_for_retry()
+        self.cache.set("venues", "after outage")
+        self.assertFalse(self.cache.degraded)
+        self.assertIsNotNone(self.redis.get(self.cache.make_key("venues")))
+        self.assertEqual(self.cache.get("venues"), "after outage")
+
+        metrics = self.cache.metrics()
+        self.assertEqual(metrics["circuit"], "closed")
+        self.assertEqual(metrics["circuit_opened"], 1)
+        self.assertEqual(metrics["reconciliations"], 1)
+        self.assertGreater(metrics["fallback_calls"], 0)
+
+    def test_keys_written_during_outage_are_dropped_from_redis(self):
+        self.cache.set("speakers", "before outage")
+        self.cache.set("faq", "untouched")
+        self.server.pause()
+
+        self.open_circuit()
+        self.cache.set("speakers", "during outage")
+        self.assertEqual(self.cache.get("speakers"), "during outage")
+
+        self.server.resume()
+        self.wait_for_retry()
+        # Neither the value from before the outage nor the lost local one
+        self.assertIsNone(self.cache.get("speakers"))
+        self.assertEqual(self.cache.get("faq"), "untouched")
+        self.assertFalse(self.cache.degraded)
+
+    def test_overflow_drops_only_this_cache_keys(self):
+        self.redis.set("other-app:session", "kept")
+        self.cache.set("faq", "before outage")
+        self.server.pause()
+
+        self.open_circuit()
+        for number in range(5):
+            self.cache.set(f"speaker:{number}", number)
+
+        self.server.resume()
+        self.wait_for_retry()
+        self.assertIsNone(self.cache.get("speaker:0"))
+        # Too many keys were written: the whole namespace goes, nothing else
+        self.assertIsNone(self.cache.get("faq"))
+        self.assertEqual(self.redis.get("other-app:session"), b"kept")
+
+    def test_metrics_are_counted_across_threads(self):
+        self.server.stop()
+        self.open_circuit()
+        calls = self.cache.metrics()["calls"]
+
+        def read():
+            for _attempt in range(500):
+                self.cache.get("speakers")
+
+        threads = [threading.Thread(target=read) for _thread in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = self.cache.metrics()
+        self.assertEqual(metrics["calls"], calls + 8 * 500)
+        self.assertEqual(metrics.get("hits", 0) + metrics["misses"], metrics["calls"])
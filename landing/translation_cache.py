@@ -0,0 +1,162 @@
+import logging
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from parler.cache import MISSING, is_missing
+from parler.managers import TranslatableManager, TranslatableQuerySet
+from parler.models import TranslatableModel
+
+logger = logging.getLogger("events")
+
+TRANSLATION_CACHE_PREFIX = "translations"
+TRANSLATION_VERSION_PREFIX = "translations:version"
+TRANSLATION_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def translation_version_key(model, pk):
+    return f"{TRANSLATION_VERSION_PREFIX}:{model._meta.label_lower}:{pk}"
+
+
+def translation_cache_key(model, version, pk):
+    """Clé de cache de toutes les traductions d'un objet, sous sa version"""
+    return f"{TRANSLATION_CACHE_PREFIX}:{model._meta.label_lower}:{version}:{pk}"
+
+
+def get_translation_versions(objects):
+    """Version courante des traductions de chaque (modèle, pk), en un aller-retour"""
+
+    keys = {(model, pk): translation_version_key(model, pk) for model, pk in objects}
+    cached = cache.get_many(keys.values())
+    versions = {}
+    missing = {}
+    for obj, key in keys.items():
+        versions[obj] = cached.get(key)
+        if versions[obj] is None:
+            versions[obj] = missing[key] = time.time_ns()
+    if missing:
+        cache.set_many(missing, None)
+    return versions
+
+
+def bump_translation_versions(objects):
+    """Invalide les traductions en cache des objets (modèle, pk) donnés
+
+    Each object has its own version, so editing one FAQ leaves the others
+    cached. Entries are never deleted: a read that loaded the rows before the
+    change was committed stores them under the previous version, which nobody
+    asks for any more.
+    """
+
+    version = time.time_ns()
+    keys = {
+        translation_version_key(model._meta.concrete_model, pk): version
+        for model, pk in objects
+    }
+    if keys:
+        cache.set_many(keys, None)
+        logger.debug("Cached translations of %s object(s) invalidated", len(keys))
+
+
+def _translation_values(translation):
+    values = {"id": translation.pk}
+    for name in translation.get_translated_fields(include_m2m=False):
+        # Not the search vectors, which are written behind the model's back
+        if translation._meta.get_field(name).editable:
+            values[name] = getattr(translation, name)
+    return values
+
+
+def _is_prefetched(instance):
+    meta = instance._parler_meta.root
+    return meta.rel_name in getattr(instance, "_prefetched_objects_cache", {})
+
+
+def _load_entries(instances, versions):
+    """{clé: {langue: valeurs}} lues en base, une requête par modèle"""
+
+    by_model = defaultdict(list)
+    for instance in instances:
+        by_model[instance._meta.concrete_model].append(instance.pk)
+
+    entries = {}
+    for model, pks in by_model.items():
+        keys = {pk: translation_cache_key(model, versions[model, pk], pk) for pk in pks}
+        for key in keys.values():
+            entries[key] = {}
+        for translation in model._parler_meta.root_model.objects.filter(
+            master_id__in=pks
+        ):
+            key = keys[translation.master_id]
+            entries[key][translation.language_code] = _translation_values(translation)
+    return entries
+
+
+def _fill(instance, entry):
+    # Every language is then known to parler: a missing one goes straight to
+    # the fallback, without a query or a write to parler's own cache
+    meta = instance._parler_meta.root
+    local_cache = instance._translations_cache[meta.model]
+    for language_code, values in entry.items():
+        if not is_missing(local_cache.get(language_code, MISSING)):
+            continue  # Loaded or modified on this instance already
+        translation = meta.model(language_code=language_code, master=instance, **values)
+        translation._state.adding = False
+        translation._state.db = instance._state.db
+        local_cache[language_code] = translation
+    for language_code, _name in settings.LANGUAGES:
+        local_cache.setdefault(language_code, MISSING)
+
+
+def warm_translations(instances):
+    """Charge les traductions d'objets en un get_many, la base complétant les absentes"""
+
+    instances = [
+        instance
+        for instance in instances
+        if instance.pk is not None
+        and not instance._state.adding
+        and not _is_prefetched(instance)
+    ]
+    if not instances:
+        return
+
+    # Read before the translation rows: rows loaded before a change was
+    # committed are stored under the version that change replaces
+    versions = get_translation_versions(
+        {(instance._meta.concrete_model, instance.pk) for instance in instances}
+    )
+    # One object may come several times (a speaker of several sessions)
+    pending = defaultdict(list)
+    for instance in instances:
+        model = instance._meta.concrete_model
+        key = translation_cache_key(model, versions[model, instance.pk], instance.pk)
+        pending[key].append(instance)
+
+    entries = cache.get_many(pending.keys())
+    missing = [pending[key][0] for key in pending if key not in entries]
+    if missing:
+        loaded = _load_entries(missing, versions)
+        cache.set_many(loaded, TRANSLATION_CACHE_TIMEOUT)
+        entries.update(loaded)
+
+    for key, same_object in pending.items():
+        for instance in same_object:
+            _fill(instance, entries[key])
+
+
+class TranslationCacheQuerySet(TranslatableQuerySet):
+    """QuerySet dont les objets reçoivent leurs traductions du cache partagé"""
+
+    def _fetch_all(self):
+        fetched = self._result_cache is not None
+        super()._fetch_all()
+        if not fetched:
+            warm_translations(
+                obj for obj in self._result_cache if isinstance(obj, TranslatableModel)
+            )
+
+
+class TranslationCacheManager(TranslatableManager):
+    _queryset_class = TranslationCacheQuerySet
@@ -0,0 +1,18 @@
+from django.urls import path
+
+from . import views
+
+app_name = "landing"
+
+urlpatterns = [
+    path("", views.index, name="index"),
+    path("search/", views.search, name="search"),
+    path("register/", views.register, name="register"),
+    path("contact/", views.contact, name="contact"),
+    path("newsletter/", views.newsletter, name="newsletter"),
+    path(
+        "newsletter/unsubscribe/<str:token>/",
+        views.newsletter_unsubscribe,
+        name="newsletter_unsubscribe",
+    ),
+]
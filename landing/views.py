@@ -1,3 +1,118 @@
-from django.shortcuts import render
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404, JsonResponse
+from django.middleware.csrf import get_token
+from django.shortcuts import redirect, render
+from django.utils import translation
+from django.views.decorators.cache import cache_control, never_cache
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition, require_GET, require_POST
+from django.views.decorators.vary import vary_on_headers
 
-# Create your views here.
+from .campaigns import unsubscribe_subscriber, unsubscribe_token_subscriber
+from .content import get_landing_last_modified, get_landing_page_context, landing_etag
+from .forms import ContactMessageForm, NewsletterForm, RegistrationForm, SearchForm
+from .i18n import accepted_language
+from .models import EventConfiguration
+from .singletons import get_singleton
+
+
+def _landing_etag(request, *args, **kwargs):
+    return landing_etag()
+
+
+def _landing_last_modified(request, *args, **kwargs):
+    return get_landing_last_modified()
+
+
+# Answers If-None-Match / If-Modified-Since with a 304 before any rendering
+landing_condition = condition(
+    etag_func=_landing_etag, last_modified_func=_landing_last_modified
+)
+
+
+# Answered before any database or cache access; the only redirect that
+# depends on a request header, hence the Vary
+@cache_control(public=True, max_age=settings.PRERENDER_MAX_AGE)
+@vary_on_headers("Accept-Language")
+def language_redirect(request):
+    """Redirige / vers la page d'accueil dans la langue du navigateur"""
+    with translation.override(accepted_language(request)):
+        return redirect("landing:index")
+
+
+# The page embeds no CSRF token and reads no session, so shared caches and
+# reverse proxies may keep it; browsers revalidate it on every visit
+@cache_control(public=True, max_age=0, s_maxage=settings.PRERENDER_MAX_AGE)
+@landing_condition
+def index(request):
+    """Page d'accueil"""
+    return render(request, "index.html", get_landing_page_context())
+
+
+def search(request):
+    """Recherche dans le programme, les intervenants, les lieux et la FAQ"""
+    form = SearchForm(request.GET or None)
+    return render(request, "search.html", {"form": form, "results": form.results()})
+
+
+# ========== FORMS ==========
+# The forms of the cached pages are posted by static/js/forms.js, which asks
+# for a CSRF token just before submitting
+
+
+@never_cache
+@require_GET
+def csrf(request):
+    """Jeton CSRF des formulaires, jamais mis en cache (il pose le cookie csrftoken)"""
+    return JsonResponse({"csrfToken": get_token(request)})
+
+
+def _submit_form(request, form_class):
+    form = form_class(request.POST)
+    if not form.is_valid():
+        return JsonResponse({"errors": form.errors.get_json_data()}, status=400)
+    # A registration commits with its outbox email and counter updates, or not at all
+    with transaction.atomic():
+        form.save()
+    return JsonResponse({"ok": True}, status=201)
+
+
+@never_cache
+@require_POST
+def register(request):
+    """Inscription envoyée depuis la fenêtre d'inscription"""
+    event = get_singleton(EventConfiguration)
+    if event is not None and not event.is_registration_open():
+        error = {"message": "Registration is closed.", "code": "closed"}
+        return JsonResponse({"errors": {"__all__": [error]}}, status=403)
+    return _submit_form(request, RegistrationForm)
+
+
+@never_cache
+@require_POST
+def contact(request):
+    """Message envoyé depuis le formulaire de contact"""
+    return _submit_form(request, ContactMessageForm)
+
+
+@never_cache
+@require_POST
+def newsletter(request):
+    """Abonnement à la newsletter"""
+    return _submit_form(request, NewsletterForm)
+
+
+# Posted by mail clients for one-click unsubscribe (List-Unsubscribe-Post),
+# without a CSRF token; the signed token in the URL is the authorization
+@csrf_exempt
+@never_cache
+def newsletter_unsubscribe(request, token):
+    """Désabonnement depuis le lien d'une campagne: confirmation puis POST"""
+    subscriber_id = unsubscribe_token_subscriber(token)
+    if subscriber_id is None:
+        raise Http404
+    done = request.method == "POST"
+    if done:
+        unsubscribe_subscriber(subscriber_id)
+    return render(request, "newsletter_unsubscribe.html", {"done": done})
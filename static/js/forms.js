@@ -0,0 +1,80 @@
+// Forms of the cached pages (data-async-form): the page carries no CSRF token,
+// one is requested from /csrf/ just before each submission
+(function () {
+    const CSRF_URL = '/csrf/';
+
+    async function csrfToken() {
+        const response = await fetch(CSRF_URL, {
+            credentials: 'same-origin',
+            cache: 'no-store'
+        });
+        return (await response.json()).csrfToken;
+    }
+
+    function clearErrors(form) {
+        form.querySelectorAll('.form-error').forEach(error => error.remove());
+        form.querySelectorAll('.invalid').forEach(field => field.classList.remove('invalid'));
+    }
+
+    function showErrors(form, errors) {
+        Object.entries(errors).forEach(([name, messages]) => {
+            const field = form.elements[name];
+            const error = document.createElement('div');
+            error.className = 'form-error';
+            error.textContent = messages.map(message => message.message).join(' ');
+            if (field && field.insertAdjacentElement) {
+                field.classList.add('invalid');
+                field.insertAdjacentElement('afterend', error);
+            } else {
+                // __all__ or a field missing from the markup
+                form.prepend(error);
+            }
+        });
+    }
+
+    function showSuccess(form) {
+        const message = document.getElementById(form.dataset.success);
+        if (!message) {
+            return;
+        }
+        message.classList.add('show');
+        message.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+        setTimeout(() => message.classList.remove('show'), 5000);
+    }
+
+    async function submit(event) {
+        const form = event.target;
+        event.preventDefault();
+        clearErrors(form);
+        const button = form.querySelector('[type="submit"]');
+        if (button) {
+            button.disabled = true;
+        }
+        try {
+            const response = await fetch(form.action, {
+                method: 'POST',
+                body: new FormData(form),
+                credentials: 'same-origin',
+                headers: { 'X-CSRFToken': await csrfToken() }
+            });
+            if (response.ok) {
+                form.reset();
+                showSuccess(form);
+            } else if (response.status === 400) {
+                showErrors(form, (await response.json()).errors);
+            } else {
+                showErrors(form, { __all__: [{ message: 'An error occurred, please try again.' }] });
+            }
+        } catch (error) {
+            showErrors(form, { __all__: [{ message: 'An error occurred, please try again.' }] });
+        } finally {
+            if (button) {
+                button.disabled = false;
+            }
+        }
+    }
+
+    document.querySelectorAll('form[data-async-form]').forEach(form => {
+        form.addEventListener('submit', submit);
+    });
+})();